@@ -32,6 +32,18 @@ from .exceptions import (
     NHLNotFoundError,
     NHLBadRequestError,
 )
+from .cache import ResponseCache, CacheRule, SeasonCacheRule
+from .disk_cache import DiskCache
+from .cassette import Cassette, CassetteMissError
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter, TokenBucket
+from .batch import BatchResult, gather_bounded, gather_all
+from .live import LiveGamePoller, PlayDiff, ScoreboardEngine, GameChange
+from .crawler import SeasonCrawler, CrawlResult
+from .sync import ReportSync, SyncResult
+from .metrics import MetricsRegistry, RequestEvent
+from .session import NHLSession
+from .sync_client import NHLWebClientSync, NHLStatsClientSync
 from .web_client import NHLWebClient
 from .stats_client import NHLStatsClient  # Uncommented
 
@@ -43,4 +55,29 @@ __all__ = [
     "NHLBadRequestError",
     "NHLWebClient",
     "NHLStatsClient",  # Added
+    "NHLSession",
+    "MetricsRegistry",
+    "RequestEvent",
+    "NHLWebClientSync",
+    "NHLStatsClientSync",
+    "ResponseCache",
+    "CacheRule",
+    "SeasonCacheRule",
+    "DiskCache",
+    "Cassette",
+    "CassetteMissError",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "BatchResult",
+    "gather_bounded",
+    "gather_all",
+    "LiveGamePoller",
+    "PlayDiff",
+    "ScoreboardEngine",
+    "GameChange",
+    "SeasonCrawler",
+    "CrawlResult",
+    "ReportSync",
+    "SyncResult",
 ]
@@ -0,0 +1,21 @@
+"""
+Analytics helpers built on top of the raw API responses.
+"""
+
+from .columnar import (
+    COLUMNS,
+    game_seconds,
+    play_by_play_columns,
+    plays_to_numpy,
+    plays_to_arrow,
+)
+from .shifts import ShiftIndex
+
+__all__ = [
+    "COLUMNS",
+    "game_seconds",
+    "play_by_play_columns",
+    "plays_to_numpy",
+    "plays_to_arrow",
+    "ShiftIndex",
+]
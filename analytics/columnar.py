@@ -0,0 +1,207 @@
+"""
+Columnar export of play-by-play events (plain lists, NumPy arrays or Arrow tables).
+
+NumPy and pyarrow are optional dependencies (`pip install nhlapi-tools[analytics]`)
+and are only imported by the functions that need them.
+"""
+
+import typing as t
+
+from ..utils import parse_clock
+
+if t.TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+# Length of a regulation period in seconds, used to compute elapsed game time
+PERIOD_SECONDS = 20 * 60
+
+PLAYER_ID_FIELDS = (
+    "shooting_player_id",
+    "scoring_player_id",
+    "assist1_player_id",
+    "assist2_player_id",
+    "goalie_in_net_id",
+    "blocking_player_id",
+    "hitting_player_id",
+    "hittee_player_id",
+    "winning_player_id",
+    "losing_player_id",
+    "committed_by_player_id",
+    "drawn_by_player_id",
+    "player_id",
+)
+"""
+Player id columns exported from each play's `details`.
+"""
+
+_DETAIL_KEYS = {
+    "shooting_player_id": "shootingPlayerId",
+    "scoring_player_id": "scoringPlayerId",
+    "assist1_player_id": "assist1PlayerId",
+    "assist2_player_id": "assist2PlayerId",
+    "goalie_in_net_id": "goalieInNetId",
+    "blocking_player_id": "blockingPlayerId",
+    "hitting_player_id": "hittingPlayerId",
+    "hittee_player_id": "hitteePlayerId",
+    "winning_player_id": "winningPlayerId",
+    "losing_player_id": "losingPlayerId",
+    "committed_by_player_id": "committedByPlayerId",
+    "drawn_by_player_id": "drawnByPlayerId",
+    "player_id": "playerId",
+}
+
+INT_COLUMNS = (
+    "game_id",
+    "event_id",
+    "sort_order",
+    "period",
+    "time_in_period",
+    "game_seconds",
+    "type_code",
+)
+FLOAT_COLUMNS = ("x_coord", "y_coord")
+OPTIONAL_INT_COLUMNS = ("event_owner_team_id",) + PLAYER_ID_FIELDS
+STRING_COLUMNS = ("type_desc_key", "zone_code")
+
+COLUMNS = INT_COLUMNS + FLOAT_COLUMNS + OPTIONAL_INT_COLUMNS + STRING_COLUMNS
+"""
+All exported column names, in output order.
+"""
+
+
+def game_seconds(period: int, time_in_period: t.Union[str, int]) -> int:
+    """
+    Converts a period number and elapsed period time to seconds since puck drop.
+
+    Args:
+        period: The period number (1-based).
+        time_in_period: Elapsed time in the period, as "MM:SS" or seconds.
+
+    Returns:
+        Elapsed game time in seconds.
+    """
+    if isinstance(time_in_period, str):
+        time_in_period = parse_clock(time_in_period)
+    return max(period - 1, 0) * PERIOD_SECONDS + time_in_period
+
+
+PlayByPlayPayload = t.Union[t.Dict[str, t.Any], t.Any]
+
+
+def _as_dicts(
+    payloads: t.Union[PlayByPlayPayload, t.Iterable[PlayByPlayPayload]],
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Normalizes one or many play-by-play payloads (dicts or typed models) to dicts."""
+    if isinstance(payloads, dict) or hasattr(payloads, "plays"):
+        payloads = [payloads]
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            from ..models import to_builtins
+
+            payload = to_builtins(payload)
+        yield payload
+
+
+def play_by_play_columns(
+    payloads: t.Union[PlayByPlayPayload, t.Iterable[PlayByPlayPayload]],
+) -> t.Dict[str, t.List[t.Any]]:
+    """
+    Flattens the `plays` of one or many play-by-play payloads into columns.
+
+    Times are converted to seconds: `time_in_period` is the elapsed time in
+    the period and `game_seconds` the elapsed time since puck drop. Missing
+    coordinates, ids and strings are None.
+
+    Args:
+        payloads: A response of Game.get_play_by_play (or a PlayByPlay model),
+                  or an iterable of them for a multi-game table.
+
+    Returns:
+        Mapping of column name (see COLUMNS) to a list of values, one per play.
+    """
+    columns: t.Dict[str, t.List[t.Any]] = {name: [] for name in COLUMNS}
+    for payload in _as_dicts(payloads):
+        game_id = payload.get("id", 0)
+        for play in payload.get("plays", ()):
+            period = (play.get("periodDescriptor") or {}).get("number", 0)
+            in_period = parse_clock(play.get("timeInPeriod") or "00:00")
+            details = play.get("details") or {}
+            columns["game_id"].append(game_id)
+            columns["event_id"].append(play.get("eventId", 0))
+            columns["sort_order"].append(play.get("sortOrder", 0))
+            columns["period"].append(period)
+            columns["time_in_period"].append(in_period)
+            columns["game_seconds"].append(game_seconds(period, in_period))
+            columns["type_code"].append(play.get("typeCode", 0))
+            columns["x_coord"].append(details.get("xCoord"))
+            columns["y_coord"].append(details.get("yCoord"))
+            columns["event_owner_team_id"].append(details.get("eventOwnerTeamId"))
+            for name in PLAYER_ID_FIELDS:
+                columns[name].append(details.get(_DETAIL_KEYS[name]))
+            columns["type_desc_key"].append(play.get("typeDescKey"))
+            columns["zone_code"].append(details.get("zoneCode"))
+    return columns
+
+
+def plays_to_numpy(
+    payloads: t.Union[PlayByPlayPayload, t.Iterable[PlayByPlayPayload]],
+) -> t.Dict[str, "numpy.ndarray"]:
+    """
+    Converts play-by-play events into NumPy column arrays.
+
+    Integer columns are int64 and coordinates float64 with NaN for missing
+    values. Optional ids (team and player columns) are int64 with 0 meaning
+    "not set", since NHL ids are always positive. String columns are object
+    arrays.
+
+    Args:
+        payloads: See play_by_play_columns.
+
+    Returns:
+        Mapping of column name to a 1-D array, all of the same length.
+    """
+    import numpy as np
+
+    columns = play_by_play_columns(payloads)
+    arrays: t.Dict[str, "numpy.ndarray"] = {}
+    for name in INT_COLUMNS:
+        arrays[name] = np.asarray(columns[name], dtype=np.int64)
+    for name in FLOAT_COLUMNS:
+        arrays[name] = np.asarray(
+            [np.nan if v is None else v for v in columns[name]], dtype=np.float64
+        )
+    for name in OPTIONAL_INT_COLUMNS:
+        arrays[name] = np.asarray(
+            [0 if v is None else v for v in columns[name]], dtype=np.int64
+        )
+    for name in STRING_COLUMNS:
+        arrays[name] = np.asarray(columns[name], dtype=object)
+    return arrays
+
+
+def plays_to_arrow(
+    payloads: t.Union[PlayByPlayPayload, t.Iterable[PlayByPlayPayload]],
+) -> "pyarrow.Table":
+    """
+    Converts play-by-play events into a pyarrow Table (missing values are nulls).
+
+    The table converts to pandas/polars without copying numeric columns,
+    e.g. `plays_to_arrow(games).to_pandas()`.
+
+    Args:
+        payloads: See play_by_play_columns.
+
+    Returns:
+        A pyarrow.Table with the columns listed in COLUMNS.
+    """
+    import pyarrow as pa
+
+    columns = play_by_play_columns(payloads)
+    types = {}
+    types.update({name: pa.int64() for name in INT_COLUMNS + OPTIONAL_INT_COLUMNS})
+    types.update({name: pa.float64() for name in FLOAT_COLUMNS})
+    types.update({name: pa.string() for name in STRING_COLUMNS})
+    return pa.table(
+        {name: pa.array(columns[name], type=types[name]) for name in COLUMNS}
+    )
@@ -0,0 +1,185 @@
+"""
+Interval index over shift charts for "who was on the ice" lookups.
+"""
+
+import bisect
+import typing as t
+
+from ..utils import parse_clock
+from .columnar import PlayByPlayPayload, _as_dicts, game_seconds
+
+# Shift chart rows with this typeCode are shifts; other rows (e.g., 505) describe goals
+SHIFT_TYPE_CODE = 517
+
+END_INCLUSIVE_EVENTS = frozenset(
+    {"goal", "penalty", "delayed-penalty", "stoppage", "period-end", "game-end"}
+)
+"""
+Play types that end shifts at their timestamp. For these, players whose shift
+ends at the event time are counted as on ice and players whose shift starts at
+that time are not (e.g., the line that conceded a goal, not the next line).
+"""
+
+
+class ShiftIndex:
+    """
+    Sorted-array interval index built from a game's shift charts.
+
+    All shift boundaries are sorted once and the set of players on ice is
+    precomputed for every interval between two consecutive boundaries (a
+    sweep over the shifts). A lookup is then a binary search, O(log n), and
+    annotating every event of a game costs O(events * log shifts) instead of
+    scanning all shifts for every event.
+
+    Usage:
+        >>> charts = await stats_client.misc.get_shift_charts(2023020204)
+        >>> pbp = await web_client.game.get_play_by_play(2023020204)
+        >>> index = ShiftIndex.from_shift_charts(charts)
+        >>> index.on_ice_at(period=2, time_in_period="05:17")
+        frozenset({8477934, ...})
+        >>> rows = index.join_plays(pbp)
+    """
+
+    def __init__(self, shifts: t.Iterable[t.Tuple[int, int, int, int]]):
+        """
+        Args:
+            shifts: Tuples of (player_id, team_id, start, end) with start and
+                    end in elapsed game seconds. Empty shifts are ignored.
+        """
+        self.team_of: t.Dict[int, int] = {}
+        deltas: t.Dict[int, t.List[t.Tuple[int, int]]] = {}
+        for player_id, team_id, start, end in shifts:
+            if end <= start:
+                continue
+            self.team_of[player_id] = team_id
+            deltas.setdefault(start, []).append((player_id, 1))
+            deltas.setdefault(end, []).append((player_id, -1))
+
+        self._times: t.List[int] = sorted(deltas)
+        self._on_ice: t.List[t.FrozenSet[int]] = []
+        active: t.Dict[int, int] = {}  # player -> number of open shifts
+        for time in self._times:
+            for player_id, delta in deltas[time]:
+                count = active.get(player_id, 0) + delta
+                if count > 0:
+                    active[player_id] = count
+                else:
+                    active.pop(player_id, None)
+            self._on_ice.append(frozenset(active))
+
+    @classmethod
+    def from_shift_charts(cls, payload: t.Any) -> "ShiftIndex":
+        """
+        Builds an index from a StatsMisc.get_shift_charts response (or the
+        ShiftCharts model returned by get_shift_charts_typed).
+        """
+        if isinstance(payload, dict):
+            rows = payload.get("data", [])
+        else:
+            from ..models import to_builtins
+
+            rows = to_builtins(payload).get("data", [])
+
+        def shifts() -> t.Iterator[t.Tuple[int, int, int, int]]:
+            for row in rows:
+                if row.get("typeCode", SHIFT_TYPE_CODE) != SHIFT_TYPE_CODE:
+                    continue
+                if not row.get("startTime") or not row.get("endTime"):
+                    continue
+                period = row.get("period", 1)
+                yield (
+                    row["playerId"],
+                    row["teamId"],
+                    game_seconds(period, parse_clock(row["startTime"])),
+                    game_seconds(period, parse_clock(row["endTime"])),
+                )
+
+        return cls(shifts())
+
+    def __len__(self) -> int:
+        """Returns the number of distinct intervals in the index."""
+        return len(self._times)
+
+    def on_ice(self, seconds: int, inclusive_end: bool = False) -> t.FrozenSet[int]:
+        """
+        Returns the players on ice at an elapsed game time.
+
+        Args:
+            seconds: Elapsed game seconds (see analytics.columnar.game_seconds).
+            inclusive_end: If False, shifts are treated as [start, end) (players
+                           coming on at `seconds` count); if True as
+                           (start, end] (players going off at `seconds` count).
+
+        Returns:
+            The player ids on ice (both teams, goalies included).
+        """
+        if inclusive_end:
+            index = bisect.bisect_left(self._times, seconds) - 1
+        else:
+            index = bisect.bisect_right(self._times, seconds) - 1
+        if index < 0:
+            return frozenset()
+        return self._on_ice[index]
+
+    def on_ice_at(
+        self,
+        period: int,
+        time_in_period: t.Union[str, int],
+        inclusive_end: bool = False,
+    ) -> t.FrozenSet[int]:
+        """Like on_ice, but takes a period and "MM:SS" (or seconds) into the period."""
+        return self.on_ice(game_seconds(period, time_in_period), inclusive_end)
+
+    def by_team(self, players: t.Iterable[int]) -> t.Dict[int, t.List[int]]:
+        """Groups player ids by team id (ids sorted for stable output)."""
+        teams: t.Dict[int, t.List[int]] = {}
+        for player_id in sorted(players):
+            teams.setdefault(self.team_of.get(player_id, 0), []).append(player_id)
+        return teams
+
+    def join_plays(
+        self, payload: PlayByPlayPayload, skaters_only: bool = False
+    ) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Attaches the on-ice players to every event of a play-by-play payload.
+
+        Goals, penalties and stoppages use (start, end] shifts, all other
+        events [start, end) (see END_INCLUSIVE_EVENTS).
+
+        Args:
+            payload: A Game.get_play_by_play response (or PlayByPlay model).
+            skaters_only: Leave out goalies (positionCode "G" in the payload's
+                          `rosterSpots`).
+
+        Returns:
+            One dict per play with `eventId`, `sortOrder`, `typeDescKey`,
+            `gameSeconds` and `onIce` (team id -> sorted player ids).
+        """
+        rows = []
+        for game in _as_dicts(payload):
+            goalies = (
+                {
+                    spot.get("playerId")
+                    for spot in game.get("rosterSpots", ())
+                    if spot.get("positionCode") == "G"
+                }
+                if skaters_only
+                else set()
+            )
+            for play in game.get("plays", ()):
+                period = (play.get("periodDescriptor") or {}).get("number", 0)
+                seconds = game_seconds(period, play.get("timeInPeriod") or "00:00")
+                type_key = play.get("typeDescKey")
+                players = self.on_ice(seconds, type_key in END_INCLUSIVE_EVENTS)
+                if goalies:
+                    players = players - goalies
+                rows.append(
+                    {
+                        "eventId": play.get("eventId"),
+                        "sortOrder": play.get("sortOrder"),
+                        "typeDescKey": type_key,
+                        "gameSeconds": seconds,
+                        "onIce": self.by_team(players),
+                    }
+                )
+        return rows
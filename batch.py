@@ -0,0 +1,141 @@
+"""
+Bounded-concurrency batch execution of endpoint calls.
+"""
+
+import asyncio
+import typing as t
+
+from .config import DEFAULT_BATCH_CONCURRENCY
+
+T = t.TypeVar("T")
+
+# A batch item: a zero-argument callable returning an awaitable
+# (e.g., `lambda: client.game.get_boxscore(game_id)`) or an awaitable itself.
+BatchCall = t.Union[t.Callable[[], t.Awaitable[T]], t.Awaitable[T]]
+
+
+class BatchResult(t.Generic[T]):
+    """The outcome of one call in a batch."""
+
+    __slots__ = ("index", "value", "error")
+
+    def __init__(
+        self,
+        index: int,
+        value: t.Optional[T] = None,
+        error: t.Optional[BaseException] = None,
+    ):
+        self.index = index  # Position of the call in the input
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the call completed without raising."""
+        return self.error is None
+
+    def result(self) -> T:
+        """Returns the value, re-raising the call's exception if it failed."""
+        if self.error is not None:
+            raise self.error
+        return t.cast(T, self.value)
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult(index={self.index}, error={self.error!r})"
+        return f"BatchResult(index={self.index}, ok)"
+
+
+async def _run(index: int, call: BatchCall[T]) -> BatchResult[T]:
+    try:
+        awaitable = call() if callable(call) else call
+        return BatchResult(index, value=await awaitable)
+    except Exception as e:  # Collected per item instead of failing the batch
+        return BatchResult(index, error=e)
+
+
+async def gather_bounded(
+    calls: t.Iterable[BatchCall[T]],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = False,
+) -> t.AsyncIterator[BatchResult[T]]:
+    """
+    Runs many endpoint calls with at most `concurrency` in flight at once.
+
+    Calls are started lazily from `calls` as earlier ones finish, so the
+    input may be a generator over thousands of items. Exceptions raised by a
+    call are captured in its BatchResult rather than aborting the batch.
+    Leaving the loop early cancels the calls still in flight.
+
+    Args:
+        calls: Zero-argument callables returning awaitables (preferred, so
+               work is only created when a slot is free) or awaitables.
+        concurrency: Maximum number of calls running at the same time.
+        ordered: If True, results are yielded in input order; otherwise in
+                 completion order.
+
+    Yields:
+        BatchResult objects carrying the input index and value or error.
+
+    Usage:
+        >>> calls = [lambda g=g: client.game.get_boxscore(g) for g in game_ids]
+        >>> async for item in gather_bounded(calls, concurrency=16):
+        ...     if item.ok:
+        ...         process(item.value)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending: t.Set["asyncio.Future[BatchResult[T]]"] = set()
+    buffered: t.Dict[int, BatchResult[T]] = {}
+    next_index = 0
+    iterator = iter(enumerate(calls))
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    index, call = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run(index, call)))
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                result = task.result()
+                if ordered:
+                    buffered[result.index] = result
+                else:
+                    yield result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def gather_all(
+    calls: t.Iterable[BatchCall[T]],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> t.List[BatchResult[T]]:
+    """
+    Runs a batch with bounded concurrency and returns all results in input order.
+
+    Args:
+        calls: See gather_bounded.
+        concurrency: Maximum number of calls running at the same time.
+
+    Returns:
+        A list of BatchResult objects, one per input call.
+    """
+    return [
+        result
+        async for result in gather_bounded(calls, concurrency=concurrency, ordered=True)
+    ]
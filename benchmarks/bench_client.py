@@ -0,0 +1,222 @@
+"""
+Offline client benchmark suite: single calls, batch fetches, paginated stats
+pulls and one call per endpoint route, served by MockNHLAPI (no network).
+
+Reports requests per second, p50/p99 latency of HttpClient.get (from
+RequestEvents) and peak traced memory (measured in a separate pass under
+tracemalloc, which slows code down). Save results with `--json` and compare
+releases with `--compare`. With `--cassette`, responses are replayed from a
+cassette file (see nhl_api.cassette) instead of served by the mock.
+
+Usage:
+    python benchmarks/bench_client.py [--requests 500] [--concurrency 32]
+    python benchmarks/bench_client.py --json results-0.1.2.json
+    python benchmarks/bench_client.py --compare results-0.1.2.json
+    python benchmarks/bench_client.py --cassette /tmp/bench.cassette
+"""
+
+import argparse
+import asyncio
+import importlib.metadata
+import inspect
+import json
+import statistics
+import time
+import tracemalloc
+import typing as t
+
+from nhl_api import Cassette, NHLStatsClient, NHLWebClient
+from nhl_api.metrics import RequestEvent
+from nhl_api.stats.base import StatsEndpointCategory
+from nhl_api.web.base import WebEndpointCategory
+
+from mock_api import MockNHLAPI
+
+GAME_IDS = [2023020200 + i for i in range(1, 41)]
+
+# Arguments of the endpoint methods, by parameter name (see scenario_routes)
+ROUTE_ARGS: t.Dict[str, t.Any] = {
+    "game_id": 2023020204,
+    "player_id": 8477934,
+    "team_id": 10,
+    "team_tricode": "TOR",
+    "season": 20232024,
+    "season_year": 2023,
+    "year": 2024,
+    "game_type": 2,
+    "date": "2024-01-15",
+    "month": "2024-01",
+    "event_id": 1,
+    "series_letter": "A",
+    "prospect_category": 1,
+    "country_code": "US",
+    "postal_code": "10001",
+    "report": "summary",
+    "cayenne_exp": "seasonId=20232024",
+    "attribute": "points",
+    "template_key": "overview",
+}
+
+Scenario = t.Callable[
+    [NHLWebClient, NHLStatsClient, argparse.Namespace], t.Awaitable[int]
+]
+
+
+async def scenario_single(web, stats, args) -> int:
+    """Sequential play-by-play calls, one at a time."""
+    for i in range(args.requests):
+        await web.game.get_play_by_play(GAME_IDS[i % len(GAME_IDS)])
+    return args.requests
+
+
+async def scenario_batch(web, stats, args) -> int:
+    """Boxscores fetched concurrently with client.batch."""
+    calls = [
+        lambda i=i: web.game.get_boxscore(2023020000 + i) for i in range(args.requests)
+    ]
+    async for result in web.batch(calls, concurrency=args.concurrency):
+        if result.error is not None:
+            raise result.error
+    return args.requests
+
+
+async def scenario_paginate(web, stats, args) -> int:
+    """A skater report streamed page by page with iter_skater_stats."""
+    rows = 0
+    async for _ in stats.players.iter_skater_stats(
+        "summary", "seasonId=20232024", sort="playerId", page_size=args.page_size
+    ):
+        rows += 1
+    return rows
+
+
+async def scenario_routes(web, stats, args) -> int:
+    """Every public endpoint method of both clients, called once."""
+    calls = 0
+    for client in (web, stats):
+        for category in vars(client).values():
+            if not isinstance(category, (WebEndpointCategory, StatsEndpointCategory)):
+                continue
+            for name, method in inspect.getmembers(
+                category, inspect.iscoroutinefunction
+            ):
+                if name.startswith("_") or name.endswith("_typed"):
+                    continue
+                kwargs = _route_kwargs(method)
+                if kwargs is not None:
+                    await method(**kwargs)
+                    calls += 1
+    return calls
+
+
+def _route_kwargs(method: t.Callable[..., t.Any]) -> t.Optional[t.Dict[str, t.Any]]:
+    """Returns arguments for the required parameters, None if one is unknown."""
+    kwargs = {}
+    for parameter in inspect.signature(method).parameters.values():
+        if parameter.default is not inspect.Parameter.empty:
+            continue
+        if parameter.name not in ROUTE_ARGS:
+            return None
+        kwargs[parameter.name] = ROUTE_ARGS[parameter.name]
+    return kwargs
+
+
+SCENARIOS: t.Dict[str, Scenario] = {
+    "single": scenario_single,
+    "batch": scenario_batch,
+    "paginate": scenario_paginate,
+    "routes": scenario_routes,
+}
+
+
+async def run_scenario(
+    scenario: Scenario, args: argparse.Namespace, trace_memory: bool = False
+) -> t.Dict[str, float]:
+    """Runs a scenario against a fresh MockNHLAPI and returns its measurements."""
+    api = MockNHLAPI(report_rows=args.report_rows)
+    events: t.List[RequestEvent] = []
+    options = dict(transport=api.transport(), hooks=[events.append])
+    if args.cassette:
+        # Recorded from the mock by the warm-up pass, replayed by the measured one
+        options["cassette"] = cassette = Cassette(args.cassette, mode="append")
+    async with NHLWebClient(**options) as web, NHLStatsClient(**options) as stats:
+        await scenario(web, stats, args)  # Warm up (fixtures, connections)
+        events.clear()
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        items = await scenario(web, stats, args)
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    if args.cassette:
+        cassette.close()
+    requests = len(events)
+    latencies = sorted(event.elapsed for event in events)
+    return {
+        "requests": requests,
+        "items": items,
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def version() -> str:
+    try:
+        return importlib.metadata.version("nhlapi-tools")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--report-rows", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS))
+    parser.add_argument(
+        "--cassette", help="Replay responses from this cassette (recorded if new)"
+    )
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--compare", help="Results file of an earlier run")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        result = asyncio.run(run_scenario(scenario, args))
+        memory = asyncio.run(run_scenario(scenario, args, trace_memory=True))
+        result["peak_kib"] = memory["peak_kib"]
+        results[name] = result
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    source = f"cassette {args.cassette}" if args.cassette else "MockNHLAPI"
+    print(f"nhlapi-tools {version()}, offline ({source})\n")
+    header = f"{'scenario':>9} {'requests':>8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'peak KiB':>9}"
+    print(header + ("  vs baseline" if baseline else ""))
+    for name, r in results.items():
+        line = (
+            f"{name:>9} {r['requests']:>8} {r['rps']:9.0f} {r['p50_ms']:8.3f} "
+            f"{r['p99_ms']:8.3f} {r['peak_kib']:9.0f}"
+        )
+        if name in baseline:
+            line += f"  {r['rps'] / baseline[name]['rps']:5.2f}x req/s"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"version": version(), "results": results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
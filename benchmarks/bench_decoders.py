@@ -0,0 +1,50 @@
+"""
+Compares JSON parse time of the available decoders on play-by-play payloads.
+
+Uses recorded fixtures from `benchmarks/fixtures/` when present
+(see `record_fixtures.py`), synthetic play-by-play payloads otherwise.
+
+Usage:
+    python benchmarks/bench_decoders.py [--repeat 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from nhl_api.decoders import available_decoders, get_decoder
+
+from fixtures import play_by_play_bodies
+
+
+def bench(decoder, bodies, repeat: int) -> float:
+    """Returns the median time in milliseconds to decode all bodies once."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            decoder(body)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    fixtures = play_by_play_bodies()
+    bodies = list(fixtures.values())
+    size_kb = sum(len(body) for body in bodies) / 1024
+    print(f"{len(bodies)} play-by-play payloads, {size_kb:.0f} KiB total")
+    print(f"Sources: {', '.join(fixtures)}\n")
+
+    baseline = None
+    for name in sorted(available_decoders(), key=lambda n: n != "json"):
+        median_ms = bench(get_decoder(name), bodies, args.repeat)
+        baseline = baseline or median_ms
+        print(f"{name:>8}: {median_ms:8.3f} ms  ({baseline / median_ms:4.1f}x vs json)")
+
+
+if __name__ == "__main__":
+    main()
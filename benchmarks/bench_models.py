@@ -0,0 +1,91 @@
+"""
+Compares dictionaries and typed models (nhl_api.models) for play-by-play payloads:
+decode time, retained memory per game and attribute access in an analytics loop.
+
+Usage:
+    python benchmarks/bench_models.py [--repeat 50]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from nhl_api.decoders import get_decoder
+from nhl_api.models import PlayByPlay, decode
+
+from fixtures import play_by_play_bodies
+
+
+def median_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def retained_kib(func) -> float:
+    """Memory still allocated by the objects `func` returns."""
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    bodies = list(play_by_play_bodies().values())
+    decoder = get_decoder()
+    dicts = [decoder(body) for body in bodies]
+    typed = [decode(body, PlayByPlay) for body in bodies]
+
+    def shots_from_dicts():
+        return sum(
+            1
+            for game in dicts
+            for play in game["plays"]
+            if play["typeDescKey"] == "shot-on-goal"
+            and (play.get("details") or {}).get("xCoord", 0) > 25
+        )
+
+    def shots_from_models():
+        return sum(
+            1
+            for game in typed
+            for play in game.plays
+            if play.type_desc_key == "shot-on-goal"
+            and play.details is not None
+            and (play.details.x_coord or 0) > 25
+        )
+
+    assert shots_from_dicts() == shots_from_models()
+    n = len(bodies)
+    rows = [
+        (
+            "dict",
+            median_ms(lambda: [decoder(b) for b in bodies], args.repeat),
+            retained_kib(lambda: [decoder(b) for b in bodies]) / n,
+            median_ms(shots_from_dicts, args.repeat),
+        ),
+        (
+            "model",
+            median_ms(lambda: [decode(b, PlayByPlay) for b in bodies], args.repeat),
+            retained_kib(lambda: [decode(b, PlayByPlay) for b in bodies]) / n,
+            median_ms(shots_from_models, args.repeat),
+        ),
+    ]
+    print(f"{n} play-by-play payloads")
+    print(f"{'':>6} {'decode ms':>10} {'KiB/game':>10} {'scan ms':>10}")
+    for name, decode_ms, kib, scan_ms in rows:
+        print(f"{name:>6} {decode_ms:10.3f} {kib:10.1f} {scan_ms:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Measures requests per second at several concurrency levels, with the client's
+connection pool settings (HTTP/1.1 vs HTTP/2, pool size).
+
+By default a local HTTP/1.1 server serving a play-by-play fixture is started,
+which isolates client overhead and connection handling. Pass `--base-url` to
+measure against a real host (e.g., https://api-web.nhle.com, where HTTP/2 is
+available with `pip install nhlapi-tools[http2]`). Be gentle with real hosts.
+
+Usage:
+    python benchmarks/bench_throughput.py [--requests 500] [--concurrency 1 8 32 128]
+    python benchmarks/bench_throughput.py --base-url https://api-web.nhle.com \\
+        --path /v1/gamecenter/2023020204/play-by-play --requests 100 --http2
+"""
+
+import argparse
+import asyncio
+import http.server
+import threading
+import time
+import typing as t
+
+from nhl_api.http_client import HttpClient, http2_available
+
+from fixtures import play_by_play_bodies
+
+
+class _FixtureHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse is measured
+    body = b"{}"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+def start_local_server(body: bytes) -> str:
+    """Serves `body` for every GET on a background thread; returns the base URL."""
+    _FixtureHandler.body = body
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def run_level(
+    base_url: str,
+    path: str,
+    requests: int,
+    concurrency: int,
+    http2: bool,
+    max_connections: int,
+) -> float:
+    """Returns requests per second for `requests` GETs with `concurrency` in flight."""
+    client = HttpClient(
+        base_url,
+        coalesce=False,
+        http2=http2,
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await client.get(path, params={"n": i})  # Distinct URLs
+
+    async with client:
+        await one(-1)  # Warm up the first connection
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--path", default="/v1/gamecenter/2023020204/play-by-play")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--max-connections", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--http2", action="store_true", help="Also measure HTTP/2")
+    args = parser.parse_args()
+
+    base_url = args.base_url
+    if base_url is None:
+        body = next(iter(play_by_play_bodies(1).values()))
+        base_url = start_local_server(body)
+        print(f"Local server, {len(body) / 1024:.0f} KiB play-by-play body")
+    protocols = [False]
+    if args.http2:
+        if not http2_available():
+            parser.error("--http2 requires the h2 package (nhlapi-tools[http2])")
+        protocols.append(True)
+
+    print(f"{args.requests} requests per level against {base_url}{args.path}\n")
+    print(f"{'protocol':>8} {'pool':>5} {'concurrency':>11} {'req/s':>9}")
+    for http2 in protocols:
+        for max_connections in args.max_connections:
+            for concurrency in args.concurrency:
+                rps = asyncio.run(
+                    run_level(
+                        base_url,
+                        args.path,
+                        args.requests,
+                        concurrency,
+                        http2,
+                        max_connections,
+                    )
+                )
+                protocol = "HTTP/2" if http2 else "HTTP/1.1"
+                print(
+                    f"{protocol:>8} {max_connections:>5} {concurrency:>11} {rps:9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Fixture loading for the benchmarks.
+
+Recorded API responses are read from `benchmarks/fixtures/*.json`
+(see `record_fixtures.py`). When no recordings are available, synthetic
+payloads with the same shape as the real play-by-play and shift chart
+responses are generated so the benchmarks still run offline.
+"""
+
+import json
+import pathlib
+import random
+import typing as t
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+
+EVENT_TYPES = [
+    (502, "faceoff"),
+    (503, "hit"),
+    (504, "giveaway"),
+    (505, "goal"),
+    (506, "shot-on-goal"),
+    (507, "missed-shot"),
+    (508, "blocked-shot"),
+    (509, "penalty"),
+    (516, "stoppage"),
+    (525, "takeaway"),
+]
+
+
+def load_recorded(pattern: str = "*.json") -> t.Dict[str, bytes]:
+    """Returns raw bodies of recorded fixtures keyed by file name."""
+    if not FIXTURES_DIR.is_dir():
+        return {}
+    return {path.name: path.read_bytes() for path in sorted(FIXTURES_DIR.glob(pattern))}
+
+
+def _clock(seconds: int) -> str:
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def synthetic_play_by_play(
+    game_id: int = 2023020204, n_plays: int = 320, seed: int = 0
+) -> t.Dict[str, t.Any]:
+    """Builds a play-by-play payload shaped like /v1/gamecenter/{id}/play-by-play."""
+    rng = random.Random(seed)
+    home_ids = [8470000 + i for i in range(20)]
+    away_ids = [8480000 + i for i in range(20)]
+    plays = []
+    for order, elapsed in enumerate(sorted(rng.sample(range(3 * 1200), n_plays))):
+        period, in_period = divmod(elapsed, 1200)
+        type_code, type_key = rng.choice(EVENT_TYPES)
+        team_id, skaters = rng.choice([(10, home_ids), (6, away_ids)])
+        plays.append(
+            {
+                "eventId": 100 + order,
+                "periodDescriptor": {
+                    "number": period + 1,
+                    "periodType": "REG",
+                    "maxRegulationPeriods": 3,
+                },
+                "timeInPeriod": _clock(in_period),
+                "timeRemaining": _clock(1200 - in_period),
+                "situationCode": "1551",
+                "homeTeamDefendingSide": "left" if period % 2 else "right",
+                "typeCode": type_code,
+                "typeDescKey": type_key,
+                "sortOrder": order,
+                "details": {
+                    "xCoord": rng.randint(-99, 99),
+                    "yCoord": rng.randint(-42, 42),
+                    "zoneCode": rng.choice("ODN"),
+                    "eventOwnerTeamId": team_id,
+                    "shootingPlayerId": rng.choice(skaters),
+                    "goalieInNetId": 8479000 if team_id == 6 else 8479001,
+                    "shotType": rng.choice(["wrist", "slap", "snap", "backhand"]),
+                },
+            }
+        )
+    return {
+        "id": game_id,
+        "season": 20232024,
+        "gameType": 2,
+        "gameDate": "2023-11-10",
+        "gameState": "OFF",
+        "periodDescriptor": {"number": 3, "periodType": "REG"},
+        "awayTeam": {"id": 6, "abbrev": "BOS", "score": 2, "sog": 29},
+        "homeTeam": {"id": 10, "abbrev": "TOR", "score": 3, "sog": 31},
+        "clock": {"timeRemaining": "00:00", "running": False, "inIntermission": False},
+        "plays": plays,
+        "rosterSpots": [
+            {
+                "teamId": 10 if pid in home_ids else 6,
+                "playerId": pid,
+                "firstName": {"default": f"First{pid}"},
+                "lastName": {"default": f"Last{pid}"},
+                "sweaterNumber": pid % 100,
+                "positionCode": rng.choice("CLRD"),
+            }
+            for pid in home_ids + away_ids
+        ],
+    }
+
+
+def synthetic_shift_charts(
+    game_id: int = 2023020204, shifts_per_player: int = 22, seed: int = 0
+) -> t.Dict[str, t.Any]:
+    """Builds a shift chart payload shaped like /{lang}/shiftcharts?cayenneExp=gameId=..."""
+    rng = random.Random(seed)
+    rows = []
+    for team_id, abbrev, base in ((10, "TOR", 8470000), (6, "BOS", 8480000)):
+        for player_id in range(base, base + 18):
+            start = rng.randint(0, 60)
+            for shift_number in range(1, shifts_per_player + 1):
+                duration = rng.randint(30, 60)
+                period, in_period = divmod(start, 1200)
+                if period > 2:
+                    break
+                end = min(in_period + duration, 1200)
+                rows.append(
+                    {
+                        "id": len(rows) + 1,
+                        "gameId": game_id,
+                        "playerId": player_id,
+                        "teamId": team_id,
+                        "teamAbbrev": abbrev,
+                        "period": period + 1,
+                        "shiftNumber": shift_number,
+                        "startTime": _clock(in_period),
+                        "endTime": _clock(end),
+                        "duration": _clock(end - in_period),
+                        "typeCode": 517,
+                    }
+                )
+                start += duration + rng.randint(60, 120)
+    return {"data": rows, "total": len(rows)}
+
+
+def play_by_play_bodies(count: int = 5) -> t.Dict[str, bytes]:
+    """Returns recorded play-by-play bodies, or synthetic ones if none are recorded."""
+    recorded = load_recorded("*play-by-play*.json")
+    if recorded:
+        return recorded
+    return {
+        f"synthetic-{seed}-play-by-play.json": json.dumps(
+            synthetic_play_by_play(2023020200 + seed, seed=seed)
+        ).encode()
+        for seed in range(count)
+    }
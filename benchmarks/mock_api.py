@@ -0,0 +1,130 @@
+"""
+An offline stand-in for both NHL APIs, served through httpx.MockTransport.
+
+Every route answers 200 with a fixture: recorded bodies from
+`benchmarks/fixtures/` when available (see `record_fixtures.py`), synthetic
+payloads of the same shape otherwise. Stats report routes
+(`/{lang}/skater|goalie|team/{report}`) honour `start`/`limit` and report a
+`total`, so paginated pulls page through a fixed number of rows.
+"""
+
+import asyncio
+import collections
+import json
+import random
+import re
+import typing as t
+
+import httpx
+
+from nhl_api.metrics import route_template
+
+from fixtures import (
+    load_recorded,
+    play_by_play_bodies,
+    synthetic_play_by_play,
+    synthetic_shift_charts,
+)
+
+_REPORT_ROUTE = re.compile(r"^/stats/rest/\w+/(skater|goalie|team)/\w+$")
+_GAMECENTER_ROUTE = re.compile(r"/gamecenter/(\d+)/")
+
+
+def synthetic_report_rows(
+    kind: str, count: int, seed: int = 0
+) -> t.List[t.Dict[str, t.Any]]:
+    """Builds stats report rows shaped like /{lang}/skater/summary (or goalie/team)."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        goals, assists = rng.randint(0, 50), rng.randint(0, 70)
+        row: t.Dict[str, t.Any] = {
+            "seasonId": 20232024,
+            "gamesPlayed": rng.randint(1, 82),
+            "goals": goals,
+            "assists": assists,
+            "points": goals + assists,
+            "plusMinus": rng.randint(-30, 30),
+            "penaltyMinutes": rng.randint(0, 120),
+            "timeOnIcePerGame": rng.uniform(300, 1500),
+        }
+        if kind == "team":
+            row.update(teamId=index + 1, teamFullName=f"Team {index + 1}")
+        else:
+            row.update(playerId=8470000 + index, skaterFullName=f"Player {index}")
+            row["goalieFullName" if kind == "goalie" else "positionCode"] = "C"
+        rows.append(row)
+    return rows
+
+
+class MockNHLAPI:
+    """
+    Serves fixtures for every api-web.nhle.com and api.nhle.com/stats/rest route.
+
+    Usage:
+        >>> api = MockNHLAPI(report_rows=5000)
+        >>> async with NHLWebClient(transport=api.transport()) as client:
+        ...     await client.game.get_play_by_play(2023020204)
+        >>> api.requests["/v1/gamecenter/{id}/play-by-play"]
+        1
+    """
+
+    def __init__(self, report_rows: int = 5000, latency: float = 0.0):
+        """
+        Args:
+            report_rows: Total rows of every stats report.
+            latency: Simulated server time in seconds per request.
+        """
+        self.report_rows = report_rows
+        self.latency = latency
+        self.requests: t.Counter[str] = collections.Counter()  # Per route template
+        self._play_by_play = list(play_by_play_bodies().values())
+        self._boxscores = list(load_recorded("*boxscore*.json").values())
+        self._reports: t.Dict[str, t.List[t.Dict[str, t.Any]]] = {}
+        self._bodies: t.Dict[str, bytes] = {}  # Encoded once, by URL
+
+    def transport(self) -> httpx.MockTransport:
+        """Returns a transport for the `transport=` argument of the clients."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        route = route_template(request.url.path)
+        self.requests[route] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        url = str(request.url)
+        body = self._bodies.get(url)
+        if body is None:
+            body = self._bodies[url] = self._body(request, route)
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    def _body(self, request: httpx.Request, route: str) -> bytes:
+        path = request.url.path
+        match = _GAMECENTER_ROUTE.search(path)
+        game_id = int(match.group(1)) if match else 2023020204
+        if route.endswith("/play-by-play"):
+            return self._play_by_play[game_id % len(self._play_by_play)]
+        if route.endswith("/boxscore"):
+            if self._boxscores:
+                return self._boxscores[game_id % len(self._boxscores)]
+            payload = synthetic_play_by_play(game_id, seed=game_id)
+            del payload["plays"], payload["rosterSpots"]
+            return json.dumps(payload).encode()
+        if route.endswith("/shiftcharts"):
+            return json.dumps(synthetic_shift_charts(game_id)).encode()
+        if _REPORT_ROUTE.match(path):
+            kind = path.split("/")[-2]
+            rows = self._reports.get(kind)
+            if rows is None:
+                rows = self._reports[kind] = synthetic_report_rows(
+                    kind, self.report_rows
+                )
+            start = int(request.url.params.get("start", 0))
+            limit = int(request.url.params.get("limit", len(rows)))
+            if limit < 0:
+                limit = len(rows)
+            page = rows[start : start + limit]
+            return json.dumps({"data": page, "total": len(rows)}).encode()
+        return json.dumps({"route": route, "data": []}).encode()
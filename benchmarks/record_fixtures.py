@@ -0,0 +1,42 @@
+"""
+Records live API responses into `benchmarks/fixtures/` for offline benchmarks.
+
+Usage:
+    python benchmarks/record_fixtures.py 2023020204 2023020205
+"""
+
+import argparse
+import asyncio
+import json
+
+from nhl_api import NHLStatsClient, NHLWebClient
+
+from fixtures import FIXTURES_DIR
+
+
+async def record(game_ids, include_shifts: bool) -> None:
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    async with NHLWebClient() as web, NHLStatsClient() as stats:
+        for game_id in game_ids:
+            fetches = {
+                "play-by-play": web.game.get_play_by_play(game_id),
+                "boxscore": web.game.get_boxscore(game_id),
+            }
+            if include_shifts:
+                fetches["shiftcharts"] = stats.misc.get_shift_charts(game_id)
+            for name, fetch in fetches.items():
+                path = FIXTURES_DIR / f"{game_id}-{name}.json"
+                path.write_text(json.dumps(await fetch))
+                print(f"Recorded {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("game_ids", nargs="+", type=int)
+    parser.add_argument("--no-shifts", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(record(args.game_ids, include_shifts=not args.no_shifts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+In-memory response caching for the NHL API Wrapper.
+"""
+
+import collections
+import datetime
+import math
+import re
+import time
+import typing as t
+
+from .config import DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTL
+
+# TTL value meaning "never expires" (e.g., boxscores of finished games)
+FOREVER = math.inf
+
+# Game states reported by the Web API once a game is over
+FINAL_GAME_STATES = ("FINAL", "OFF")
+
+# (month, day) after which a season's data (and that year's draft) is final
+SEASON_FINAL_AFTER = (7, 1)
+
+TTLSpec = t.Union[float, t.Callable[[t.Any], float]]
+
+
+def _final_game_ttl(live_ttl: float) -> t.Callable[[t.Any], float]:
+    """Builds a TTL callable that caches finished games forever."""
+
+    def ttl(data: t.Any) -> float:
+        if isinstance(data, dict):
+            game_state = data.get("gameState")
+        else:  # Typed models (see nhl_api.models)
+            game_state = getattr(data, "game_state", None)
+        if game_state in FINAL_GAME_STATES:
+            return FOREVER
+        return live_ttl
+
+    return ttl
+
+
+def season_is_over(season: int, today: t.Optional[datetime.date] = None) -> bool:
+    """
+    Returns True once a season (e.g., 20232024) or draft year (e.g., 2023) is over.
+
+    Seasons are considered over after SEASON_FINAL_AFTER of their end year,
+    once the playoffs have finished.
+    """
+    end_year = season % 10000 if season > 9999 else season
+    today = today or datetime.date.today()
+    return today >= datetime.date(end_year, *SEASON_FINAL_AFTER)
+
+
+class CacheRule:
+    """
+    Maps a route pattern to the time-to-live of its responses.
+
+    The TTL can either be a number of seconds or a callable receiving the
+    decoded response and returning the number of seconds, which allows
+    content-aware lifetimes (e.g., finished games never expire).
+    A TTL of 0 (or less) disables caching for the matching routes.
+    """
+
+    def __init__(self, pattern: str, ttl: TTLSpec):
+        """
+        Args:
+            pattern: Regular expression matched against the request path
+                     (relative to the base URL, with a leading slash).
+            ttl: Seconds to keep the response, FOREVER, or a callable
+                 computing the TTL from the decoded response.
+        """
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+
+    def matches(self, path: str) -> bool:
+        """Returns True if this rule applies to the given request path."""
+        return self.pattern.search(path) is not None
+
+    def ttl_for(self, data: t.Any) -> float:
+        """Returns the TTL in seconds for a decoded response."""
+        if callable(self.ttl):
+            return self.ttl(data)
+        return self.ttl
+
+    def resolve(self, path: str, data: t.Any) -> float:
+        """Returns the TTL in seconds for a decoded response of a matching path."""
+        return self.ttl_for(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.pattern.pattern!r}, {self.ttl!r})"
+
+
+class SeasonCacheRule(CacheRule):
+    """
+    A CacheRule for routes addressing a season (or draft year) in their path.
+
+    Responses for seasons that are over never change and are kept FOREVER;
+    the current season uses `ttl`. The pattern must capture the season in a
+    group named `season`.
+    """
+
+    def resolve(self, path: str, data: t.Any) -> float:
+        match = self.pattern.search(path)
+        if match is not None and season_is_over(int(match.group("season"))):
+            return FOREVER
+        return self.ttl_for(data)
+
+
+DEFAULT_CACHE_RULES = [
+    # Live scores change constantly
+    CacheRule(r"^/v1/(score|scoreboard)/now$", 5.0),
+    # Gamecenter data is frozen once the game is final
+    CacheRule(
+        r"^/v1/gamecenter/\d+/(boxscore|play-by-play|landing|right-rail)$",
+        _final_game_ttl(10.0),
+    ),
+    CacheRule(r"^/v1/(standings|schedule)/now$", 60.0),
+    CacheRule(r"^/v1/roster/[A-Z]{3}/current$", 600.0),
+]
+"""
+Default per-route TTL rules used by ResponseCache. The first matching rule wins.
+"""
+
+
+class CacheEntry:
+    """A cached response value, its expiry time and HTTP validators."""
+
+    __slots__ = ("value", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        value: t.Any,
+        expires_at: float,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now: t.Optional[float] = None) -> bool:
+        """Returns True if the entry has not expired yet."""
+        if now is None:
+            now = time.monotonic()
+        return now < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """True if the entry has a validator for a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+
+class ResponseCache:
+    """
+    A bounded in-memory response cache with per-route TTLs and LRU eviction.
+
+    Expired entries stored with an `ETag` or `Last-Modified` validator are
+    kept (until evicted) so HttpClient can revalidate them with a conditional
+    request and reuse the value on `304 Not Modified`.
+
+    Pass an instance to HttpClient (or the client facades) via the `cache`
+    argument. Cached values are shared between callers, so treat returned
+    dictionaries as read-only.
+
+    Usage:
+        >>> cache = ResponseCache(max_entries=2048)
+        >>> async with NHLWebClient(cache=cache) as client:
+        ...     await client.teams.get_standings_now()  # network
+        ...     await client.teams.get_standings_now()  # served from cache
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        rules: t.Optional[t.Sequence[CacheRule]] = None,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            max_entries: Maximum number of responses to keep before evicting
+                         the least recently used one.
+            default_ttl: TTL in seconds for routes not matched by any rule.
+            rules: Ordered per-route TTL rules. Defaults to DEFAULT_CACHE_RULES.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.rules = list(DEFAULT_CACHE_RULES if rules is None else rules)
+        self._entries: "collections.OrderedDict[str, CacheEntry]" = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, path: str, data: t.Any) -> float:
+        """
+        Resolves the TTL for a response using the first matching rule.
+
+        Args:
+            path: The request path relative to the base URL.
+            data: The decoded response.
+
+        Returns:
+            TTL in seconds (FOREVER for no expiry, <= 0 for "do not cache").
+        """
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule.resolve(path, data)
+        return self.default_ttl
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """
+        Returns the cached value for a key, or `default` if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if not entry.is_fresh():
+            if not entry.revalidatable:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_stale(self, key: str) -> t.Optional[CacheEntry]:
+        """
+        Returns the entry for a key even if it has expired (None if missing).
+        Used to build conditional requests; does not update the counters.
+        """
+        return self._entries.get(key)
+
+    def set(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: float,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+    ) -> None:
+        """
+        Stores a value for `ttl` seconds, evicting the least recently used
+        entries if the cache is full. Non-positive TTLs are ignored.
+
+        Args:
+            key: The cache key.
+            value: The decoded response.
+            ttl: Seconds to keep the value fresh.
+            etag: Optional `ETag` response header, for revalidation.
+            last_modified: Optional `Last-Modified` response header, for revalidation.
+        """
+        if ttl <= 0:
+            return
+        self._entries[key] = CacheEntry(
+            value, time.monotonic() + ttl, etag, last_modified
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Removes a single entry from the cache, if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> t.Dict[str, int]:
+        """Returns the current size and hit/miss/eviction counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
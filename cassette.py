@@ -0,0 +1,261 @@
+"""
+Record/replay of HTTP responses in compact, memory-mapped cassette files.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import typing as t
+
+import httpx
+
+RECORD = "record"
+REPLAY = "replay"
+APPEND = "append"
+MODES = (RECORD, REPLAY, APPEND)
+
+_MAGIC = b"NHLCAS1\n"
+# Per entry: URL length, status code, headers length, body length
+_ENTRY = struct.Struct("<IHII")
+# Response headers worth replaying (cache validators and content type)
+_KEPT_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+# Conditional request headers, dropped when recording so full bodies are stored
+_VALIDATOR_HEADERS = ("if-none-match", "if-modified-since")
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+    def __init__(self, url: str):
+        self.url = url
+        super().__init__(f"No recorded response for {url}")
+
+
+class Cassette:
+    """
+    A file of recorded responses keyed by request URL.
+
+    Entries are appended as a small binary header followed by the URL, the
+    response headers (JSON) and the raw body, so recording a crawl costs one
+    write per response. Opening a cassette memory-maps the file and builds
+    an in-memory index of URL -> offsets in one pass; replayed bodies are
+    sliced from the map without parsing the rest of the file.
+
+    Modes:
+        "replay": Serve recorded responses only, raising CassetteMissError
+                  for unknown URLs (no network access).
+        "record": Start an empty cassette and record every response.
+        "append": Serve recorded responses and record the others.
+
+    Pass an instance to HttpClient, the client facades or NHLSession via
+    `cassette`. Requests are keyed by their full URL (query parameters in
+    canonical order); error responses are recorded and replayed too.
+    Conditional requests are recorded as plain ones, never as 304 responses.
+
+    Usage:
+        >>> with Cassette("season.cassette", mode="record") as cassette:
+        ...     async with NHLWebClient(cassette=cassette) as client:
+        ...         await client.game.get_play_by_play(2023020204)
+        >>> with Cassette("season.cassette") as cassette:  # Replay, offline
+        ...     async with NHLWebClient(cassette=cassette) as client:
+        ...         await client.game.get_play_by_play(2023020204)
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        """
+        Opens (or creates) a cassette.
+
+        Args:
+            path: Path of the cassette file. "~" is expanded.
+            mode: "replay", "record" or "append" (see above).
+
+        Raises:
+            ValueError: If the mode is unknown or the file is not a cassette.
+            FileNotFoundError: If the file does not exist in replay mode.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {MODES}")
+        self.path = os.path.expanduser(path)
+        self.mode = mode
+        # Sync clients run the event loop in another thread than the creator
+        self._lock = threading.Lock()
+        # URL -> (status, headers offset, headers length, body offset, body length)
+        self._index: t.Dict[str, t.Tuple[int, int, int, int, int]] = {}
+        self._map: t.Optional[mmap.mmap] = None
+        if mode == RECORD or (mode == APPEND and not os.path.exists(self.path)):
+            self._file = open(self.path, "w+b")
+        else:
+            self._file = open(self.path, "rb" if mode == REPLAY else "r+b")
+        try:
+            self._end = self._load()
+        except ValueError:
+            self._file.close()
+            raise
+        if mode != REPLAY:
+            if self._end == 0:
+                self._file.write(_MAGIC)
+                self._end = len(_MAGIC)
+            if self._map is not None and len(self._map) != self._end:
+                # Drop a partially written last entry
+                self._map.close()
+                self._file.truncate(self._end)
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> int:
+        """Maps the file and indexes its entries; returns the end of the last one."""
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            return 0
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{self.path} is not a cassette file")
+        offset = len(_MAGIC)
+        while offset + _ENTRY.size <= size:
+            url_len, status, headers_len, body_len = _ENTRY.unpack_from(
+                self._map, offset
+            )
+            url_start = offset + _ENTRY.size
+            headers_start = url_start + url_len
+            body_start = headers_start + headers_len
+            end = body_start + body_len
+            if end > size:
+                break  # Truncated by an interrupted recording
+            url = self._map[url_start:headers_start].decode()
+            self._index[url] = (
+                status,
+                headers_start,
+                headers_len,
+                body_start,
+                body_len,
+            )
+            offset = end
+        return offset
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is not None and offset + length <= len(self._map):
+            return self._map[offset : offset + length]
+        # Recorded after the file was mapped
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def get(self, url: str) -> t.Optional[httpx.Response]:
+        """Returns the recorded response for a URL, or None if there is none."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            status, headers_start, headers_len, body_start, body_len = entry
+            headers = self._read(headers_start, headers_len)
+            body = self._read(body_start, body_len)
+            self.hits += 1
+        return httpx.Response(status, headers=json.loads(headers), content=body)
+
+    def put(self, url: str, response: httpx.Response) -> None:
+        """
+        Records a response whose content has been read, replacing older
+        entries for the URL. All of its headers are stored.
+        """
+        headers = json.dumps(
+            response.headers.multi_items(), separators=(",", ":")
+        ).encode()
+        encoded_url = url.encode()
+        body = response.content
+        entry = _ENTRY.pack(
+            len(encoded_url), response.status_code, len(headers), len(body)
+        )
+        with self._lock:
+            offset = self._end
+            self._file.seek(offset)
+            self._file.write(entry + encoded_url + headers + body)
+            self._file.flush()
+            headers_start = offset + _ENTRY.size + len(encoded_url)
+            body_start = headers_start + len(headers)
+            self._index[url] = (
+                response.status_code,
+                headers_start,
+                len(headers),
+                body_start,
+                len(body),
+            )
+            self._end = body_start + len(body)
+
+    def transport(
+        self, transport: t.Optional[httpx.AsyncBaseTransport] = None
+    ) -> "CassetteTransport":
+        """
+        Returns an httpx transport serving this cassette.
+
+        Args:
+            transport: The transport used for requests that are not replayed
+                       (ignored in replay mode).
+        """
+        return CassetteTransport(self, transport)
+
+    def close(self) -> None:
+        """Unmaps and closes the cassette file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """An httpx transport replaying and recording responses of a Cassette."""
+
+    def __init__(
+        self, cassette: Cassette, transport: t.Optional[httpx.AsyncBaseTransport]
+    ):
+        self.cassette = cassette
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        cassette = self.cassette
+        if cassette.mode != RECORD:
+            response = cassette.get(url)
+            if response is not None:
+                return response
+        if cassette.mode == REPLAY or self._transport is None:
+            raise CassetteMissError(url)
+        # A revalidation would record an empty 304 over the recorded body
+        for name in _VALIDATOR_HEADERS:
+            request.headers.pop(name, None)
+        upstream = await self._transport.handle_async_request(request)
+        try:
+            body = await upstream.aread()  # Decompressed (content-encoding)
+        finally:
+            await upstream.aclose()
+        response = httpx.Response(
+            upstream.status_code,
+            headers=[
+                (name, upstream.headers[name])
+                for name in _KEPT_HEADERS
+                if name in upstream.headers
+            ],
+            content=body,
+        )
+        if response.status_code != 304:
+            cassette.put(url, response)
+        return response
+
+    async def aclose(self) -> None:
+        if self._transport is not None:
+            await self._transport.aclose()
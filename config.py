@@ -11,6 +11,68 @@ STATS_BASE_URL = (
 # Default timeout for HTTP requests in seconds
 DEFAULT_TIMEOUT = 10.0
 
+# Connection pool defaults (see http_client.HttpClient). HTTP/2 multiplexes
+# concurrent requests over few connections and is used when `h2` is installed.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Response cache defaults (see cache.ResponseCache)
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_TTL = 60.0
+
+# zlib level used for stored response bodies (see disk_cache.DiskCache)
+DEFAULT_DISK_CACHE_COMPRESSION = 6
+
+# Default client-side rate limits per host: (requests per second, burst size)
+# (see rate_limit.RateLimiter)
+DEFAULT_RATE_LIMITS = {
+    "api-web.nhle.com": (10.0, 20.0),
+    "api.nhle.com": (5.0, 10.0),
+}
+
+# Default number of calls in flight for batch helpers (see batch.gather_bounded)
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Stats API report pagination (see stats.base.StatsEndpointCategory._paginate)
+DEFAULT_STATS_PAGE_SIZE = 100
+DEFAULT_STATS_PAGE_PREFETCH = 2
+
+# Sharded report pulls (see stats.planner): pages in flight across all shards,
+# and days per shard when splitting by date
+DEFAULT_SHARD_CONCURRENCY = 4
+DEFAULT_SHARD_DAYS = 31
+
+# Live polling intervals in seconds per game state (see live.LiveGamePoller)
+DEFAULT_LIVE_POLL_INTERVALS = {
+    "FUT": 60.0,  # Scheduled
+    "PRE": 20.0,  # Pre-game warmups
+    "LIVE": 5.0,
+    "CRIT": 3.0,  # Late in a close game or overtime
+    "INTERMISSION": 30.0,
+}
+# Factor applied to the interval after each poll without changes, and its cap
+LIVE_POLL_IDLE_BACKOFF = 1.5
+LIVE_POLL_MAX_IDLE_FACTOR = 3.0
+
+# Results between checkpoint saves of a season crawl (see crawler.SeasonCrawler)
+DEFAULT_CRAWL_CHECKPOINT_EVERY = 50
+
+# Upper bounds in seconds of the request latency histogram (see metrics.MetricsRegistry)
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
 # User Agent String (Optional, but can be polite)
 # Some APIs might block default httpx/python user agents eventually
 # USER_AGENT = f"nhl-api-wrapper-python/{__version__}" # Requires importing __version__ carefully
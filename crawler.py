@@ -0,0 +1,227 @@
+"""
+Season-wide crawling of gamecenter data with resumable checkpoints.
+"""
+
+import datetime
+import json
+import os
+import typing as t
+
+from .batch import gather_all, gather_bounded
+from .config import DEFAULT_BATCH_CONCURRENCY, DEFAULT_CRAWL_CHECKPOINT_EVERY
+from .live import DETAIL_FETCHES
+
+if t.TYPE_CHECKING:
+    from .web_client import NHLWebClient
+
+# Game types: 1 preseason, 2 regular season, 3 playoffs
+REGULAR_SEASON = 2
+PLAYOFFS = 3
+
+
+class CrawlResult:
+    """One fetched (or failed) gamecenter endpoint of a crawl."""
+
+    __slots__ = ("game_id", "endpoint", "value", "error")
+
+    def __init__(
+        self,
+        game_id: int,
+        endpoint: str,
+        value: t.Any = None,
+        error: t.Optional[BaseException] = None,
+    ):
+        self.game_id = game_id
+        self.endpoint = endpoint  # Key of DETAIL_FETCHES (e.g., "boxscore")
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the fetch completed without raising."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.error is None else f"error={self.error!r}"
+        return (
+            f"CrawlResult(game_id={self.game_id}, endpoint={self.endpoint!r}, {status})"
+        )
+
+
+class SeasonCrawler:
+    """
+    Discovers every game of a season and fetches its gamecenter endpoints.
+
+    Game ids are discovered from the weekly league schedule (following
+    `nextStartDate` from the start of the season to the end of the playoffs)
+    or, if `teams` is given, from each team's season schedule, and are
+    de-duplicated. The selected endpoints are then fetched with bounded
+    concurrency and yielded as they complete.
+
+    With a `checkpoint` path, the discovered games and every (game, endpoint)
+    pair consumed by the caller are saved to a JSON file, so an interrupted
+    crawl resumes without rediscovering or refetching. A pair is only marked
+    done once the caller has received it (and asked for the next result),
+    and failed fetches are retried by the next run.
+
+    Usage:
+        >>> async with NHLWebClient(retry=RetryPolicy()) as client:
+        ...     crawler = SeasonCrawler(
+        ...         client, 20232024, endpoints=("boxscore",), checkpoint="crawl.json"
+        ...     )
+        ...     async for result in crawler:
+        ...         if result.ok:
+        ...             store(result.game_id, result.value)
+    """
+
+    def __init__(
+        self,
+        client: "NHLWebClient",
+        season: int,
+        endpoints: t.Sequence[str] = ("play-by-play", "boxscore"),
+        game_types: t.Collection[int] = (REGULAR_SEASON, PLAYOFFS),
+        teams: t.Optional[t.Sequence[str]] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        checkpoint: t.Optional[str] = None,
+        checkpoint_every: int = DEFAULT_CRAWL_CHECKPOINT_EVERY,
+    ):
+        """
+        Args:
+            client: The NHLWebClient used for requests.
+            season: Season in YYYYYYYY format (e.g., 20232024).
+            endpoints: Gamecenter endpoints to fetch per game (keys of
+                       live.DETAIL_FETCHES: "play-by-play", "boxscore", "landing").
+            game_types: Game types to keep (2 regular season, 3 playoffs).
+            teams: Optional team tricodes; discovers games from their season
+                   schedules instead of the weekly league schedule.
+            concurrency: Maximum number of requests in flight.
+            checkpoint: Optional path of the JSON checkpoint file.
+            checkpoint_every: Save the checkpoint after this many results.
+        """
+        unknown = set(endpoints) - set(DETAIL_FETCHES)
+        if unknown:
+            raise ValueError(f"Unknown endpoints: {sorted(unknown)}")
+        self.client = client
+        self.season = season
+        self.endpoints = tuple(endpoints)
+        self.game_types = frozenset(game_types)
+        self.teams = teams
+        self.concurrency = concurrency
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.game_ids: t.Optional[t.List[int]] = None
+        self.done: t.Set[t.Tuple[int, str]] = set()
+        self._load_checkpoint()
+
+    def _keep(self, game: t.Dict[str, t.Any]) -> bool:
+        return (
+            game.get("season") == self.season
+            and game.get("gameType") in self.game_types
+        )
+
+    async def _discover_by_week(self) -> t.Set[int]:
+        """Walks the weekly league schedule over the season."""
+        found: t.Set[int] = set()
+        # Seasons start in the fall of their first year (preseason in September)
+        date: t.Optional[str] = f"{self.season // 10000}-09-01"
+        end: t.Optional[str] = None
+        while date is not None and (end is None or date <= end):
+            week = await self.client.schedule.get_schedule_by_date(date)
+            end = end or week.get("playoffEndDate") or week.get("regularSeasonEndDate")
+            for day in week.get("gameWeek", ()):
+                found.update(g["id"] for g in day.get("games", ()) if self._keep(g))
+            next_date = week.get("nextStartDate")
+            date = next_date if next_date and next_date > date else None
+        return found
+
+    async def _discover_by_team(self, teams: t.Sequence[str]) -> t.Set[int]:
+        """Fetches every team's season schedule."""
+        calls = [
+            lambda team=team: self.client.schedule.get_team_season_schedule(
+                team, self.season
+            )
+            for team in teams
+        ]
+        found: t.Set[int] = set()
+        for result in await gather_all(calls, concurrency=self.concurrency):
+            schedule = result.result()
+            found.update(g["id"] for g in schedule.get("games", ()) if self._keep(g))
+        return found
+
+    async def discover(self) -> t.List[int]:
+        """
+        Returns the de-duplicated, sorted game ids of the season (from the
+        checkpoint if a previous run already discovered them).
+        """
+        if self.game_ids is None:
+            if self.teams:
+                found = await self._discover_by_team(self.teams)
+            else:
+                found = await self._discover_by_week()
+            self.game_ids = sorted(found)
+            self.save_checkpoint()
+        return self.game_ids
+
+    async def crawl(self) -> t.AsyncIterator[CrawlResult]:
+        """
+        Fetches the selected endpoints of every discovered game not done yet.
+
+        Yields:
+            CrawlResult objects, in completion order.
+        """
+        game_ids = await self.discover()
+        pending = [
+            (game_id, endpoint)
+            for game_id in game_ids
+            for endpoint in self.endpoints
+            if (game_id, endpoint) not in self.done
+        ]
+        calls = (
+            lambda game_id=game_id, endpoint=endpoint: DETAIL_FETCHES[endpoint](
+                self.client, game_id
+            )
+            for game_id, endpoint in pending
+        )
+        since_save = 0
+        try:
+            async for item in gather_bounded(calls, concurrency=self.concurrency):
+                game_id, endpoint = pending[item.index]
+                yield CrawlResult(game_id, endpoint, item.value, item.error)
+                if item.ok:
+                    self.done.add((game_id, endpoint))
+                    since_save += 1
+                    if since_save >= self.checkpoint_every:
+                        self.save_checkpoint()
+                        since_save = 0
+        finally:
+            self.save_checkpoint()
+
+    def __aiter__(self) -> t.AsyncIterator[CrawlResult]:
+        return self.crawl()
+
+    def _load_checkpoint(self) -> None:
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        if state.get("season") != self.season:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint} belongs to season {state.get('season')}"
+            )
+        self.game_ids = state.get("game_ids")
+        self.done = {(game_id, endpoint) for game_id, endpoint in state.get("done", ())}
+
+    def save_checkpoint(self) -> None:
+        """Atomically writes the crawl state to the checkpoint file, if configured."""
+        if self.checkpoint is None:
+            return
+        state = {
+            "season": self.season,
+            "game_ids": self.game_ids,
+            "done": sorted(self.done),
+            "saved_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp_path = f"{self.checkpoint}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.checkpoint)
@@ -0,0 +1,94 @@
+"""
+Pluggable JSON decoders for the NHL API Wrapper.
+
+`orjson` or `msgspec` are used when installed (`pip install orjson`), falling
+back to the standard library `json` module otherwise.
+"""
+
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# A decoder takes the raw response body and returns the parsed JSON value.
+# It must raise ValueError on malformed input.
+Decoder = t.Callable[[bytes], t.Any]
+
+
+def stdlib_decoder(content: bytes) -> t.Any:
+    """Decodes JSON with the standard library."""
+    return json.loads(content)
+
+
+def orjson_decoder(content: bytes) -> t.Any:
+    """Decodes JSON with orjson (orjson.JSONDecodeError subclasses ValueError)."""
+    return orjson.loads(content)
+
+
+if msgspec is not None:
+    _msgspec_json_decoder = msgspec.json.Decoder()
+
+
+def msgspec_decoder(content: bytes) -> t.Any:
+    """Decodes JSON with msgspec, raising ValueError on malformed input."""
+    try:
+        return _msgspec_json_decoder.decode(content)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+_DECODERS: t.Dict[str, t.Tuple[Decoder, t.Any]] = {
+    "orjson": (orjson_decoder, orjson),
+    "msgspec": (msgspec_decoder, msgspec),
+    "json": (stdlib_decoder, json),
+}
+
+AUTO_PREFERENCE = ("orjson", "msgspec", "json")
+"""
+Order in which decoders are tried when `get_decoder("auto")` is used.
+"""
+
+
+def available_decoders() -> t.List[str]:
+    """Returns the names of the decoders whose backing library is installed."""
+    return [name for name, (_, module) in _DECODERS.items() if module is not None]
+
+
+def get_decoder(decoder: t.Union[str, Decoder, None] = None) -> Decoder:
+    """
+    Resolves a decoder specification to a decoder callable.
+
+    Args:
+        decoder: A callable, one of "orjson", "msgspec", "json", or "auto"/None
+                 to pick the fastest installed decoder.
+
+    Returns:
+        A callable turning response bytes into Python objects.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested library is not installed.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None or decoder == "auto":
+        for name in AUTO_PREFERENCE:
+            func, module = _DECODERS[name]
+            if module is not None:
+                return func
+    if decoder not in _DECODERS:
+        raise ValueError(
+            f"Unknown decoder {decoder!r}; expected one of {sorted(_DECODERS)} or 'auto'"
+        )
+    func, module = _DECODERS[decoder]
+    if module is None:
+        raise ImportError(f"The {decoder!r} decoder requires `pip install {decoder}`")
+    return func
@@ -0,0 +1,205 @@
+"""
+Persistent (SQLite-backed) response cache for historical NHL data.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+import zlib
+
+from .cache import FOREVER, CacheRule, SeasonCacheRule, _final_game_ttl
+from .config import DEFAULT_DISK_CACHE_COMPRESSION
+
+DEFAULT_DISK_CACHE_RULES = [
+    # Gamecenter data is frozen once the game is final; live games are not stored
+    CacheRule(
+        r"^/v1/gamecenter/\d+/(boxscore|play-by-play|landing|right-rail)$",
+        _final_game_ttl(0.0),
+    ),
+    # Per-season resources of past seasons (and past drafts) never change
+    SeasonCacheRule(r"^/v1/player/\d+/game-log/(?P<season>\d{8})/\d+$", 0.0),
+    SeasonCacheRule(r"^/v1/club-stats/[A-Z]{3}/(?P<season>\d{8})/\d+$", 0.0),
+    SeasonCacheRule(r"^/v1/club-schedule-season/[A-Z]{3}/(?P<season>\d{8})$", 0.0),
+    SeasonCacheRule(r"^/v1/roster/[A-Z]{3}/(?P<season>\d{8})$", 0.0),
+    SeasonCacheRule(r"^/v1/draft/picks/(?P<season>\d{4})/\w+$", 0.0),
+]
+"""
+Default immutability rules used by DiskCache. The first matching rule wins and
+routes without a rule are not stored (the default TTL is 0).
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+class DiskCache:
+    """
+    A persistent cache of raw response bodies stored zlib-compressed in SQLite.
+
+    Unlike ResponseCache it survives process restarts, which lets backfills
+    skip data fetched by previous runs. Bodies are stored before decoding, so
+    one entry serves both plain and typed (`model=`) requests. Entries are
+    keyed by the full request URL (query parameters in canonical order) and
+    only responses matched by an immutability rule are written.
+
+    Pass an instance to HttpClient (or the client facades) via `disk_cache`.
+    It can be combined with an in-memory ResponseCache, which is checked first.
+    `get` and `set` block on SQLite and zlib; HttpClient uses `aget` and
+    `aset`, which run them in the event loop's default executor.
+
+    Usage:
+        >>> disk_cache = DiskCache("~/.cache/nhl_api.sqlite3")
+        >>> async with NHLWebClient(disk_cache=disk_cache) as client:
+        ...     await client.players.get_game_log(8478402, 20222023, 2)
+        >>> disk_cache.close()
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        rules: t.Optional[t.Sequence[CacheRule]] = None,
+        default_ttl: float = 0.0,
+        compression_level: int = DEFAULT_DISK_CACHE_COMPRESSION,
+    ):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a throwaway
+                  cache, mostly useful in tests). "~" is expanded.
+            rules: Ordered per-route TTL rules. Defaults to DEFAULT_DISK_CACHE_RULES.
+            default_ttl: TTL in seconds for routes not matched by any rule.
+                         0 stores nothing but the matched routes.
+            compression_level: zlib level (0-9) used for stored bodies.
+        """
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        self.rules = list(DEFAULT_DISK_CACHE_RULES if rules is None else rules)
+        self.default_ttl = default_ttl
+        self.compression_level = compression_level
+        # Sync clients run the event loop in another thread than the creator
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, path: str, data: t.Any) -> float:
+        """
+        Resolves the TTL for a response using the first matching rule.
+
+        Args:
+            path: The request path relative to the base URL.
+            data: The decoded response.
+
+        Returns:
+            TTL in seconds (FOREVER for no expiry, <= 0 for "do not store").
+        """
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule.resolve(path, data)
+        return self.default_ttl
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        """Returns the stored response body for a key, or None if missing or expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return zlib.decompress(row[0])
+
+    async def aget(self, key: str) -> t.Optional[bytes]:
+        """Like `get`, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, key)
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        """
+        Stores a response body for `ttl` seconds (FOREVER for no expiry).
+        Non-positive TTLs are ignored.
+        """
+        if ttl <= 0:
+            return
+        now = time.time()
+        expires_at = None if ttl == FOREVER else now + ttl
+        compressed = zlib.compress(body, self.compression_level)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, compressed, now, expires_at),
+            )
+            self._db.commit()
+
+    async def aset(self, key: str, body: bytes, ttl: float) -> None:
+        """Like `set`, without blocking the event loop."""
+        if ttl <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.set, key, body, ttl)
+
+    def invalidate(self, key: str) -> None:
+        """Removes a single entry, if present."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def purge_expired(self) -> int:
+        """Deletes expired entries and returns how many were removed."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+            self._db.commit()
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> t.Dict[str, int]:
+        """Returns the number of entries, stored (compressed) bytes and hit/miss counters."""
+        with self._lock:
+            size, stored_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+        return {
+            "size": size,
+            "bytes": stored_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        return self.stats()["size"]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
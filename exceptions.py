@@ -2,6 +2,8 @@
 Custom exceptions for the NHL API Wrapper.
 """
 
+import typing as t
+
 
 class NHLAPIError(Exception):
     """Base exception class for NHL API errors."""
@@ -30,14 +32,30 @@ class NHLNotFoundError(NHLAPIError):
 class NHLRateLimitError(NHLAPIError):
     """Exception for 429 Too Many Requests errors."""
 
-    def __init__(self, status_code: int, message: str, url: str):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        url: str,
+        retry_after: t.Optional[float] = None,
+    ):
+        # Seconds to wait before retrying, from the Retry-After header (if sent)
+        self.retry_after = retry_after
         super().__init__(status_code, message, url)
 
 
 class NHLServerError(NHLAPIError):
     """Exception for 5xx Server errors."""
 
-    def __init__(self, status_code: int, message: str, url: str):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        url: str,
+        retry_after: t.Optional[float] = None,
+    ):
+        # Seconds to wait before retrying, from the Retry-After header (if sent)
+        self.retry_after = retry_after
         super().__init__(status_code, message, url)
 
 
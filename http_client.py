@@ -2,9 +2,16 @@
 Core asynchronous HTTP client for interacting with NHL APIs.
 """
 
+import asyncio
+import time
 import httpx
 import typing as t
-from .config import DEFAULT_TIMEOUT
+from .config import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+)
 from .exceptions import (
     NHLAPIError,
     NHLBadRequestError,
@@ -12,51 +19,412 @@ from .exceptions import (
     NHLRateLimitError,
     NHLServerError,
 )
+from .cassette import REPLAY, Cassette
+from .decoders import Decoder, get_decoder
+from .metrics import RequestEvent, RequestHook, route_template
+from .retry import parse_retry_after
+from .singleflight import SingleFlight
+from .tracing import (
+    TracerSpec,
+    child_span,
+    get_tracer,
+    httpx_trace,
+    record_request,
+    request_span,
+)
+
+if t.TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .disk_cache import DiskCache
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+
+_MISSING = object()
+
+
+def _model_decoder(model: type) -> Decoder:
+    """Returns a decoder turning response bytes into `model` (requires msgspec)."""
+    from .models import decode  # Optional dependency, imported on first use
+
+    return lambda content: decode(content, model)
+
+
+def http2_available() -> bool:
+    """Returns True if the `h2` package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_async_client(
+    timeout: float = DEFAULT_TIMEOUT,
+    http2: t.Optional[bool] = None,
+    max_connections: t.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: t.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: t.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    cassette: t.Optional[Cassette] = None,
+    **httpx_kwargs,
+) -> httpx.AsyncClient:
+    """Builds the httpx.AsyncClient (connection pool) used by HttpClient."""
+    if http2 is None:
+        http2 = http2_available()
+    # An explicit httpx `limits` argument takes precedence
+    httpx_kwargs.setdefault(
+        "limits",
+        httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    if cassette is not None:
+        transport = httpx_kwargs.pop("transport", None)
+        if transport is None and cassette.mode != REPLAY:
+            transport = httpx.AsyncHTTPTransport(
+                http2=http2, limits=httpx_kwargs["limits"]
+            )
+        httpx_kwargs["transport"] = cassette.transport(transport)
+    return httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, http2=http2, **httpx_kwargs
+    )
 
 
 class HttpClient:
     """A wrapper around httpx.AsyncClient for making API calls."""
 
-    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT, **httpx_kwargs):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache: t.Optional["ResponseCache"] = None,
+        coalesce: bool = True,
+        retry: t.Optional["RetryPolicy"] = None,
+        rate_limiter: t.Optional["RateLimiter"] = None,
+        decoder: t.Union[str, Decoder, None] = None,
+        disk_cache: t.Optional["DiskCache"] = None,
+        cassette: t.Optional[Cassette] = None,
+        http2: t.Optional[bool] = None,
+        max_connections: t.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: t.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: t.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        client: t.Optional[httpx.AsyncClient] = None,
+        hooks: t.Optional[t.Sequence[RequestHook]] = None,
+        tracer: TracerSpec = None,
+        **httpx_kwargs,
+    ):
         """
         Initializes the HTTP client.
 
         Args:
             base_url: The base URL for the API.
             timeout: Default request timeout in seconds.
+            cache: Optional ResponseCache checked before hitting the network.
+            coalesce: If True, concurrent identical GET requests share a single
+                      upstream request (and the same decoded result object).
+            retry: Optional RetryPolicy for transient failures (429, 5xx,
+                   network errors). No retries are made by default.
+            rate_limiter: Optional RateLimiter paced per host before every
+                          attempt. Can be shared between clients.
+            decoder: JSON decoder: a callable taking the response bytes, or one of
+                     "orjson", "msgspec", "json". Defaults to the fastest installed.
+            disk_cache: Optional persistent DiskCache of response bodies, checked
+                        after `cache` and before the network.
+            cassette: Optional Cassette recording responses to, or replaying
+                      them from, a file instead of the network (see
+                      nhl_api.cassette).
+            http2: Use HTTP/2, multiplexing concurrent requests over a few
+                   connections. Defaults to True when `h2` is installed
+                   (`pip install nhlapi-tools[http2]`).
+            max_connections: Maximum number of open connections (None for no limit).
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            client: Optional existing httpx.AsyncClient to send requests with
+                    (e.g., an NHLSession's). It is not closed by aclose, and
+                    `timeout`, `cassette`, the connection options and
+                    `httpx_kwargs` are ignored.
+            hooks: Optional callables receiving a metrics.RequestEvent after
+                   every get (e.g., a MetricsRegistry). No measurements are
+                   taken without hooks.
+            tracer: Optional OpenTelemetry tracer, or True for the global
+                    tracer provider (requires `opentelemetry-api`). Every get
+                    is recorded as a span with its route, cache source,
+                    status and retries. Disabled by default, at no cost.
             **httpx_kwargs: Additional arguments to pass to httpx.AsyncClient (e.g., headers).
         """
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=timeout,
-            follow_redirects=True,
-            **httpx_kwargs,
-        )
+        self.cache = cache
+        self._inflight = SingleFlight() if coalesce else None
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.decoder = get_decoder(decoder)
+        self.disk_cache = disk_cache
+        self.hooks = list(hooks or ())
+        self.tracer = get_tracer(tracer)
+        self._owns_client = client is None
+        if client is None:
+            client = _build_async_client(
+                timeout,
+                http2,
+                max_connections,
+                max_keepalive_connections,
+                keepalive_expiry,
+                cassette,
+                **httpx_kwargs,
+            )
+        self._client = client
         # Consider adding a default User-Agent header here if desired
         # self._client.headers['User-Agent'] = USER_AGENT
 
+    def _build_request(
+        self, url_path: str, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> httpx.Request:
+        """Builds a GET request with query parameters in a canonical (sorted) order."""
+        if params:
+            params = dict(sorted(params.items()))
+        # Absolute URLs, so a shared httpx client can serve several base URLs
+        return self._client.build_request(
+            "GET", f"{self.base_url}/{url_path}", params=params
+        )
+
     async def get(
-        self, path: str, params: t.Optional[t.Dict[str, t.Any]] = None
-    ) -> t.Dict[str, t.Any]:
+        self,
+        path: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        model: t.Optional[type] = None,
+    ) -> t.Any:
         """
         Performs an asynchronous GET request.
 
+        If a cache is configured, a fresh cached response is returned without
+        touching the network, and successful responses are stored according
+        to the cache's per-route TTL rules. Expired entries with an `ETag` or
+        `Last-Modified` validator are revalidated with a conditional request
+        and reused on `304 Not Modified`. A disk cache is consulted next and
+        stores the raw bodies of responses its rules mark immutable.
+        Concurrent calls for the same path and params are coalesced into one
+        upstream request unless disabled. Hooks, if any, receive a
+        RequestEvent once the call completes (or fails), and a tracer, if
+        any, records the call as a span.
+
         Args:
             path: The API endpoint path (relative to base_url).
             params: Optional dictionary of query parameters.
+            model: Optional typed model (see nhl_api.models) to decode the
+                   response bytes into instead of plain dictionaries.
 
         Returns:
-            The JSON response parsed as a dictionary.
+            The JSON response parsed as a dictionary (or an instance of `model`).
 
         Raises:
             NHLAPIError: If the API returns an error status code (>= 400).
             httpx.RequestError: For network-related issues.
         """
         url_path = path.lstrip("/")
-        request_url = self._client.build_request("GET", url_path, params=params).url
+        request = self._build_request(url_path, params)
+        cache_key = str(request.url)
+        decoder = self.decoder
+        if model is not None:
+            # Typed results are cached separately from the plain dictionaries
+            cache_key = f"{cache_key}#{model.__module__}.{model.__qualname__}"
+            decoder = _model_decoder(model)
+
+        if not self.hooks and self.tracer is None:
+            return await self._get(request, url_path, cache_key, decoder, None)
+
+        event = RequestEvent(request.url.host, route_template(request.url.path))
+        if self.tracer is None:
+            return await self._get_measured(
+                request, url_path, cache_key, decoder, event
+            )
+        with request_span(self.tracer, event, cache_key) as span:
+            try:
+                return await self._get_measured(
+                    request, url_path, cache_key, decoder, event
+                )
+            finally:
+                record_request(span, event)
+
+    async def _get_measured(
+        self,
+        request: httpx.Request,
+        url_path: str,
+        cache_key: str,
+        decoder: Decoder,
+        event: RequestEvent,
+    ) -> t.Any:
+        """Runs _get, completing `event` and passing it to the hooks."""
+        started = time.perf_counter()
+        try:
+            return await self._get(request, url_path, cache_key, decoder, event)
+        except Exception as exc:
+            event.error = type(exc).__name__
+            if isinstance(exc, NHLAPIError):
+                event.status = exc.status_code
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - started
+            if event.source is None:
+                event.source = "coalesced"  # Another caller's fetch was shared
+            for hook in self.hooks:
+                hook(event)
+
+    async def _get(
+        self,
+        request: httpx.Request,
+        url_path: str,
+        cache_key: str,
+        decoder: Decoder,
+        event: t.Optional[RequestEvent],
+    ) -> t.Any:
+        """Serves a request from the cache or fetches it (coalescing duplicates)."""
+        if self.cache is not None:
+            cached = self.cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                if event is not None:
+                    event.source = "memory"
+                return cached
+
+        if self._inflight is not None:
+            return await self._inflight.do(
+                cache_key,
+                lambda: self._fetch(request, url_path, cache_key, decoder, event),
+            )
+        return await self._fetch(request, url_path, cache_key, decoder, event)
+
+    async def _fetch(
+        self,
+        request: httpx.Request,
+        url_path: str,
+        cache_key: str,
+        decoder: Decoder,
+        event: t.Optional[RequestEvent] = None,
+    ) -> t.Any:
+        """Sends a request and stores the decoded response in the caches, if any."""
+        url = str(request.url)
+        disk_cache = self.disk_cache
+        body = await disk_cache.aget(url) if disk_cache is not None else None
+        if body is not None:
+            if event is not None:
+                event.source = "disk"
+            data = self._decode(body, decoder, 200, url, event)
+            if self.cache is not None:
+                self.cache.set(
+                    cache_key, data, self.cache.ttl_for(f"/{url_path}", data)
+                )
+            return data
+
+        stale = self.cache.get_stale(cache_key) if self.cache is not None else None
+        if stale is not None and stale.revalidatable:
+            if stale.etag is not None:
+                request.headers["If-None-Match"] = stale.etag
+            if stale.last_modified is not None:
+                request.headers["If-Modified-Since"] = stale.last_modified
+        if event is not None:
+            event.source = "network"
+        response = await self._send_with_retry(request, event)
+        if event is not None:
+            event.status = response.status_code
+            event.bytes = len(response.content)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 304 and stale is not None:
+            # 304 responses may omit the validators; keep the stored ones
+            data = stale.value
+            if event is not None:
+                event.source = "revalidated"
+            etag = etag or stale.etag
+            last_modified = last_modified or stale.last_modified
+        else:
+            data = self._decode(
+                response.content, decoder, response.status_code, url, event
+            )
+            if disk_cache is not None:
+                await disk_cache.aset(
+                    url, response.content, disk_cache.ttl_for(f"/{url_path}", data)
+                )
+        if self.cache is not None:
+            self.cache.set(
+                cache_key,
+                data,
+                self.cache.ttl_for(f"/{url_path}", data),
+                etag=etag,
+                last_modified=last_modified,
+            )
+        return data
+
+    @staticmethod
+    def _decode(
+        content: bytes,
+        decoder: Decoder,
+        status_code: int,
+        url: str,
+        event: t.Optional[RequestEvent] = None,
+    ) -> t.Any:
+        """
+        Decodes a JSON response body with `decoder` (timed if `event` is given).
+
+        Raises:
+            NHLAPIError: If the body is not valid JSON (or does not match the model).
+        """
+        started = time.perf_counter() if event is not None else 0.0
+        try:
+            return decoder(content)
+        except ValueError:  # Includes JSONDecodeError
+            raise NHLAPIError(status_code, "Failed to decode JSON response", url)
+        finally:
+            if event is not None:
+                event.decode_seconds = time.perf_counter() - started
+
+    async def _send_with_retry(
+        self, request: httpx.Request, event: t.Optional[RequestEvent] = None
+    ) -> httpx.Response:
+        """Sends a request, retrying transient failures per the retry policy."""
+        policy = self.retry
+        if policy is None or not policy.allows(request.method):
+            if event is not None:
+                event.attempts = 1
+            return await self._send(request)
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if event is not None:
+                event.attempts = attempt
+            try:
+                return await self._send(request)
+            except (NHLAPIError, httpx.TransportError) as exc:
+                delay = policy.next_delay(attempt, exc, time.monotonic() - started)
+                if delay is None:
+                    raise
+                if event is not None:
+                    event.retry_reasons.append(
+                        str(exc.status_code)
+                        if isinstance(exc, NHLAPIError)
+                        else type(exc).__name__
+                    )
+            await asyncio.sleep(delay)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """
+        Sends a prepared request and checks the response status.
+
+        Raises:
+            NHLAPIError: If the API returns an error status code (>= 400).
+            httpx.RequestError: For network-related issues.
+        """
+        request_url = request.url
+        tracer = self.tracer
+        if self.rate_limiter is not None:
+            with child_span(tracer, "nhl_api.rate_limit"):
+                await self.rate_limiter.acquire(request_url.host)
+        if tracer is not None:
+            request.extensions["trace"] = httpx_trace()
         try:
-            response = await self._client.get(url_path, params=params)
+            response = await self._client.send(request)
 
             # Check for specific error codes first
             if response.status_code == 400:
@@ -69,25 +437,26 @@ class HttpClient:
                 )
             if response.status_code == 429:
                 raise NHLRateLimitError(
-                    response.status_code, response.text, str(request_url)
+                    response.status_code,
+                    response.text,
+                    str(request_url),
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
                 )
             if response.status_code >= 500:
                 raise NHLServerError(
-                    response.status_code, response.text, str(request_url)
+                    response.status_code,
+                    response.text,
+                    str(request_url),
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
                 )
 
+            # Revalidated cache entry (conditional request), body is empty
+            if response.status_code == 304:
+                return response
+
             # General check for other 4xx errors
             response.raise_for_status()  # Raises httpx.HTTPStatusError for 4xx Client Errors
-
-            # Attempt to parse JSON, handle potential errors
-            try:
-                return response.json()
-            except ValueError:  # Includes JSONDecodeError
-                raise NHLAPIError(
-                    response.status_code,
-                    "Failed to decode JSON response",
-                    str(request_url),
-                )
+            return response
 
         except httpx.HTTPStatusError as e:
             # Catch errors raised by raise_for_status() for other 4xx codes
@@ -100,8 +469,9 @@ class HttpClient:
         #     raise NHLAPIError(0, f"Network error: {e}", str(e.request.url)) from e
 
     async def aclose(self):
-        """Closes the underlying httpx client."""
-        await self._client.aclose()
+        """Closes the underlying httpx client (unless it was passed in)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         return self
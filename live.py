@@ -0,0 +1,364 @@
+"""
+Incremental polling of live games and of the daily scoreboard.
+"""
+
+import asyncio
+import typing as t
+
+from .batch import gather_all
+from .cache import FINAL_GAME_STATES
+from .config import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_LIVE_POLL_INTERVALS,
+    LIVE_POLL_IDLE_BACKOFF,
+    LIVE_POLL_MAX_IDLE_FACTOR,
+)
+
+if t.TYPE_CHECKING:
+    from .web_client import NHLWebClient
+
+# Regulation periods; later periods are overtime (or a shootout)
+REGULATION_PERIODS = 3
+
+
+def poll_interval(
+    game_state: t.Optional[str],
+    in_intermission: bool = False,
+    period: int = 0,
+    intervals: t.Optional[t.Mapping[str, float]] = None,
+) -> t.Optional[float]:
+    """
+    Returns how long to wait before polling a game again.
+
+    Args:
+        game_state: The `gameState` reported by the Web API (e.g., "LIVE").
+        in_intermission: True during intermissions (`clock.inIntermission`).
+        period: The current period number; overtime polls like "CRIT".
+        intervals: Seconds per state. Defaults to DEFAULT_LIVE_POLL_INTERVALS.
+
+    Returns:
+        The interval in seconds, or None once the game is final.
+    """
+    if game_state in FINAL_GAME_STATES:
+        return None
+    intervals = DEFAULT_LIVE_POLL_INTERVALS if intervals is None else intervals
+    if in_intermission:
+        return intervals["INTERMISSION"]
+    if game_state == "LIVE" and period > REGULATION_PERIODS:
+        return intervals["CRIT"]
+    return intervals.get(game_state or "", intervals["FUT"])
+
+
+class PlayDiff:
+    """The plays added, amended or removed between two polls of a game."""
+
+    __slots__ = ("game_id", "game_state", "new", "changed", "removed", "payload")
+
+    def __init__(
+        self,
+        game_id: int,
+        game_state: t.Optional[str],
+        new: t.List[t.Dict[str, t.Any]],
+        changed: t.List[t.Dict[str, t.Any]],
+        removed: t.List[int],
+        payload: t.Dict[str, t.Any],
+    ):
+        self.game_id = game_id
+        self.game_state = game_state
+        self.new = new  # Plays not seen before, in sortOrder
+        self.changed = changed  # Seen plays whose content changed (e.g., assists added)
+        self.removed = removed  # eventIds of plays no longer reported
+        self.payload = payload  # The full play-by-play response
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.changed or self.removed)
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayDiff(game_id={self.game_id}, game_state={self.game_state!r}, "
+            f"new={len(self.new)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)})"
+        )
+
+
+class LiveGamePoller:
+    """
+    Polls a game's play-by-play and yields only what changed since the last poll.
+
+    Plays are tracked by eventId, so downstream code processes each new play
+    once instead of the whole event list on every poll. The poll interval
+    follows the game state (slower before the game and in intermissions,
+    faster in overtime) and grows while nothing happens. A diff is also
+    yielded when the game state changes, and iteration ends once the game is
+    final.
+
+    Note that a ResponseCache on the client serves live gamecenter data for a
+    few seconds (see DEFAULT_CACHE_RULES), which bounds the effective rate.
+
+    Usage:
+        >>> async with NHLWebClient() as client:
+        ...     async for diff in LiveGamePoller(client, 2023020204):
+        ...         for play in diff.new:
+        ...             print(play["typeDescKey"], play["timeInPeriod"])
+    """
+
+    def __init__(
+        self,
+        client: "NHLWebClient",
+        game_id: int,
+        intervals: t.Optional[t.Mapping[str, float]] = None,
+        emit_empty: bool = False,
+    ):
+        """
+        Args:
+            client: The NHLWebClient used for requests.
+            game_id: The NHL Game ID.
+            intervals: Seconds between polls per game state (see poll_interval).
+            emit_empty: If True, also yield diffs without play changes
+                        (e.g., to observe game state transitions).
+        """
+        self.client = client
+        self.game_id = game_id
+        self.intervals = intervals
+        self.emit_empty = emit_empty
+        self.last_sort_order = -1
+        self.game_state: t.Optional[str] = None
+        self._seen: t.Dict[int, t.Dict[str, t.Any]] = {}  # eventId -> play
+        self._idle_polls = 0
+
+    def diff(self, payload: t.Dict[str, t.Any]) -> PlayDiff:
+        """
+        Compares a play-by-play response with the plays seen so far and
+        records it as the new baseline.
+        """
+        new, changed = [], []
+        current: t.Dict[int, t.Dict[str, t.Any]] = {}
+        for play in payload.get("plays", ()):
+            event_id = play.get("eventId")
+            current[event_id] = play
+            previous = self._seen.get(event_id)
+            if previous is None:
+                new.append(play)
+            elif previous != play:
+                changed.append(play)
+        removed = [event_id for event_id in self._seen if event_id not in current]
+        new.sort(key=lambda play: play.get("sortOrder", 0))
+        if new:
+            self.last_sort_order = max(
+                self.last_sort_order, new[-1].get("sortOrder", 0)
+            )
+        self._seen = current
+        self.game_state = payload.get("gameState")
+        return PlayDiff(self.game_id, self.game_state, new, changed, removed, payload)
+
+    async def poll(self) -> PlayDiff:
+        """Fetches the play-by-play once and returns the changes."""
+        payload = await self.client.game.get_play_by_play(self.game_id)
+        return self.diff(payload)
+
+    def next_interval(self, diff: PlayDiff) -> t.Optional[float]:
+        """Returns the seconds to wait after `diff`, or None once the game is final."""
+        payload = diff.payload
+        clock = payload.get("clock") or {}
+        period = (payload.get("periodDescriptor") or {}).get("number", 0)
+        interval = poll_interval(
+            diff.game_state,
+            bool(clock.get("inIntermission")),
+            period,
+            self.intervals,
+        )
+        if interval is None:
+            return None
+        if diff:
+            self._idle_polls = 0
+        elif LIVE_POLL_IDLE_BACKOFF**self._idle_polls < LIVE_POLL_MAX_IDLE_FACTOR:
+            # Stop counting at the cap, so the power cannot overflow
+            self._idle_polls += 1
+        factor = min(
+            LIVE_POLL_IDLE_BACKOFF**self._idle_polls, LIVE_POLL_MAX_IDLE_FACTOR
+        )
+        return interval * factor
+
+    async def __aiter__(self) -> t.AsyncIterator[PlayDiff]:
+        while True:
+            previous_state = self.game_state
+            diff = await self.poll()
+            if diff or self.emit_empty or diff.game_state != previous_state:
+                yield diff
+            interval = self.next_interval(diff)
+            if interval is None:
+                return
+            await asyncio.sleep(interval)
+
+
+# Targeted fetches available to ScoreboardEngine, by name
+DETAIL_FETCHES = {
+    "play-by-play": lambda client, game_id: client.game.get_play_by_play(game_id),
+    "boxscore": lambda client, game_id: client.game.get_boxscore(game_id),
+    "landing": lambda client, game_id: client.game.get_landing(game_id),
+}
+
+
+def game_snapshot(game: t.Dict[str, t.Any]) -> t.Tuple[t.Any, ...]:
+    """
+    Returns the fields of a `score/now` game that identify a visible change:
+    state, period, intermission, score, shots and the clock while stopped.
+
+    The clock only counts while it is stopped (running/stopped transitions
+    and the time of each stoppage); a running clock would mark every live
+    game as changed on every poll.
+    """
+    clock = game.get("clock") or {}
+    running = bool(clock.get("running"))
+    away = game.get("awayTeam") or {}
+    home = game.get("homeTeam") or {}
+    return (
+        game.get("gameState"),
+        game.get("period"),
+        bool(clock.get("inIntermission")),
+        running,
+        None if running else clock.get("timeRemaining"),
+        away.get("score"),
+        home.get("score"),
+        away.get("sog"),
+        home.get("sog"),
+    )
+
+
+class GameChange:
+    """A game whose scoreboard entry changed, with its targeted fetches."""
+
+    __slots__ = ("game_id", "game", "previous", "details", "plays", "errors")
+
+    def __init__(
+        self,
+        game_id: int,
+        game: t.Dict[str, t.Any],
+        previous: t.Optional[t.Tuple[t.Any, ...]],
+    ):
+        self.game_id = game_id
+        self.game = game  # The game's entry in the scores response
+        self.previous = previous  # Previous game_snapshot, None on first sight
+        self.details: t.Dict[str, t.Any] = {}  # Fetch name -> response
+        self.plays: t.Optional[PlayDiff] = None  # Set when play-by-play is fetched
+        self.errors: t.Dict[str, BaseException] = {}  # Fetch name -> exception
+
+    def __repr__(self) -> str:
+        return (
+            f"GameChange(game_id={self.game_id}, "
+            f"game_state={self.game.get('gameState')!r}, "
+            f"details={sorted(self.details)}, errors={sorted(self.errors)})"
+        )
+
+
+class ScoreboardEngine:
+    """
+    Follows every game of the day with one scores poll per tick.
+
+    Each tick fetches `score/now` once, compares every game against its
+    previous snapshot (see game_snapshot) and only for the games that changed
+    fetches the configured details (play-by-play, boxscore, ...) with bounded
+    concurrency. Play-by-play fetches are diffed like LiveGamePoller does, so
+    `change.plays.new` holds only unseen plays. Iteration ends once every
+    game of the day is final.
+
+    Usage:
+        >>> async with NHLWebClient(retry=RetryPolicy()) as client:
+        ...     engine = ScoreboardEngine(client, fetch=("play-by-play",))
+        ...     async for changes in engine:
+        ...         for change in changes:
+        ...             print(change.game_id, len(change.plays.new))
+    """
+
+    def __init__(
+        self,
+        client: "NHLWebClient",
+        fetch: t.Sequence[str] = ("play-by-play",),
+        intervals: t.Optional[t.Mapping[str, float]] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
+        """
+        Args:
+            client: The NHLWebClient used for requests.
+            fetch: Names of the targeted fetches for changed games (keys of
+                   DETAIL_FETCHES). Empty to only detect changes.
+            intervals: Seconds between polls per game state (see poll_interval).
+                       The shortest interval over all unfinished games is used.
+            concurrency: Maximum number of targeted fetches in flight.
+        """
+        unknown = set(fetch) - set(DETAIL_FETCHES)
+        if unknown:
+            raise ValueError(f"Unknown fetches: {sorted(unknown)}")
+        self.client = client
+        self.fetch = tuple(fetch)
+        self.intervals = intervals
+        self.concurrency = concurrency
+        self.snapshots: t.Dict[int, t.Tuple[t.Any, ...]] = {}
+        self.games: t.Dict[int, t.Dict[str, t.Any]] = {}
+        self._pollers: t.Dict[int, LiveGamePoller] = {}
+
+    def changed_games(self, scores: t.Dict[str, t.Any]) -> t.List[GameChange]:
+        """
+        Compares a `score/now` response with the previous one and records it
+        as the new baseline.
+        """
+        changes = []
+        for game in scores.get("games", ()):
+            game_id = game.get("id")
+            snapshot = game_snapshot(game)
+            previous = self.snapshots.get(game_id)
+            self.games[game_id] = game
+            if snapshot != previous:
+                self.snapshots[game_id] = snapshot
+                changes.append(GameChange(game_id, game, previous))
+        return changes
+
+    async def tick(self) -> t.List[GameChange]:
+        """Polls the scores once and runs the targeted fetches for changed games."""
+        scores = await self.client.game.get_scores_now()
+        changes = self.changed_games(scores)
+        jobs = [(change, name) for change in changes for name in self.fetch]
+        calls = [
+            lambda name=name, game_id=change.game_id: DETAIL_FETCHES[name](
+                self.client, game_id
+            )
+            for change, name in jobs
+        ]
+        results = await gather_all(calls, concurrency=self.concurrency)
+        for (change, name), result in zip(jobs, results):
+            if not result.ok:
+                change.errors[name] = t.cast(BaseException, result.error)
+                continue
+            change.details[name] = result.value
+            if name == "play-by-play":
+                poller = self._pollers.get(change.game_id)
+                if poller is None:
+                    poller = LiveGamePoller(self.client, change.game_id)
+                    self._pollers[change.game_id] = poller
+                change.plays = poller.diff(t.cast(t.Dict[str, t.Any], result.value))
+        return changes
+
+    def next_interval(self) -> t.Optional[float]:
+        """Returns the seconds until the next tick, or None once all games are final."""
+        intervals = []
+        for game in self.games.values():
+            clock = game.get("clock") or {}
+            interval = poll_interval(
+                game.get("gameState"),
+                bool(clock.get("inIntermission")),
+                game.get("period") or 0,
+                self.intervals,
+            )
+            if interval is not None:
+                intervals.append(interval)
+        return min(intervals) if intervals else None
+
+    async def __aiter__(self) -> t.AsyncIterator[t.List[GameChange]]:
+        while True:
+            changes = await self.tick()
+            if changes:
+                yield changes
+            interval = self.next_interval()
+            if interval is None:
+                return
+            await asyncio.sleep(interval)
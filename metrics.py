@@ -0,0 +1,235 @@
+"""
+Request instrumentation: per-request events, hooks and a Prometheus-style registry.
+"""
+
+import bisect
+import re
+import threading
+import typing as t
+
+from .config import DEFAULT_LATENCY_BUCKETS
+
+# Path segments replaced by placeholders in route templates, first match wins
+_SEGMENT_PATTERNS = [
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), "{date}"),
+    (re.compile(r"^\d{4}-\d{2}$"), "{month}"),
+    (re.compile(r"^(19|20)\d{2}(19|20)\d{2}$"), "{season}"),
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[A-Z]{3}$"), "{team}"),
+]
+
+
+def route_template(path: str) -> str:
+    """
+    Groups a request path into a route template with bounded cardinality.
+
+    Ids, seasons, dates and team tricodes are replaced by placeholders, e.g.
+    "/v1/gamecenter/2023020204/boxscore" -> "/v1/gamecenter/{id}/boxscore".
+    """
+    segments = []
+    for segment in path.split("/"):
+        for pattern, placeholder in _SEGMENT_PATTERNS:
+            if pattern.match(segment):
+                segment = placeholder
+                break
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """Measurements of one HttpClient.get call, passed to every hook."""
+
+    __slots__ = (
+        "host",
+        "route",
+        "source",
+        "status",
+        "elapsed",
+        "bytes",
+        "decode_seconds",
+        "attempts",
+        "retry_reasons",
+        "error",
+    )
+
+    def __init__(self, host: str, route: str):
+        self.host = host
+        self.route = route  # Route template (see route_template)
+        # Where the result came from: "network", "memory" (cache hit), "disk",
+        # "revalidated" (304) or "coalesced" (shared an in-flight request)
+        self.source: t.Optional[str] = None
+        self.status: t.Optional[int] = None  # Final HTTP status, if a request was made
+        self.elapsed = 0.0  # Seconds spent in HttpClient.get
+        self.bytes = 0  # Response body bytes received
+        self.decode_seconds = 0.0
+        self.attempts = 0  # HTTP attempts, including retries
+        self.retry_reasons: t.List[str] = []  # Status code or exception per retry
+        self.error: t.Optional[str] = None  # Exception class name if the call failed
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(route={self.route!r}, source={self.source!r}, "
+            f"status={self.status}, elapsed={self.elapsed:.4f})"
+        )
+
+
+RequestHook = t.Callable[[RequestEvent], None]
+
+
+class Histogram:
+    """A cumulative-bucket histogram, as in the Prometheus exposition format."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: t.Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)  # Non-cumulative per bucket
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> t.List[t.Tuple[float, int]]:
+        """Returns (upper bound, cumulative count) pairs, ending with +Inf."""
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            pairs.append((bound, total))
+        pairs.append((float("inf"), self.count))
+        return pairs
+
+
+Labels = t.Tuple[t.Tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """
+    Aggregates RequestEvents into counters and histograms.
+
+    Pass it as a hook to HttpClient, the client facades or NHLSession
+    (`hooks=[registry]`), then export with `render()` (Prometheus text
+    format) or inspect `snapshot()`.
+
+    Metrics (labels in brackets):
+        nhl_api_requests_total[route, source, status]
+        nhl_api_request_duration_seconds[route] (histogram, network requests)
+        nhl_api_response_bytes_total[route]
+        nhl_api_decode_duration_seconds[route] (histogram)
+        nhl_api_cache_hits_total[route, source]
+        nhl_api_retries_total[route, reason]
+        nhl_api_errors_total[route, error]
+
+    Usage:
+        >>> registry = MetricsRegistry()
+        >>> async with NHLWebClient(hooks=[registry]) as client:
+        ...     await client.game.get_boxscore(2023020204)
+        >>> print(registry.render())
+    """
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()  # Sync clients record from another thread
+        self._counters: t.Dict[str, t.Dict[Labels, float]] = {}
+        self._histograms: t.Dict[str, t.Dict[Labels, Histogram]] = {}
+
+    def _inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Records one request (the registry is itself a hook)."""
+        route = (("route", event.route),)
+        status = "" if event.status is None else str(event.status)
+        with self._lock:
+            self._inc(
+                "nhl_api_requests_total",
+                route + (("source", event.source or ""), ("status", status)),
+            )
+            if event.source in ("network", "revalidated"):
+                self._observe("nhl_api_request_duration_seconds", route, event.elapsed)
+            elif event.source is not None:
+                self._inc(
+                    "nhl_api_cache_hits_total", route + (("source", event.source),)
+                )
+            if event.bytes:
+                self._inc("nhl_api_response_bytes_total", route, event.bytes)
+            if event.decode_seconds:
+                self._observe(
+                    "nhl_api_decode_duration_seconds", route, event.decode_seconds
+                )
+            for reason in event.retry_reasons:
+                self._inc("nhl_api_retries_total", route + (("reason", reason),))
+            if event.error is not None:
+                self._inc("nhl_api_errors_total", route + (("error", event.error),))
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """
+        Returns the current values: counters as {name: {labels: value}} and
+        histograms as {name: {labels: {"count", "sum", "buckets"}}}, with
+        labels as tuples of (name, value) pairs.
+        """
+        with self._lock:
+            data: t.Dict[str, t.Any] = {
+                name: dict(series) for name, series in self._counters.items()
+            }
+            for name, histograms in self._histograms.items():
+                data[name] = {
+                    labels: {
+                        "count": h.count,
+                        "sum": h.sum,
+                        "buckets": h.cumulative(),
+                    }
+                    for labels, h in histograms.items()
+                }
+        return data
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, h in sorted(self._histograms[name].items()):
+                    for bound, count in h.cumulative():
+                        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                        bucket_labels = _format_labels(labels + (("le", le),))
+                        lines.append(f"{name}_bucket{bucket_labels} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.sum:g}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Resets all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
@@ -1,2 +1,46 @@
-# This directory will contain Pydantic models for API responses.
-# Initially empty.
+"""
+Typed response models for the heaviest NHL API payloads.
+
+Requires the optional `msgspec` dependency (`pip install nhlapi-tools[models]`);
+importing this package without it raises ImportError. The endpoint methods
+ending in `_typed` (e.g., `Game.get_play_by_play_typed`) decode responses
+into these models straight from the response bytes.
+"""
+
+from .base import Model, LocalizedName, decode, to_builtins
+from .game import (
+    PeriodDescriptor,
+    GameClock,
+    TeamSummary,
+    PlayDetails,
+    Play,
+    RosterSpot,
+    PlayByPlay,
+    SkaterGameStats,
+    GoalieGameStats,
+    TeamPlayerStats,
+    PlayerByGameStats,
+    Boxscore,
+)
+from .stats import Shift, ShiftCharts
+
+__all__ = [
+    "Model",
+    "LocalizedName",
+    "decode",
+    "to_builtins",
+    "PeriodDescriptor",
+    "GameClock",
+    "TeamSummary",
+    "PlayDetails",
+    "Play",
+    "RosterSpot",
+    "PlayByPlay",
+    "SkaterGameStats",
+    "GoalieGameStats",
+    "TeamPlayerStats",
+    "PlayerByGameStats",
+    "Boxscore",
+    "Shift",
+    "ShiftCharts",
+]
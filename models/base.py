@@ -0,0 +1,63 @@
+"""
+Shared base and decoding helpers for the typed response models.
+
+The models are msgspec Structs: slotted, compact objects decoded straight
+from the response bytes without building intermediate dictionaries.
+Requires the optional `msgspec` dependency (`pip install nhlapi-tools[models]`).
+"""
+
+import typing as t
+
+try:
+    import msgspec
+except ImportError as e:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "Typed models require msgspec: pip install nhlapi-tools[models]"
+    ) from e
+
+T = t.TypeVar("T")
+
+_decoders: t.Dict[type, "msgspec.json.Decoder[t.Any]"] = {}
+
+
+class Model(msgspec.Struct, rename="camel", kw_only=True, gc=False):
+    """
+    Base class for response models.
+
+    Attributes use snake_case and map to the API's camelCase keys. Keys the
+    model does not declare are skipped while decoding.
+    """
+
+
+class LocalizedName(Model):
+    """A localized string such as {"default": "Maple Leafs", "fr": "..."}."""
+
+    default: str = ""
+
+
+def decode(content: bytes, model: t.Type[T]) -> T:
+    """
+    Decodes a JSON response body directly into a model.
+
+    Args:
+        content: The raw response body.
+        model: The model class to decode into.
+
+    Returns:
+        An instance of `model`.
+
+    Raises:
+        ValueError: If the body is not valid JSON or does not match the model.
+    """
+    decoder = _decoders.get(model)
+    if decoder is None:
+        decoder = _decoders[model] = msgspec.json.Decoder(model)
+    try:
+        return decoder.decode(content)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+def to_builtins(obj: t.Any) -> t.Any:
+    """Converts a model back into plain dicts/lists using the API's key names."""
+    return msgspec.to_builtins(obj)
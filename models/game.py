@@ -0,0 +1,163 @@
+"""
+Typed models for gamecenter payloads (play-by-play and boxscore).
+"""
+
+import typing as t
+
+import msgspec
+
+from .base import LocalizedName, Model
+
+Number = t.Union[int, float, None]
+
+
+class PeriodDescriptor(Model):
+    number: int = 0
+    period_type: str = ""
+    max_regulation_periods: int = 3
+
+
+class GameClock(Model):
+    time_remaining: str = ""
+    seconds_remaining: int = 0
+    running: bool = False
+    in_intermission: bool = False
+
+
+class TeamSummary(Model):
+    id: int
+    abbrev: str = ""
+    name: t.Optional[LocalizedName] = None
+    score: t.Optional[int] = None
+    sog: t.Optional[int] = None
+
+
+class PlayDetails(Model):
+    """Event details; which fields are present depends on the event type."""
+
+    x_coord: Number = None
+    y_coord: Number = None
+    zone_code: t.Optional[str] = None
+    event_owner_team_id: t.Optional[int] = None
+    shot_type: t.Optional[str] = None
+    reason: t.Optional[str] = None
+    shooting_player_id: t.Optional[int] = None
+    scoring_player_id: t.Optional[int] = None
+    assist1_player_id: t.Optional[int] = None
+    assist2_player_id: t.Optional[int] = None
+    goalie_in_net_id: t.Optional[int] = None
+    blocking_player_id: t.Optional[int] = None
+    hitting_player_id: t.Optional[int] = None
+    hittee_player_id: t.Optional[int] = None
+    winning_player_id: t.Optional[int] = None
+    losing_player_id: t.Optional[int] = None
+    player_id: t.Optional[int] = None
+    committed_by_player_id: t.Optional[int] = None
+    drawn_by_player_id: t.Optional[int] = None
+    desc_key: t.Optional[str] = None
+    duration: t.Optional[int] = None
+    away_score: t.Optional[int] = None
+    home_score: t.Optional[int] = None
+    away_sog: t.Optional[int] = msgspec.field(default=None, name="awaySOG")
+    home_sog: t.Optional[int] = msgspec.field(default=None, name="homeSOG")
+
+
+class Play(Model):
+    event_id: int
+    sort_order: int = 0
+    type_code: int = 0
+    type_desc_key: str = ""
+    period_descriptor: PeriodDescriptor = msgspec.field(
+        default_factory=PeriodDescriptor
+    )
+    time_in_period: str = "00:00"
+    time_remaining: str = ""
+    situation_code: t.Optional[str] = None
+    home_team_defending_side: t.Optional[str] = None
+    details: t.Optional[PlayDetails] = None
+
+
+class RosterSpot(Model):
+    team_id: int
+    player_id: int
+    first_name: LocalizedName = msgspec.field(default_factory=LocalizedName)
+    last_name: LocalizedName = msgspec.field(default_factory=LocalizedName)
+    sweater_number: t.Optional[int] = None
+    position_code: str = ""
+
+
+class PlayByPlay(Model):
+    """Model for /v1/gamecenter/{game-id}/play-by-play."""
+
+    id: int
+    season: int = 0
+    game_type: int = 0
+    game_date: str = ""
+    game_state: str = ""
+    period_descriptor: t.Optional[PeriodDescriptor] = None
+    clock: t.Optional[GameClock] = None
+    away_team: t.Optional[TeamSummary] = None
+    home_team: t.Optional[TeamSummary] = None
+    plays: t.List[Play] = []
+    roster_spots: t.List[RosterSpot] = []
+
+
+class SkaterGameStats(Model):
+    player_id: int
+    sweater_number: t.Optional[int] = None
+    name: LocalizedName = msgspec.field(default_factory=LocalizedName)
+    position: str = ""
+    goals: int = 0
+    assists: int = 0
+    points: int = 0
+    plus_minus: int = 0
+    pim: int = 0
+    hits: int = 0
+    power_play_goals: int = 0
+    sog: int = 0
+    faceoff_winning_pctg: Number = None
+    toi: str = "00:00"
+    blocked_shots: int = 0
+    shifts: int = 0
+    giveaways: int = 0
+    takeaways: int = 0
+
+
+class GoalieGameStats(Model):
+    player_id: int
+    sweater_number: t.Optional[int] = None
+    name: LocalizedName = msgspec.field(default_factory=LocalizedName)
+    position: str = "G"
+    toi: str = "00:00"
+    goals_against: int = 0
+    save_pctg: Number = None
+    shots_against: int = 0
+    saves: int = 0
+    starter: t.Optional[bool] = None
+    decision: t.Optional[str] = None
+
+
+class TeamPlayerStats(Model):
+    forwards: t.List[SkaterGameStats] = []
+    defense: t.List[SkaterGameStats] = []
+    goalies: t.List[GoalieGameStats] = []
+
+
+class PlayerByGameStats(Model):
+    away_team: TeamPlayerStats = msgspec.field(default_factory=TeamPlayerStats)
+    home_team: TeamPlayerStats = msgspec.field(default_factory=TeamPlayerStats)
+
+
+class Boxscore(Model):
+    """Model for /v1/gamecenter/{game-id}/boxscore."""
+
+    id: int
+    season: int = 0
+    game_type: int = 0
+    game_date: str = ""
+    game_state: str = ""
+    period_descriptor: t.Optional[PeriodDescriptor] = None
+    clock: t.Optional[GameClock] = None
+    away_team: t.Optional[TeamSummary] = None
+    home_team: t.Optional[TeamSummary] = None
+    player_by_game_stats: t.Optional[PlayerByGameStats] = None
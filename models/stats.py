@@ -0,0 +1,33 @@
+"""
+Typed models for Stats API payloads (shift charts).
+"""
+
+import typing as t
+
+from .base import Model
+
+
+class Shift(Model):
+    id: int
+    game_id: int
+    player_id: int
+    team_id: int
+    team_abbrev: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    period: int = 0
+    shift_number: int = 0
+    start_time: str = "00:00"
+    end_time: str = "00:00"
+    duration: t.Optional[str] = None
+    type_code: int = 0
+    detail_code: int = 0
+    event_number: t.Optional[int] = None
+    event_description: t.Optional[str] = None
+
+
+class ShiftCharts(Model):
+    """Model for /{lang}/shiftcharts?cayenneExp=gameId={game-id}."""
+
+    data: t.List[Shift] = []
+    total: int = 0
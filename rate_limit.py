@@ -0,0 +1,116 @@
+"""
+Client-side rate limiting (token buckets) for the NHL API Wrapper.
+"""
+
+import asyncio
+import time
+import typing as t
+
+from .config import DEFAULT_RATE_LIMITS
+
+
+class TokenBucket:
+    """
+    An asynchronous token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`, which
+    bounds the size of a burst. Waiters are served in FIFO order, so a bucket
+    can safely be shared by many tasks (and many clients) on one event loop.
+    """
+
+    def __init__(self, rate: float, capacity: t.Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests per second).
+            capacity: Maximum number of stored tokens (burst size).
+                      Defaults to `rate`, but at least 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: t.Optional[asyncio.Lock] = None  # Created lazily inside the loop
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Takes tokens without waiting. Returns False if not enough are available."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Waits until `tokens` are available and takes them."""
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+
+class RateLimiter:
+    """
+    Per-host request pacing built from token buckets.
+
+    One instance can be injected into several clients (e.g., an NHLWebClient
+    and an NHLStatsClient) so that they share the same budget per host.
+
+    Usage:
+        >>> limiter = RateLimiter({"api-web.nhle.com": (20, 40), "api.nhle.com": (5, 10)})
+        >>> web = NHLWebClient(rate_limiter=limiter)
+        >>> stats = NHLStatsClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: t.Optional[t.Mapping[str, t.Tuple[float, float]]] = None,
+        default: t.Optional[t.Tuple[float, float]] = None,
+    ):
+        """
+        Args:
+            limits: Mapping of host name to (rate per second, burst capacity).
+                    Defaults to DEFAULT_RATE_LIMITS from config.
+            default: (rate, capacity) for hosts missing from `limits`.
+                     If None, requests to unknown hosts are not limited.
+        """
+        if limits is None:
+            limits = DEFAULT_RATE_LIMITS
+        self._buckets = {
+            host.lower(): TokenBucket(rate, capacity)
+            for host, (rate, capacity) in limits.items()
+        }
+        self._default = default
+
+    def bucket_for(self, host: str) -> t.Optional[TokenBucket]:
+        """Returns the bucket for a host, creating one from `default` if configured."""
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None and self._default is not None:
+            bucket = self._buckets[host] = TokenBucket(*self._default)
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """Waits for permission to send one request to `host`."""
+        bucket = self.bucket_for(host)
+        if bucket is not None:
+            await bucket.acquire()
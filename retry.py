@@ -0,0 +1,151 @@
+"""
+Retry policies with exponential backoff for the NHL API Wrapper.
+"""
+
+import datetime
+import email.utils
+import random
+import typing as t
+
+import httpx
+
+from .exceptions import NHLAPIError
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: t.Optional[str]) -> t.Optional[float]:
+    """
+    Parses a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date.
+
+    Returns:
+        The number of seconds to wait (never negative), or None if the
+        header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Describes when and how failed requests are retried.
+
+    Delays grow exponentially (`backoff_base * 2 ** (attempt - 1)`, capped at
+    `backoff_max`) with "full jitter" so that many clients failing together
+    do not retry in lockstep. A Retry-After header sent with a 429/503
+    response takes precedence over the computed delay.
+
+    Usage:
+        >>> policy = RetryPolicy(max_attempts=5, deadline=30.0)
+        >>> async with NHLWebClient(retry=policy) as client:
+        ...     await client.game.get_boxscore(2023020204)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        deadline: t.Optional[float] = 60.0,
+        retry_statuses: t.Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_network_errors: bool = True,
+        respect_retry_after: bool = True,
+        methods: t.Collection[str] = IDEMPOTENT_METHODS,
+    ):
+        """
+        Args:
+            max_attempts: Total number of attempts, including the first one.
+            backoff_base: Delay in seconds before the first retry (before jitter).
+            backoff_max: Upper bound for a single computed backoff delay.
+            jitter: If True, each delay is drawn uniformly from [0, delay].
+            deadline: Total time budget in seconds across all attempts and
+                      delays. A retry that would end past it is not attempted.
+                      None disables the budget.
+            retry_statuses: HTTP status codes considered transient.
+            retry_network_errors: Retry on httpx transport errors (connection
+                                  failures, timeouts).
+            respect_retry_after: Honour the Retry-After header when present.
+            methods: HTTP methods that may be retried (idempotent only by default).
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_network_errors = retry_network_errors
+        self.respect_retry_after = respect_retry_after
+        self.methods = frozenset(m.upper() for m in methods)
+
+    def allows(self, method: str) -> bool:
+        """Returns True if requests with this HTTP method may be retried."""
+        return self.max_attempts > 1 and method.upper() in self.methods
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Returns True if the exception represents a transient failure."""
+        if isinstance(exc, NHLAPIError):
+            return exc.status_code in self.retry_statuses
+        if isinstance(exc, httpx.TransportError):
+            return self.retry_network_errors
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the backoff delay after the given (1-based) failed attempt."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self, attempt: int, exc: BaseException, elapsed: float
+    ) -> t.Optional[float]:
+        """
+        Decides whether to retry after a failed attempt.
+
+        Args:
+            attempt: The number of attempts made so far (1-based).
+            exc: The exception raised by the last attempt.
+            elapsed: Seconds spent since the first attempt started.
+
+        Returns:
+            The delay in seconds before the next attempt, or None to give up.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        retry_after = getattr(exc, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            delay = retry_after
+            if self.jitter:
+                delay += random.uniform(0, self.backoff_base)
+        else:
+            delay = self.backoff(attempt)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"backoff_base={self.backoff_base}, backoff_max={self.backoff_max}, "
+            f"deadline={self.deadline})"
+        )
@@ -0,0 +1,116 @@
+"""
+A connection pool and request policies shared by the client facades.
+"""
+
+import typing as t
+
+from .config import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+)
+from .decoders import Decoder
+from .http_client import HttpClient, _build_async_client
+from .metrics import RequestHook
+from .tracing import TracerSpec
+
+if t.TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .cassette import Cassette
+    from .disk_cache import DiskCache
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+
+
+class NHLSession:
+    """
+    One connection pool, cache, retry policy, rate limiter, metrics hooks and
+    tracer for both APIs.
+
+    Without a session, NHLWebClient and NHLStatsClient each hold their own
+    httpx connection pool (with separate DNS caches and TLS sessions).
+    Passing the same session to both makes them share a single pool, and
+    its connection limits, while each facade keeps routing by its own base URL.
+
+    Usage:
+        >>> async with NHLSession(cache=ResponseCache(), rate_limiter=RateLimiter()) as session:
+        ...     web = NHLWebClient(session=session)
+        ...     stats = NHLStatsClient(session=session)
+        ...     await web.teams.get_standings_now()
+        ...     await stats.teams.get_info()
+    """
+
+    def __init__(
+        self,
+        cache: t.Optional["ResponseCache"] = None,
+        retry: t.Optional["RetryPolicy"] = None,
+        rate_limiter: t.Optional["RateLimiter"] = None,
+        decoder: t.Union[str, Decoder, None] = None,
+        disk_cache: t.Optional["DiskCache"] = None,
+        cassette: t.Optional["Cassette"] = None,
+        hooks: t.Optional[t.Sequence[RequestHook]] = None,
+        tracer: TracerSpec = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: t.Optional[bool] = None,
+        max_connections: t.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: t.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: t.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        **httpx_kwargs: t.Any,
+    ):
+        """
+        Args:
+            cache, retry, rate_limiter, decoder, disk_cache, hooks, tracer: Shared by
+                every client of the session (see NHLWebClient).
+            cassette: Optional Cassette recording or replaying the responses
+                of every client of the session.
+            timeout: Default request timeout in seconds.
+            http2, max_connections, max_keepalive_connections, keepalive_expiry:
+                Options of the shared connection pool (see HttpClient).
+            **httpx_kwargs: Additional arguments to pass to httpx.AsyncClient.
+        """
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.decoder = decoder
+        self.disk_cache = disk_cache
+        self.hooks = hooks
+        self.tracer = tracer
+        self._client = _build_async_client(
+            timeout,
+            http2,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            cassette,
+            **httpx_kwargs,
+        )
+        self._http_clients: t.Dict[str, HttpClient] = {}
+
+    def http_client(self, base_url: str) -> HttpClient:
+        """Returns the session's HttpClient for a base URL, creating it on first use."""
+        http_client = self._http_clients.get(base_url)
+        if http_client is None:
+            http_client = HttpClient(
+                base_url,
+                cache=self.cache,
+                retry=self.retry,
+                rate_limiter=self.rate_limiter,
+                decoder=self.decoder,
+                disk_cache=self.disk_cache,
+                client=self._client,
+                hooks=self.hooks,
+                tracer=self.tracer,
+            )
+            self._http_clients[base_url] = http_client
+        return http_client
+
+    async def aclose(self) -> None:
+        """Closes the shared connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "NHLSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
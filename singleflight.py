@@ -0,0 +1,53 @@
+"""
+In-flight request coalescing ("singleflight") for the NHL API Wrapper.
+"""
+
+import asyncio
+import typing as t
+
+T = t.TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one shared task.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result (or exception) instead of starting
+    their own. Once the task finishes, the key is released so later calls
+    start fresh work.
+
+    Cancelling one waiter does not cancel the shared task for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: t.Dict[t.Hashable, "asyncio.Future[t.Any]"] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of keys currently in flight."""
+        return len(self._calls)
+
+    async def do(self, key: t.Hashable, fn: t.Callable[[], t.Awaitable[T]]) -> T:
+        """
+        Runs `fn` for `key`, or joins the call already in flight for it.
+
+        Args:
+            key: Identifies equivalent calls (e.g., the canonical request URL).
+            fn: Zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The result of the shared call.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def _release(self, key: t.Hashable, task: "asyncio.Future[t.Any]") -> None:
+        """Forgets a finished call and marks its exception as retrieved."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
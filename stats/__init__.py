@@ -8,6 +8,14 @@ from .draft import StatsDraft
 from .season import StatsSeason
 from .game import StatsGame
 from .misc_stats import StatsMisc
+from .query import (
+    Expr,
+    Field,
+    game_date_range,
+    game_type,
+    player_ids,
+    season_range,
+)
 
 __all__ = [
     "StatsPlayers",
@@ -16,4 +24,10 @@ __all__ = [
     "StatsSeason",
     "StatsGame",
     "StatsMisc",
+    "Expr",
+    "Field",
+    "season_range",
+    "game_type",
+    "player_ids",
+    "game_date_range",
 ]
@@ -2,7 +2,25 @@
 Base class for all api.nhle.com/stats/rest endpoint categories.
 """
 
+import asyncio
+import collections
 import typing as t
+from ..config import (
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_SHARD_DAYS,
+    DEFAULT_STATS_PAGE_PREFETCH,
+    DEFAULT_STATS_PAGE_SIZE,
+)
+from ..tracing import endpoint_span
+from .planner import DateLike, merge_sorted, plan_shards
+from .query import (
+    CayenneExp,
+    Fields,
+    SortKeys,
+    fields_param,
+    sort_keys,
+    sort_param,
+)
 
 if t.TYPE_CHECKING:
     from ..http_client import HttpClient  # Avoid circular import
@@ -16,14 +34,184 @@ class StatsEndpointCategory:
         self._language = language  # Store the language code (e.g., 'en')
 
     async def _get(
-        self, path: str, params: t.Optional[t.Dict[str, t.Any]] = None
-    ) -> t.Dict[str, t.Any]:
+        self,
+        path: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        model: t.Optional[type] = None,
+        span_name: t.Optional[str] = None,
+    ) -> t.Any:
         """
         Helper method to perform a GET request via the client, prepending the language code.
+        Pass `model` to decode into a typed model instead of a dictionary.
+        With tracing enabled, the call is recorded in a span named after the
+        endpoint method given as `span_name`.
         """
         # Prepend the language code to the path for Stats API requests
         lang_path = f"/{self._language}{path}"
-        return await self._client.get(lang_path, params=params)
+        tracer = self._client.tracer
+        if tracer is None or span_name is None:
+            return await self._client.get(lang_path, params=params, model=model)
+        with endpoint_span(tracer, self, span_name):
+            return await self._client.get(lang_path, params=params, model=model)
+
+    @staticmethod
+    def _report_params(
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        start: t.Optional[int] = None,
+        limit: t.Optional[int] = None,
+    ) -> t.Dict[str, t.Any]:
+        """
+        Builds the query parameters shared by the skater/goalie/team report endpoints.
+
+        Filters may be query expressions (see stats.query), projections lists
+        of field names and `sort` a list of sort keys (sent as JSON, ignoring `dir`).
+        """
+        params: t.Dict[str, t.Any] = {}
+        if cayenne_exp:
+            params["cayenneExp"] = str(cayenne_exp)
+        if is_aggregate is not None:
+            params["isAggregate"] = str(is_aggregate).lower()
+        if is_game is not None:
+            params["isGame"] = str(is_game).lower()
+        if fact_cayenne_exp:
+            params["factCayenneExp"] = str(fact_cayenne_exp)
+        include, exclude = fields_param(include), fields_param(exclude)
+        if include:
+            params["include"] = include
+        if exclude:
+            params["exclude"] = exclude
+        if sort:
+            params["sort"] = sort_param(sort, dir)
+            if isinstance(sort, str) and dir:
+                params["dir"] = dir
+        if start is not None:
+            params["start"] = start
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    async def _paginate(
+        self,
+        path: str,
+        params: t.Dict[str, t.Any],
+        start: int = 0,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+        semaphore: t.Optional[asyncio.Semaphore] = None,
+        span_name: t.Optional[str] = None,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Pages through a report endpoint using `start`/`limit`, yielding rows one by one.
 
-    # You might add helper methods here later for common parameter patterns,
-    # like building cayenneExp strings, if needed.
+        The `total` returned with the first page is used to request up to
+        `prefetch` following pages concurrently while earlier rows are being
+        consumed, so at most `prefetch + 1` pages are held in memory at once.
+
+        Args:
+            path: The endpoint path (without language prefix).
+            params: Query parameters, excluding `start` and `limit`.
+            start: Offset of the first row to return.
+            page_size: Rows requested per page.
+            prefetch: Number of pages fetched ahead of the consumer (at least 1).
+            semaphore: Optional semaphore held while fetching each page, to
+                       bound the requests in flight across several pulls.
+            span_name: The endpoint method recorded in each page's span.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        prefetch = max(1, prefetch)
+
+        async def get_page(page_params: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+            if semaphore is None:
+                return await self._get(path, params=page_params, span_name=span_name)
+            async with semaphore:
+                return await self._get(path, params=page_params, span_name=span_name)
+
+        def fetch(offset: int) -> "asyncio.Future[t.Dict[str, t.Any]]":
+            page_params = {**params, "start": offset, "limit": page_size}
+            return asyncio.ensure_future(get_page(page_params))
+
+        first = await fetch(start)
+        rows = first.get("data", [])
+        total = first.get("total")
+        del first
+
+        if total is None:
+            # No total reported: fall back to sequential paging until a short page
+            offset = start
+            while True:
+                for row in rows:
+                    yield row
+                if len(rows) < page_size:
+                    return
+                offset += page_size
+                rows = (await fetch(offset)).get("data", [])
+
+        offsets = iter(range(start + page_size, total, page_size))
+        pending: t.Deque["asyncio.Future[t.Dict[str, t.Any]]"] = collections.deque()
+        try:
+            for offset in offsets:
+                pending.append(fetch(offset))
+                if len(pending) >= prefetch:
+                    break
+            for row in rows:
+                yield row
+            while pending:
+                page = await pending.popleft()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(fetch(next_offset))
+                rows = page.get("data", [])
+                del page
+                for row in rows:
+                    yield row
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_sharded(
+        self,
+        path: str,
+        cayenne_exp: t.Optional[CayenneExp],
+        seasons: t.Optional[t.Tuple[int, int]],
+        dates: t.Optional[t.Tuple[DateLike, DateLike]],
+        sort: t.Optional[SortKeys],
+        dir: t.Optional[str],
+        shard_days: int = DEFAULT_SHARD_DAYS,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+        span_name: t.Optional[str] = None,
+        **report_params: t.Any,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Splits a report pull into season or date-window shards (see
+        stats.planner), pages them concurrently and merges their rows in
+        `sort` order (shard order without a sort).
+
+        At most `concurrency` page requests are in flight across all shards,
+        on top of the client's rate limiter and retry policy.
+        """
+        keys = sort_keys(sort, dir)
+        shards = plan_shards(cayenne_exp, seasons, dates, shard_days)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        streams = [
+            self._paginate(
+                path,
+                self._report_params(shard, sort=keys or None, **report_params),
+                page_size=page_size,
+                prefetch=prefetch,
+                semaphore=semaphore,
+                span_name=span_name,
+            )
+            for shard in shards
+        ]
+        async for row in merge_sorted(streams, keys):
+            yield row
@@ -4,6 +4,7 @@ Endpoints related to Draft information (api.nhle.com/stats/rest/{lang}/draft)
 
 import typing as t
 from .base import StatsEndpointCategory
+from .query import CayenneExp, SortKeys, sort_param
 
 
 class StatsDraft(StatsEndpointCategory):
@@ -11,8 +12,8 @@ class StatsDraft(StatsEndpointCategory):
 
     async def get_draft_info(
         self,
-        cayenne_exp: t.Optional[str] = None,
-        sort: t.Optional[str] = None,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        sort: t.Optional[SortKeys] = None,
         limit: t.Optional[int] = None,
     ) -> t.Dict[str, t.Any]:
         """
@@ -20,8 +21,10 @@ class StatsDraft(StatsEndpointCategory):
         Ref: https://api.nhle.com/stats/rest/{lang}/draft
 
         Args:
-            cayenne_exp: Optional filter expression (e.g., "draftYear=2023").
-            sort: Optional field to sort by (e.g., "pickOverall").
+            cayenne_exp: Optional filter expression (e.g., "draftYear=2023"),
+                         a string or a query expression (see nhl_api.stats.query).
+            sort: Optional field to sort by (e.g., "pickOverall"), or a list of
+                  fields / (field, direction) pairs.
             limit: Optional limit.
 
         Returns:
@@ -29,9 +32,9 @@ class StatsDraft(StatsEndpointCategory):
         """
         params = {}
         if cayenne_exp:
-            params["cayenneExp"] = cayenne_exp
+            params["cayenneExp"] = str(cayenne_exp)
         if sort:
-            params["sort"] = sort
+            params["sort"] = sort_param(sort)
         if limit is not None:
             params["limit"] = limit
-        return await self._get("/draft", params=params)
+        return await self._get("/draft", params=params, span_name="get_draft_info")
@@ -5,6 +5,9 @@ Miscellaneous Endpoints from api.nhle.com/stats/rest
 import typing as t
 from .base import StatsEndpointCategory
 
+if t.TYPE_CHECKING:
+    from ..models import ShiftCharts
+
 
 class StatsMisc(StatsEndpointCategory):
     """Handles miscellaneous Stats API endpoints like config, ping, country, etc."""
@@ -17,7 +20,7 @@ class StatsMisc(StatsEndpointCategory):
         Returns:
             Dictionary containing configuration data.
         """
-        return await self._get("/config")
+        return await self._get("/config", span_name="get_configuration")
 
     async def ping(self) -> t.Dict[str, t.Any]:
         """
@@ -40,7 +43,7 @@ class StatsMisc(StatsEndpointCategory):
         Returns:
             Dictionary containing a list of countries.
         """
-        return await self._get("/country")
+        return await self._get("/country", span_name="get_country_info")
 
     async def get_shift_charts(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -54,7 +57,33 @@ class StatsMisc(StatsEndpointCategory):
             Dictionary containing shift chart data for the specified game.
         """
         params = {"cayenneExp": f"gameId={game_id}"}
-        return await self._get("/shiftcharts", params=params)
+        return await self._get(
+            "/shiftcharts", params=params, span_name="get_shift_charts"
+        )
+
+    async def get_shift_charts_typed(self, game_id: int) -> "ShiftCharts":
+        """
+        Retrieve shift charts for a specific game as a typed model.
+        Ref: https://api.nhle.com/stats/rest/{lang}/shiftcharts?cayenneExp=gameId={game_id}
+
+        Decodes straight from the response bytes into compact msgspec structs
+        (requires `msgspec`).
+
+        Args:
+            game_id: The NHL Game ID (e.g., 2023020204).
+
+        Returns:
+            A nhl_api.models.ShiftCharts instance.
+        """
+        from ..models import ShiftCharts
+
+        params = {"cayenneExp": f"gameId={game_id}"}
+        return await self._get(
+            "/shiftcharts",
+            params=params,
+            model=ShiftCharts,
+            span_name="get_shift_charts_typed",
+        )
 
     async def get_glossary(self) -> t.Dict[str, t.Any]:
         """
@@ -64,7 +93,7 @@ class StatsMisc(StatsEndpointCategory):
         Returns:
             Dictionary containing glossary terms and definitions.
         """
-        return await self._get("/glossary")
+        return await self._get("/glossary", span_name="get_glossary")
 
     async def get_content_module(self, template_key: str) -> t.Dict[str, t.Any]:
         """
@@ -78,4 +107,4 @@ class StatsMisc(StatsEndpointCategory):
             Dictionary containing content module data.
         """
         path = f"/content/module/{template_key}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_content_module")
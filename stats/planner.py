@@ -0,0 +1,161 @@
+"""
+Query planning for large stats report pulls: shards and sorted stream merging.
+
+A pull such as `isGame=true` skater rows over ten seasons is split into one
+request stream per season (or per date window). The shards are paged
+concurrently and their rows, each shard sorted by the server, are merged
+back into one stream in the requested order.
+"""
+
+import asyncio
+import datetime
+import heapq
+import typing as t
+
+from ..config import DEFAULT_SHARD_DAYS
+from ..utils import format_date
+from .query import CayenneExp, Expr, game_date_range, season_range
+
+Row = t.Dict[str, t.Any]
+DateLike = t.Union[str, datetime.date]
+
+_DONE = object()
+
+
+def seasons_between(first: int, last: int) -> t.List[int]:
+    """Returns the seasons from `first` to `last` inclusive, e.g. 20222023, 20232024."""
+    if last < first:
+        raise ValueError("The last season must not precede the first")
+    return [
+        year * 10000 + year + 1 for year in range(first // 10000, last // 10000 + 1)
+    ]
+
+
+def date_windows(
+    start: DateLike, end: DateLike, days: int
+) -> t.List[t.Tuple[datetime.date, datetime.date]]:
+    """Splits `start`..`end` (inclusive) into consecutive windows of `days` days."""
+    if days < 1:
+        raise ValueError("days must be at least 1")
+    first, last = (
+        datetime.datetime.strptime(format_date(d), "%Y-%m-%d").date()
+        for d in (start, end)
+    )
+    windows = []
+    while first <= last:
+        window_end = min(first + datetime.timedelta(days - 1), last)
+        windows.append((first, window_end))
+        first = window_end + datetime.timedelta(1)
+    return windows
+
+
+def plan_shards(
+    cayenne_exp: t.Optional[CayenneExp] = None,
+    seasons: t.Optional[t.Tuple[int, int]] = None,
+    dates: t.Optional[t.Tuple[DateLike, DateLike]] = None,
+    shard_days: int = DEFAULT_SHARD_DAYS,
+) -> t.List[Expr]:
+    """
+    Returns one filter per shard: a season, or a window of `shard_days` days,
+    combined with `cayenne_exp`.
+
+    Raises:
+        ValueError: Unless exactly one of `seasons` and `dates` is given.
+    """
+    if (seasons is None) == (dates is None):
+        raise ValueError("Pass either seasons=(first, last) or dates=(start, end)")
+    if seasons is not None:
+        shards = [season_range(season) for season in seasons_between(*seasons)]
+    else:
+        shards = [
+            game_date_range(*window) for window in date_windows(*dates, shard_days)
+        ]
+    if cayenne_exp:
+        return [shard & cayenne_exp for shard in shards]
+    return shards
+
+
+class SortKey:
+    """Orders rows by several fields, each ascending or descending (None first)."""
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: t.Tuple[t.Any, ...], descending: t.Tuple[bool, ...]):
+        self.values = values
+        self.descending = descending
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SortKey) and self.values == other.values
+
+    def __lt__(self, other: "SortKey") -> bool:
+        for a, b, descending in zip(self.values, other.values, self.descending):
+            if a == b:
+                continue
+            if a is None or b is None:
+                return (a is None) != descending
+            return a > b if descending else a < b
+        return False
+
+
+def row_key(
+    keys: t.Sequence[t.Tuple[str, str]],
+) -> t.Callable[[Row], t.Optional[SortKey]]:
+    """Returns a function computing the SortKey of a row for (field, direction) keys."""
+    if not keys:
+        return lambda row: None  # Shard order
+    fields = [field for field, _ in keys]
+    descending = tuple(direction == "DESC" for _, direction in keys)
+    return lambda row: SortKey(tuple(row.get(f) for f in fields), descending)
+
+
+async def _next(iterator: t.AsyncIterator[Row]) -> t.Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _DONE
+
+
+async def merge_sorted(
+    iterators: t.Sequence[t.AsyncIterator[Row]],
+    keys: t.Sequence[t.Tuple[str, str]],
+) -> t.AsyncIterator[Row]:
+    """
+    Merges row streams that are each sorted by `keys` into one sorted stream.
+
+    This is the async counterpart of `heapq.merge`: the first row of every
+    stream is fetched concurrently, then a heap of one head per stream picks
+    the next row. Without keys, streams are concatenated in order. Ties are
+    broken by stream order, so the merge is stable. Rows must contain the
+    sort fields (keep them in any `include` projection).
+    """
+    key = row_key(keys)
+    try:
+        heads = [asyncio.ensure_future(_next(iterator)) for iterator in iterators]
+        try:
+            await asyncio.gather(*heads)
+        except BaseException:
+            # Stop the other streams before closing them, so that the first
+            # error is raised rather than aclose() on a running generator
+            for head in heads:
+                head.cancel()
+            await asyncio.gather(*heads, return_exceptions=True)
+            raise
+        heap = [
+            (key(row), index, row)
+            for index, row in enumerate(head.result() for head in heads)
+            if row is not _DONE
+        ]
+        heapq.heapify(heap)
+        while heap:
+            _, index, row = heap[0]
+            yield row
+            row = await _next(iterators[index])
+            if row is _DONE:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (key(row), index, row))
+    finally:
+        for iterator in iterators:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -4,6 +4,14 @@ Endpoints related to Players (api.nhle.com/stats/rest/{lang}/players/*, etc.)
 
 import typing as t
 from .base import StatsEndpointCategory
+from .planner import DateLike
+from .query import CayenneExp, Fields, SortKeys
+from ..config import (
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_SHARD_DAYS,
+    DEFAULT_STATS_PAGE_PREFETCH,
+    DEFAULT_STATS_PAGE_SIZE,
+)
 
 # Common report names can be defined as constants if desired
 # e.g., SKATER_SUMMARY_REPORT = "summary"
@@ -45,7 +53,7 @@ class StatsPlayers(StatsEndpointCategory):
         Returns:
             Dictionary containing a list of players and total count.
         """
-        return await self._get("/players")
+        return await self._get("/players", span_name="get_info")
 
     # === Skaters ===
     async def get_skater_leaders(self, attribute: str) -> t.Dict[str, t.Any]:
@@ -60,7 +68,7 @@ class StatsPlayers(StatsEndpointCategory):
             Dictionary containing skater leaders for the specified attribute.
         """
         path = f"/leaders/skaters/{attribute}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_skater_leaders")
 
     async def get_skater_milestones(self) -> t.Dict[str, t.Any]:
         """
@@ -70,18 +78,18 @@ class StatsPlayers(StatsEndpointCategory):
         Returns:
             Dictionary containing skater milestone data.
         """
-        return await self._get("/milestones/skaters")
+        return await self._get("/milestones/skaters", span_name="get_skater_milestones")
 
     async def get_skater_stats(
         self,
         report: str,
-        cayenne_exp: str,  # Required for most reports
+        cayenne_exp: CayenneExp,  # Required for most reports
         is_aggregate: t.Optional[bool] = None,
         is_game: t.Optional[bool] = None,
-        fact_cayenne_exp: t.Optional[str] = None,
-        include: t.Optional[str] = None,
-        exclude: t.Optional[str] = None,
-        sort: t.Optional[str] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
         dir: t.Optional[str] = None,
         start: t.Optional[int] = None,
         limit: t.Optional[int] = None,
@@ -93,13 +101,15 @@ class StatsPlayers(StatsEndpointCategory):
         Args:
             report: The name of the report (e.g., "summary", "bios", "realtime", "faceoffwins", etc.).
             cayenne_exp: REQUIRED filter expression (e.g., "seasonId=20232024 and gameTypeId=2", "playerId=8478402").
+                         A string or a query expression (see nhl_api.stats.query).
                          See API docs or experiment for syntax.
             is_aggregate: Aggregate results (boolean).
             is_game: Filter by game (boolean).
-            fact_cayenne_exp: Additional filter expression.
-            include: Fields to include.
-            exclude: Fields to exclude.
-            sort: Field to sort by (e.g., "points", "goals").
+            fact_cayenne_exp: Additional filter expression (string or expression).
+            include: Fields to include (comma-separated, or a list).
+            exclude: Fields to exclude (comma-separated, or a list).
+            sort: Field to sort by (e.g., "points", "goals"), or a list of
+                  fields / (field, direction) pairs for a multi-key sort.
             dir: Sort direction ("ASC" or "DESC").
             start: Pagination start index.
             limit: Pagination limit (-1 for all).
@@ -107,28 +117,142 @@ class StatsPlayers(StatsEndpointCategory):
         Returns:
             Dictionary containing skater stats for the specified report and filters.
         """
-        params = {"cayenneExp": cayenne_exp}  # Required param
-        if is_aggregate is not None:
-            params["isAggregate"] = str(is_aggregate).lower()
-        if is_game is not None:
-            params["isGame"] = str(is_game).lower()
-        if fact_cayenne_exp:
-            params["factCayenneExp"] = fact_cayenne_exp
-        if include:
-            params["include"] = include
-        if exclude:
-            params["exclude"] = exclude
-        if sort:
-            params["sort"] = sort
-        if dir:
-            params["dir"] = dir
-        if start is not None:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._report_params(
+            cayenne_exp,  # Required param
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+            start=start,
+            limit=limit,
+        )
 
         path = f"/skater/{report}"
-        return await self._get(path, params=params)
+        return await self._get(path, params=params, span_name="get_skater_stats")
+
+    async def iter_skater_stats(
+        self,
+        report: str,
+        cayenne_exp: CayenneExp,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        start: int = 0,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream skater stats rows for a report, paging through `start`/`limit` automatically.
+        Ref: https://api.nhle.com/stats/rest/{lang}/skater/{report}
+
+        Unlike `get_skater_stats(limit=-1)`, rows are yielded one at a time and only
+        a few pages are held in memory, which keeps large per-game
+        (`is_game=True`) pulls flat in memory. Pass a `sort` so that paging is
+        stable across requests.
+
+        Args:
+            report, cayenne_exp, is_aggregate, is_game, fact_cayenne_exp,
+            include, exclude, sort, dir: See `get_skater_stats`.
+            start: Offset of the first row to return.
+            page_size: Rows requested per page.
+            prefetch: Number of pages fetched concurrently ahead of the consumer.
+
+        Yields:
+            Individual rows from the report's `data` list.
+        """
+        params = self._report_params(
+            cayenne_exp,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+        )
+        async for row in self._paginate(
+            f"/skater/{report}",
+            params,
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+            span_name="iter_skater_stats",
+        ):
+            yield row
+
+    async def iter_skater_stats_sharded(
+        self,
+        report: str,
+        seasons: t.Optional[t.Tuple[int, int]] = None,
+        dates: t.Optional[t.Tuple[DateLike, DateLike]] = None,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        shard_days: int = DEFAULT_SHARD_DAYS,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream skater stats rows for a large pull, split into one query per season
+        or date window that run concurrently and are merged in `sort` order.
+        Ref: https://api.nhle.com/stats/rest/{lang}/skater/{report}
+
+        Prefer this to `iter_skater_stats` for multi-season `is_game=True`
+        pulls, which time out or return huge payloads as a single query.
+
+        Args:
+            report: The name of the report (e.g., "summary").
+            seasons: (first, last) seasons to pull, one shard per season
+                     (e.g., (20142015, 20232024)).
+            dates: (start, end) game dates to pull, one shard per `shard_days`
+                   days. Pass either `seasons` or `dates`.
+            cayenne_exp: Optional extra filter applied to every shard.
+            is_aggregate, is_game, fact_cayenne_exp, include, exclude, sort,
+            dir: See `get_skater_stats`. Rows are merged across shards in
+                 `sort` order (shard order if no sort is given).
+            shard_days: Days per shard when splitting by `dates`.
+            concurrency: Maximum page requests in flight across all shards.
+            page_size: Rows requested per page.
+            prefetch: Pages fetched ahead of the consumer, per shard.
+
+        Yields:
+            Individual rows of all shards.
+
+        Raises:
+            ValueError: Unless exactly one of `seasons` and `dates` is given.
+        """
+        async for row in self._iter_sharded(
+            f"/skater/{report}",
+            cayenne_exp,
+            seasons,
+            dates,
+            sort,
+            dir,
+            shard_days=shard_days,
+            concurrency=concurrency,
+            page_size=page_size,
+            prefetch=prefetch,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            span_name="iter_skater_stats_sharded",
+        ):
+            yield row
 
     # === Goalies ===
     async def get_goalie_leaders(self, attribute: str) -> t.Dict[str, t.Any]:
@@ -143,18 +267,18 @@ class StatsPlayers(StatsEndpointCategory):
             Dictionary containing goalie leaders for the specified attribute.
         """
         path = f"/leaders/goalies/{attribute}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_goalie_leaders")
 
     async def get_goalie_stats(
         self,
         report: str,
-        cayenne_exp: str,  # Required for most reports
+        cayenne_exp: CayenneExp,  # Required for most reports
         is_aggregate: t.Optional[bool] = None,
         is_game: t.Optional[bool] = None,
-        fact_cayenne_exp: t.Optional[str] = None,
-        include: t.Optional[str] = None,
-        exclude: t.Optional[str] = None,
-        sort: t.Optional[str] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
         dir: t.Optional[str] = None,
         start: t.Optional[int] = None,
         limit: t.Optional[int] = None,
@@ -166,13 +290,15 @@ class StatsPlayers(StatsEndpointCategory):
         Args:
             report: The name of the report (e.g., "summary", "bios", "realtime", etc.).
             cayenne_exp: REQUIRED filter expression (e.g., "seasonId=20232024 and gameTypeId=2", "playerId=8479394").
+                         A string or a query expression (see nhl_api.stats.query).
                          See API docs or experiment for syntax.
             is_aggregate: Aggregate results (boolean).
             is_game: Filter by game (boolean).
-            fact_cayenne_exp: Additional filter expression.
-            include: Fields to include.
-            exclude: Fields to exclude.
-            sort: Field to sort by (e.g., "wins", "gaa").
+            fact_cayenne_exp: Additional filter expression (string or expression).
+            include: Fields to include (comma-separated, or a list).
+            exclude: Fields to exclude (comma-separated, or a list).
+            sort: Field to sort by (e.g., "wins", "gaa"), or a list of
+                  fields / (field, direction) pairs for a multi-key sort.
             dir: Sort direction ("ASC" or "DESC").
             start: Pagination start index.
             limit: Pagination limit (-1 for all).
@@ -180,28 +306,142 @@ class StatsPlayers(StatsEndpointCategory):
         Returns:
             Dictionary containing goalie stats for the specified report and filters.
         """
-        params = {"cayenneExp": cayenne_exp}  # Required param
-        if is_aggregate is not None:
-            params["isAggregate"] = str(is_aggregate).lower()
-        if is_game is not None:
-            params["isGame"] = str(is_game).lower()
-        if fact_cayenne_exp:
-            params["factCayenneExp"] = fact_cayenne_exp
-        if include:
-            params["include"] = include
-        if exclude:
-            params["exclude"] = exclude
-        if sort:
-            params["sort"] = sort
-        if dir:
-            params["dir"] = dir
-        if start is not None:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._report_params(
+            cayenne_exp,  # Required param
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+            start=start,
+            limit=limit,
+        )
 
         path = f"/goalie/{report}"
-        return await self._get(path, params=params)
+        return await self._get(path, params=params, span_name="get_goalie_stats")
+
+    async def iter_goalie_stats(
+        self,
+        report: str,
+        cayenne_exp: CayenneExp,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        start: int = 0,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream goalie stats rows for a report, paging through `start`/`limit` automatically.
+        Ref: https://api.nhle.com/stats/rest/{lang}/goalie/{report}
+
+        Unlike `get_goalie_stats(limit=-1)`, rows are yielded one at a time and only
+        a few pages are held in memory, which keeps large per-game
+        (`is_game=True`) pulls flat in memory. Pass a `sort` so that paging is
+        stable across requests.
+
+        Args:
+            report, cayenne_exp, is_aggregate, is_game, fact_cayenne_exp,
+            include, exclude, sort, dir: See `get_goalie_stats`.
+            start: Offset of the first row to return.
+            page_size: Rows requested per page.
+            prefetch: Number of pages fetched concurrently ahead of the consumer.
+
+        Yields:
+            Individual rows from the report's `data` list.
+        """
+        params = self._report_params(
+            cayenne_exp,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+        )
+        async for row in self._paginate(
+            f"/goalie/{report}",
+            params,
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+            span_name="iter_goalie_stats",
+        ):
+            yield row
+
+    async def iter_goalie_stats_sharded(
+        self,
+        report: str,
+        seasons: t.Optional[t.Tuple[int, int]] = None,
+        dates: t.Optional[t.Tuple[DateLike, DateLike]] = None,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        shard_days: int = DEFAULT_SHARD_DAYS,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream goalie stats rows for a large pull, split into one query per season
+        or date window that run concurrently and are merged in `sort` order.
+        Ref: https://api.nhle.com/stats/rest/{lang}/goalie/{report}
+
+        Prefer this to `iter_goalie_stats` for multi-season `is_game=True`
+        pulls, which time out or return huge payloads as a single query.
+
+        Args:
+            report: The name of the report (e.g., "summary").
+            seasons: (first, last) seasons to pull, one shard per season
+                     (e.g., (20142015, 20232024)).
+            dates: (start, end) game dates to pull, one shard per `shard_days`
+                   days. Pass either `seasons` or `dates`.
+            cayenne_exp: Optional extra filter applied to every shard.
+            is_aggregate, is_game, fact_cayenne_exp, include, exclude, sort,
+            dir: See `get_goalie_stats`. Rows are merged across shards in
+                 `sort` order (shard order if no sort is given).
+            shard_days: Days per shard when splitting by `dates`.
+            concurrency: Maximum page requests in flight across all shards.
+            page_size: Rows requested per page.
+            prefetch: Pages fetched ahead of the consumer, per shard.
+
+        Yields:
+            Individual rows of all shards.
+
+        Raises:
+            ValueError: Unless exactly one of `seasons` and `dates` is given.
+        """
+        async for row in self._iter_sharded(
+            f"/goalie/{report}",
+            cayenne_exp,
+            seasons,
+            dates,
+            sort,
+            dir,
+            shard_days=shard_days,
+            concurrency=concurrency,
+            page_size=page_size,
+            prefetch=prefetch,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            span_name="iter_goalie_stats_sharded",
+        ):
+            yield row
 
     async def get_goalie_milestones(self) -> t.Dict[str, t.Any]:
         """
@@ -211,4 +451,4 @@ class StatsPlayers(StatsEndpointCategory):
         Returns:
             Dictionary containing goalie milestone data.
         """
-        return await self._get("/milestones/goalies")
+        return await self._get("/milestones/goalies", span_name="get_goalie_milestones")
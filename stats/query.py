@@ -0,0 +1,313 @@
+"""
+Composable cayenneExp filters and report query parameters for the stats API.
+
+Filtering, projecting (`include`/`exclude`) and sorting on the server keeps
+responses small, instead of fetching whole reports and filtering in Python.
+
+Usage:
+    >>> where = season_range(20202021, 20232024) & game_type(2) & player_ids([8478402, 8477934])
+    >>> str(where)
+    'seasonId>=20202021 and seasonId<=20232024 and gameTypeId=2 and playerId in (8478402,8477934)'
+    >>> await client.players.get_skater_stats(
+    ...     "summary", where, include=["playerId", "points"], sort=[("points", "DESC")]
+    ... )
+"""
+
+import datetime
+import json
+import typing as t
+
+from ..utils import format_date
+
+Value = t.Union[int, float, str, bool, datetime.date]
+
+
+def _literal(value: Value) -> str:
+    """Renders a value as a cayenneExp literal (strings and dates are quoted)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.date):
+        value = format_date(value)
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    raise TypeError(f"Unsupported cayenneExp value: {value!r}")
+
+
+class Expr:
+    """
+    Base class of cayenneExp expressions.
+
+    Combine with `&` (and), `|` (or) and `~` (not); `str()` returns the
+    expression to pass as `cayenne_exp`. Plain strings can be combined with
+    expressions and are parenthesized as needed.
+    """
+
+    __slots__ = ()
+    # Binding strength when nested: 0 raw text, 1 or, 2 and, 3 atoms
+    precedence = 3
+
+    def __and__(self, other: t.Union["Expr", str]) -> "Expr":
+        return And(self, _as_expr(other))
+
+    def __rand__(self, other: str) -> "Expr":
+        return And(_as_expr(other), self)
+
+    def __or__(self, other: t.Union["Expr", str]) -> "Expr":
+        return Or(self, _as_expr(other))
+
+    def __ror__(self, other: str) -> "Expr":
+        return Or(_as_expr(other), self)
+
+    def __invert__(self) -> "Expr":
+        return Not(self)
+
+    def nested(self, precedence: int) -> str:
+        """Renders the expression as an operand of an operator of `precedence`."""
+        text = str(self)
+        return f"({text})" if self.precedence < precedence else text
+
+    def __str__(self) -> str:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+def _as_expr(value: t.Union[Expr, str]) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    if isinstance(value, str):
+        return Raw(value)
+    raise TypeError(f"Cannot combine {value!r} with a cayenneExp expression")
+
+
+class Raw(Expr):
+    """A hand-written cayenneExp string."""
+
+    __slots__ = ("text",)
+    precedence = 0
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class Comparison(Expr):
+    """A field compared with a value, e.g. `seasonId>=20202021`."""
+
+    __slots__ = ("field", "op", "value")
+
+    def __init__(self, field: str, op: str, value: Value):
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __str__(self) -> str:
+        literal = _literal(self.value)
+        if self.op.isalpha():  # like, likeIgnoreCase
+            return f"{self.field} {self.op} {literal}"
+        return f"{self.field}{self.op}{literal}"
+
+
+class In(Expr):
+    """A field matching any of several values, e.g. `playerId in (1,2)`."""
+
+    __slots__ = ("field", "values")
+
+    def __init__(self, field: str, values: t.Iterable[Value]):
+        self.field = field
+        self.values = tuple(values)
+        if not self.values:
+            raise ValueError(f"No values given for {field} in (...)")
+
+    def __str__(self) -> str:
+        return f"{self.field} in ({','.join(_literal(v) for v in self.values)})"
+
+
+class _Junction(Expr):
+    """Operands joined by `keyword` ("and" / "or")."""
+
+    __slots__ = ("operands",)
+    keyword = ""
+
+    def __init__(self, *operands: Expr):
+        flattened: t.List[Expr] = []
+        for operand in operands:
+            if type(operand) is type(self):
+                flattened.extend(operand.operands)
+            else:
+                flattened.append(operand)
+        self.operands = tuple(flattened)
+
+    def __str__(self) -> str:
+        # Operands bind tighter than the operator, so "and" inside "or" needs no parentheses
+        return f" {self.keyword} ".join(
+            operand.nested(self.precedence + 1) for operand in self.operands
+        )
+
+
+class And(_Junction):
+    __slots__ = ()
+    precedence = 2
+    keyword = "and"
+
+
+class Or(_Junction):
+    __slots__ = ()
+    precedence = 1
+    keyword = "or"
+
+
+class Not(Expr):
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def __str__(self) -> str:
+        return f"not ({self.operand})"
+
+
+class Field:
+    """
+    A report field, comparable with values to build expressions.
+
+    Usage:
+        >>> str((Field("points") >= 50) & Field("positionCode").in_(["C", "L", "R"]))
+        'points>=50 and positionCode in ("C","L","R")'
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __eq__(self, value: Value) -> Expr:  # type: ignore[override]
+        return Comparison(self.name, "=", value)
+
+    def __ne__(self, value: Value) -> Expr:  # type: ignore[override]
+        return Comparison(self.name, "!=", value)
+
+    def __lt__(self, value: Value) -> Expr:
+        return Comparison(self.name, "<", value)
+
+    def __le__(self, value: Value) -> Expr:
+        return Comparison(self.name, "<=", value)
+
+    def __gt__(self, value: Value) -> Expr:
+        return Comparison(self.name, ">", value)
+
+    def __ge__(self, value: Value) -> Expr:
+        return Comparison(self.name, ">=", value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def in_(self, values: t.Iterable[Value]) -> Expr:
+        """Matches any of `values` (a single value becomes an equality)."""
+        values = tuple(values)
+        if len(values) == 1:
+            return self == values[0]
+        return In(self.name, values)
+
+    def between(self, low: Value, high: Value) -> Expr:
+        """Matches `low <= field <= high`."""
+        return (self >= low) & (self <= high)
+
+    def like(self, pattern: str, ignore_case: bool = True) -> Expr:
+        """Matches a pattern with `%` wildcards, e.g. `Field("skaterFullName").like("%mat%")`."""
+        return Comparison(
+            self.name, "likeIgnoreCase" if ignore_case else "like", pattern
+        )
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r})"
+
+
+def season_range(first: int, last: t.Optional[int] = None) -> Expr:
+    """Seasons from `first` to `last` inclusive (e.g., 20202021), or only `first`."""
+    season = Field("seasonId")
+    if last is None or last == first:
+        return season == first
+    return season.between(first, last)
+
+
+def game_type(*game_type_ids: int) -> Expr:
+    """Game types (2 = regular season, 3 = playoffs)."""
+    return Field("gameTypeId").in_(game_type_ids)
+
+
+def player_ids(ids: t.Iterable[int]) -> Expr:
+    """Rows of the given players."""
+    return Field("playerId").in_(ids)
+
+
+def game_date_range(
+    start: t.Union[str, datetime.date, None] = None,
+    end: t.Union[str, datetime.date, None] = None,
+) -> Expr:
+    """
+    Games played between `start` and `end` inclusive (YYYY-MM-DD strings or
+    dates); either bound may be omitted.
+    """
+    if start is None and end is None:
+        raise ValueError("game_date_range requires a start or an end date")
+    clauses = []
+    if start is not None:
+        clauses.append(Field("gameDate") >= format_date(start))
+    if end is not None:
+        if isinstance(end, str):
+            end = datetime.datetime.strptime(format_date(end), "%Y-%m-%d").date()
+        # Strictly before the next day, which also covers timestamped values
+        clauses.append(Field("gameDate") < format_date(end + datetime.timedelta(1)))
+    return clauses[0] if len(clauses) == 1 else And(*clauses)
+
+
+CayenneExp = t.Union[str, Expr]
+Fields = t.Union[str, t.Sequence[str]]
+SortKeys = t.Union[str, t.Sequence[t.Union[str, t.Tuple[str, str]]]]
+
+
+def fields_param(fields: t.Optional[Fields]) -> t.Optional[str]:
+    """Renders an `include`/`exclude` projection (comma-separated field names)."""
+    if fields is None or isinstance(fields, str):
+        return fields or None
+    return ",".join(fields)
+
+
+def sort_keys(
+    sort: t.Optional[SortKeys], dir: t.Optional[str] = None
+) -> t.List[t.Tuple[str, str]]:
+    """Normalizes `sort`/`dir` into (field, "ASC" | "DESC") pairs."""
+    if not sort:
+        return []
+    if isinstance(sort, str):
+        sort = [sort]
+    keys = []
+    for key in sort:
+        field, direction = (key, dir or "ASC") if isinstance(key, str) else key
+        keys.append((field, direction.upper()))
+    return keys
+
+
+def sort_param(
+    sort: t.Optional[SortKeys], dir: t.Optional[str] = None
+) -> t.Optional[str]:
+    """
+    Renders a `sort` parameter.
+
+    A single field name is returned as is (with `dir` sent separately). A
+    sequence of field names or (field, direction) pairs becomes the JSON list
+    of sort keys accepted by the stats API, each defaulting to `dir` or "ASC".
+    """
+    if sort is None or isinstance(sort, str):
+        return sort or None
+    keys = [
+        {"property": field, "direction": direction}
+        for field, direction in sort_keys(sort, dir)
+    ]
+    return json.dumps(keys, separators=(",", ":"))
@@ -17,7 +17,7 @@ class StatsSeason(StatsEndpointCategory):
         Returns:
             Dictionary containing component season data.
         """
-        return await self._get("/componentSeason")
+        return await self._get("/componentSeason", span_name="get_component_season")
 
     async def get_season_info(self) -> t.Dict[str, t.Any]:
         """
@@ -27,4 +27,4 @@ class StatsSeason(StatsEndpointCategory):
         Returns:
             Dictionary containing a list of seasons.
         """
-        return await self._get("/season")
+        return await self._get("/season", span_name="get_season_info")
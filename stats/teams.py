@@ -4,6 +4,14 @@ Endpoints related to Teams (api.nhle.com/stats/rest/{lang}/team/*, etc.)
 
 import typing as t
 from .base import StatsEndpointCategory
+from .planner import DateLike
+from .query import CayenneExp, Fields, SortKeys
+from ..config import (
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_SHARD_DAYS,
+    DEFAULT_STATS_PAGE_PREFETCH,
+    DEFAULT_STATS_PAGE_SIZE,
+)
 
 # Common report names can be defined as constants if desired
 # e.g., TEAM_SUMMARY_REPORT = "summary"
@@ -20,7 +28,7 @@ class StatsTeams(StatsEndpointCategory):
         Returns:
             Dictionary containing a list of teams and total count.
         """
-        return await self._get("/team")
+        return await self._get("/team", span_name="get_info")
 
     async def get_by_id(self, team_id: int) -> t.Dict[str, t.Any]:
         """
@@ -39,7 +47,7 @@ class StatsTeams(StatsEndpointCategory):
         # path = f"/team/id/{team_id}" # This path seems less likely for REST/stats
         # Let's assume it's filtered via cayenneExp on the main /team endpoint
         params = {"cayenneExp": f"id={team_id}"}
-        return await self._get("/team", params=params)
+        return await self._get("/team", params=params, span_name="get_by_id")
         # If the above doesn't work, try the path approach:
         # path = f"/team/id/{team_id}"
         # return await self._get(path)
@@ -47,13 +55,15 @@ class StatsTeams(StatsEndpointCategory):
     async def get_team_stats(
         self,
         report: str,
-        cayenne_exp: t.Optional[str] = None,  # Usually Required for meaningful data
+        cayenne_exp: t.Optional[
+            CayenneExp
+        ] = None,  # Usually Required for meaningful data
         is_aggregate: t.Optional[bool] = None,
         is_game: t.Optional[bool] = None,
-        fact_cayenne_exp: t.Optional[str] = None,
-        include: t.Optional[str] = None,
-        exclude: t.Optional[str] = None,
-        sort: t.Optional[str] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
         dir: t.Optional[str] = None,
         start: t.Optional[int] = None,
         limit: t.Optional[int] = None,
@@ -65,12 +75,14 @@ class StatsTeams(StatsEndpointCategory):
         Args:
             report: The name of the report (e.g., "summary", "powerplay", "penaltykill", "realtime").
             cayenne_exp: Filter expression (e.g., "seasonId=20232024 and gameTypeId=2", "teamId=10"). Usually required.
+                         A string or a query expression (see nhl_api.stats.query).
             is_aggregate: Aggregate results (boolean).
             is_game: Filter by game (boolean).
-            fact_cayenne_exp: Additional filter expression.
-            include: Fields to include.
-            exclude: Fields to exclude.
-            sort: Field to sort by (e.g., "points", "wins", "goalsFor").
+            fact_cayenne_exp: Additional filter expression (string or expression).
+            include: Fields to include (comma-separated, or a list).
+            exclude: Fields to exclude (comma-separated, or a list).
+            sort: Field to sort by (e.g., "points", "wins", "goalsFor"), or a list of
+                  fields / (field, direction) pairs for a multi-key sort.
             dir: Sort direction ("ASC" or "DESC").
             start: Pagination start index.
             limit: Pagination limit (-1 for all).
@@ -78,30 +90,142 @@ class StatsTeams(StatsEndpointCategory):
         Returns:
             Dictionary containing team stats for the specified report and filters.
         """
-        params = {}
-        if cayenne_exp:
-            params["cayenneExp"] = cayenne_exp  # Often required
-        if is_aggregate is not None:
-            params["isAggregate"] = str(is_aggregate).lower()
-        if is_game is not None:
-            params["isGame"] = str(is_game).lower()
-        if fact_cayenne_exp:
-            params["factCayenneExp"] = fact_cayenne_exp
-        if include:
-            params["include"] = include
-        if exclude:
-            params["exclude"] = exclude
-        if sort:
-            params["sort"] = sort
-        if dir:
-            params["dir"] = dir
-        if start is not None:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._report_params(
+            cayenne_exp,  # Often required
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+            start=start,
+            limit=limit,
+        )
 
         path = f"/team/{report}"
-        return await self._get(path, params=params)
+        return await self._get(path, params=params, span_name="get_team_stats")
+
+    async def iter_team_stats(
+        self,
+        report: str,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        start: int = 0,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream team stats rows for a report, paging through `start`/`limit` automatically.
+        Ref: https://api.nhle.com/stats/rest/{lang}/team/{report}
+
+        Unlike `get_team_stats(limit=-1)`, rows are yielded one at a time and only
+        a few pages are held in memory, which keeps large per-game
+        (`is_game=True`) pulls flat in memory. Pass a `sort` so that paging is
+        stable across requests.
+
+        Args:
+            report, cayenne_exp, is_aggregate, is_game, fact_cayenne_exp,
+            include, exclude, sort, dir: See `get_team_stats`.
+            start: Offset of the first row to return.
+            page_size: Rows requested per page.
+            prefetch: Number of pages fetched concurrently ahead of the consumer.
+
+        Yields:
+            Individual rows from the report's `data` list.
+        """
+        params = self._report_params(
+            cayenne_exp,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            sort=sort,
+            dir=dir,
+        )
+        async for row in self._paginate(
+            f"/team/{report}",
+            params,
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+            span_name="iter_team_stats",
+        ):
+            yield row
+
+    async def iter_team_stats_sharded(
+        self,
+        report: str,
+        seasons: t.Optional[t.Tuple[int, int]] = None,
+        dates: t.Optional[t.Tuple[DateLike, DateLike]] = None,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        is_aggregate: t.Optional[bool] = None,
+        is_game: t.Optional[bool] = None,
+        fact_cayenne_exp: t.Optional[CayenneExp] = None,
+        include: t.Optional[Fields] = None,
+        exclude: t.Optional[Fields] = None,
+        sort: t.Optional[SortKeys] = None,
+        dir: t.Optional[str] = None,
+        shard_days: int = DEFAULT_SHARD_DAYS,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+        prefetch: int = DEFAULT_STATS_PAGE_PREFETCH,
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Stream team stats rows for a large pull, split into one query per season
+        or date window that run concurrently and are merged in `sort` order.
+        Ref: https://api.nhle.com/stats/rest/{lang}/team/{report}
+
+        Prefer this to `iter_team_stats` for multi-season `is_game=True`
+        pulls, which time out or return huge payloads as a single query.
+
+        Args:
+            report: The name of the report (e.g., "summary").
+            seasons: (first, last) seasons to pull, one shard per season
+                     (e.g., (20142015, 20232024)).
+            dates: (start, end) game dates to pull, one shard per `shard_days`
+                   days. Pass either `seasons` or `dates`.
+            cayenne_exp: Optional extra filter applied to every shard.
+            is_aggregate, is_game, fact_cayenne_exp, include, exclude, sort,
+            dir: See `get_team_stats`. Rows are merged across shards in
+                 `sort` order (shard order if no sort is given).
+            shard_days: Days per shard when splitting by `dates`.
+            concurrency: Maximum page requests in flight across all shards.
+            page_size: Rows requested per page.
+            prefetch: Pages fetched ahead of the consumer, per shard.
+
+        Yields:
+            Individual rows of all shards.
+
+        Raises:
+            ValueError: Unless exactly one of `seasons` and `dates` is given.
+        """
+        async for row in self._iter_sharded(
+            f"/team/{report}",
+            cayenne_exp,
+            seasons,
+            dates,
+            sort,
+            dir,
+            shard_days=shard_days,
+            concurrency=concurrency,
+            page_size=page_size,
+            prefetch=prefetch,
+            is_aggregate=is_aggregate,
+            is_game=is_game,
+            fact_cayenne_exp=fact_cayenne_exp,
+            include=include,
+            exclude=exclude,
+            span_name="iter_team_stats_sharded",
+        ):
+            yield row
 
     async def get_franchise_info(self) -> t.Dict[str, t.Any]:
         """
@@ -111,4 +235,4 @@ class StatsTeams(StatsEndpointCategory):
         Returns:
             Dictionary containing franchise data.
         """
-        return await self._get("/franchise")
+        return await self._get("/franchise", span_name="get_franchise_info")
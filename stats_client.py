@@ -4,7 +4,23 @@ The main client facade for interacting with the api.nhle.com/stats/rest API endp
 
 import typing as t
 from .http_client import HttpClient
-from .config import STATS_BASE_URL
+from .cache import ResponseCache
+from .disk_cache import DiskCache
+from .cassette import Cassette
+from .session import NHLSession
+from .metrics import RequestHook
+from .tracing import TracerSpec
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .decoders import Decoder
+from .batch import BatchCall, BatchResult, gather_bounded
+from .config import (
+    STATS_BASE_URL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
 from .stats import (
     StatsPlayers,
     StatsTeams,
@@ -45,18 +61,78 @@ class NHLStatsClient:
         >>> await client.aclose()
     """
 
-    def __init__(self, language: str = DEFAULT_LANGUAGE, **httpx_kwargs: t.Any):
+    def __init__(
+        self,
+        language: str = DEFAULT_LANGUAGE,
+        cache: t.Optional[ResponseCache] = None,
+        retry: t.Optional[RetryPolicy] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        decoder: t.Union[str, Decoder, None] = None,
+        disk_cache: t.Optional[DiskCache] = None,
+        cassette: t.Optional[Cassette] = None,
+        http2: t.Optional[bool] = None,
+        max_connections: t.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: t.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: t.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        hooks: t.Optional[t.Sequence[RequestHook]] = None,
+        tracer: TracerSpec = None,
+        session: t.Optional[NHLSession] = None,
+        **httpx_kwargs: t.Any,
+    ):
         """
         Initializes the NHL Stats API client.
 
         Args:
             language: The language code to use for API requests (e.g., 'en', 'fr').
                       Defaults to 'en'.
+            cache: Optional ResponseCache used to serve repeated requests
+                   without hitting the network.
+            retry: Optional RetryPolicy for transient failures (429, 5xx,
+                   network errors).
+            rate_limiter: Optional RateLimiter pacing requests per host. Pass the
+                          same instance to several clients to share the budget.
+            decoder: JSON decoder name ("orjson", "msgspec", "json") or callable.
+                     Defaults to the fastest installed decoder.
+            disk_cache: Optional persistent DiskCache for immutable historical
+                        responses (e.g., past-season game logs, final boxscores).
+            cassette: Optional Cassette to record responses to, or replay them
+                      from without network access (reproducible runs, CI).
+            http2: Use HTTP/2 (defaults to True when `h2` is installed, see
+                   `pip install nhlapi-tools[http2]`).
+            max_connections: Maximum number of open connections.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            hooks: Optional callables receiving a RequestEvent per request, e.g.
+                   a MetricsRegistry for latency histograms and counters.
+            tracer: Optional OpenTelemetry tracer, or True for the global one,
+                    recording a span per endpoint call and per request
+                    (requires `pip install nhlapi-tools[tracing]`).
+            session: Optional NHLSession sharing its connection pool, caches,
+                     retry policy and rate limiter with other clients. When
+                     given, the session's settings replace the arguments above.
             **httpx_kwargs: Optional keyword arguments passed directly to the
                             underlying httpx.AsyncClient (e.g., timeout, headers, proxies).
         """
         # Base URL *without* language, as it's prepended in requests by the category base class
-        self.http_client = HttpClient(base_url=STATS_BASE_URL, **httpx_kwargs)
+        if session is not None:
+            self.http_client = session.http_client(STATS_BASE_URL)
+        else:
+            self.http_client = HttpClient(
+                base_url=STATS_BASE_URL,
+                cache=cache,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                decoder=decoder,
+                disk_cache=disk_cache,
+                cassette=cassette,
+                http2=http2,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                hooks=hooks,
+                tracer=tracer,
+                **httpx_kwargs,
+            )
         self.language = language.lower()  # Store language for endpoint categories
 
         # Initialize endpoint categories, passing the HTTP client and language
@@ -68,8 +144,29 @@ class NHLStatsClient:
         self.misc = StatsMisc(self.http_client, self.language)
         # Add other categories here if the API expands further
 
+    def batch(
+        self,
+        calls: t.Iterable[BatchCall[t.Any]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> t.AsyncIterator[BatchResult[t.Any]]:
+        """
+        Runs many endpoint calls with bounded concurrency, streaming results.
+
+        Args:
+            calls: Zero-argument callables returning awaitables, e.g.
+                   `lambda: client.players.get_skater_stats(report, exp)`.
+            concurrency: Maximum number of calls in flight at once.
+            ordered: Yield results in input order instead of completion order.
+
+        Returns:
+            An async iterator of BatchResult objects; failed calls carry their
+            exception in `error` instead of aborting the batch.
+        """
+        return gather_bounded(calls, concurrency=concurrency, ordered=ordered)
+
     async def aclose(self) -> None:
-        """Closes the underlying HTTP client sessions."""
+        """Closes the underlying HTTP client sessions (a shared NHLSession stays open)."""
         await self.http_client.aclose()
 
     async def __aenter__(self) -> "NHLStatsClient":
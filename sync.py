@@ -0,0 +1,210 @@
+"""
+Incremental synchronization of per-game Stats API reports to local files.
+"""
+
+import json
+import os
+import typing as t
+
+from .config import DEFAULT_STATS_PAGE_SIZE
+from .stats.query import CayenneExp, Field, game_type, season_range
+
+if t.TYPE_CHECKING:
+    from .stats_client import NHLStatsClient
+
+# Row identity and stable paging order per report family
+REPORT_KEYS = {
+    "skater": ("playerId", "gameId"),
+    "goalie": ("playerId", "gameId"),
+    "team": ("teamId", "gameId"),
+}
+
+STATE_FILE = "sync-state.json"
+
+
+class SyncResult:
+    """Summary of one incremental sync of a season."""
+
+    __slots__ = ("season", "since", "high_water_mark", "fetched", "inserted", "updated")
+
+    def __init__(
+        self,
+        season: int,
+        since: t.Optional[str],
+        high_water_mark: t.Optional[str],
+        fetched: int,
+        inserted: int,
+        updated: int,
+    ):
+        self.season = season
+        self.since = since  # gameDate the fetch started from (None: full season)
+        self.high_water_mark = high_water_mark  # Latest gameDate stored
+        self.fetched = fetched  # Rows returned by the API
+        self.inserted = inserted  # Rows new to the dataset
+        self.updated = updated  # Existing rows whose values changed
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult(season={self.season}, since={self.since!r}, "
+            f"fetched={self.fetched}, inserted={self.inserted}, updated={self.updated})"
+        )
+
+
+class ReportSync:
+    """
+    Keeps a local copy of a per-game (`isGame=true`) Stats API report up to date.
+
+    Each season is stored as a JSON-lines file in `directory`, next to a state
+    file recording the season's high-water mark: the latest `gameDate` already
+    stored. A sync only requests rows with `gameDate>=` that mark and merges
+    them into the dataset by row key (e.g., playerId and gameId), so a nightly
+    refresh downloads one day of games instead of the whole season. The mark's
+    own date is fetched again because its games may not have been final at
+    the previous sync.
+
+    Usage:
+        >>> async with NHLStatsClient() as client:
+        ...     sync = ReportSync(client, "skater", "summary", "warehouse/")
+        ...     result = await sync.sync(20232024)
+        ...     rows = sync.load(20232024)
+    """
+
+    def __init__(
+        self,
+        client: "NHLStatsClient",
+        kind: str,
+        report: str,
+        directory: str,
+        game_type: int = 2,
+        cayenne_exp: t.Optional[CayenneExp] = None,
+        page_size: int = DEFAULT_STATS_PAGE_SIZE,
+    ):
+        """
+        Args:
+            client: The NHLStatsClient used for requests.
+            kind: Report family: "skater", "goalie" or "team".
+            report: Report name (e.g., "summary", "realtime").
+            directory: Directory holding the datasets and the sync state.
+            game_type: Game type to sync (2 regular season, 3 playoffs).
+            cayenne_exp: Optional extra filter, combined with "and".
+            page_size: Rows requested per page.
+        """
+        if kind not in REPORT_KEYS:
+            raise ValueError(f"kind must be one of {sorted(REPORT_KEYS)}")
+        self.client = client
+        self.kind = kind
+        self.report = report
+        self.directory = directory
+        self.game_type = game_type
+        self.cayenne_exp = cayenne_exp
+        self.page_size = page_size
+        self.key_fields = REPORT_KEYS[kind]
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def _name(self) -> str:
+        return f"{self.kind}-{self.report}-{self.game_type}"
+
+    def dataset_path(self, season: int) -> str:
+        """Returns the path of a season's JSON-lines dataset."""
+        return os.path.join(self.directory, f"{self._name}-{season}.jsonl")
+
+    def _read_state(self) -> t.Dict[str, t.Any]:
+        path = os.path.join(self.directory, STATE_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def high_water_mark(self, season: int) -> t.Optional[str]:
+        """Returns the latest stored gameDate of a season, or None if never synced."""
+        return self._read_state().get(self._name, {}).get(str(season))
+
+    def _write_state(self, season: int, mark: t.Optional[str]) -> None:
+        state = self._read_state()
+        state.setdefault(self._name, {})[str(season)] = mark
+        _write_atomic(
+            os.path.join(self.directory, STATE_FILE), [json.dumps(state, indent=2)]
+        )
+
+    def load(self, season: int) -> t.List[t.Dict[str, t.Any]]:
+        """Returns the stored rows of a season (empty if never synced)."""
+        path = self.dataset_path(season)
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _key(self, row: t.Dict[str, t.Any]) -> t.Tuple[t.Any, ...]:
+        return tuple(row.get(field) for field in self.key_fields)
+
+    def _cayenne_exp(self, season: int, since: t.Optional[str]) -> str:
+        where = season_range(season) & game_type(self.game_type)
+        if since is not None:
+            where &= Field("gameDate") >= since
+        if self.cayenne_exp:
+            where &= self.cayenne_exp
+        return str(where)
+
+    def _iter_report(self, cayenne_exp: str) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        if self.kind == "team":
+            method = self.client.teams.iter_team_stats
+        elif self.kind == "goalie":
+            method = self.client.players.iter_goalie_stats
+        else:
+            method = self.client.players.iter_skater_stats
+        return method(
+            self.report,
+            cayenne_exp,
+            is_aggregate=False,
+            is_game=True,
+            sort=list(self.key_fields),  # Stable paging
+            page_size=self.page_size,
+        )
+
+    async def sync(self, season: int, full: bool = False) -> SyncResult:
+        """
+        Fetches the rows added since the season's high-water mark and merges
+        them into the stored dataset.
+
+        Args:
+            season: Season in YYYYYYYY format (e.g., 20232024).
+            full: If True, ignore the high-water mark and refetch the season.
+
+        Returns:
+            A SyncResult with the number of fetched, inserted and updated rows.
+        """
+        since = None if full else self.high_water_mark(season)
+        rows = {self._key(row): row for row in self.load(season)}
+        mark = since
+        fetched = inserted = updated = 0
+        async for row in self._iter_report(self._cayenne_exp(season, since)):
+            fetched += 1
+            key = self._key(row)
+            previous = rows.get(key)
+            if previous is None:
+                inserted += 1
+            elif previous != row:
+                updated += 1
+            rows[key] = row
+            game_date = row.get("gameDate")
+            if game_date and (mark is None or game_date > mark):
+                mark = game_date
+
+        if inserted or updated:
+            ordered = sorted(rows.values(), key=lambda row: str(row.get("gameDate")))
+            _write_atomic(
+                self.dataset_path(season), (json.dumps(row) for row in ordered)
+            )
+        self._write_state(season, mark)
+        return SyncResult(season, since, mark, fetched, inserted, updated)
+
+
+def _write_atomic(path: str, lines: t.Iterable[str]) -> None:
+    """Writes lines to a temporary file and renames it over `path`."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
+    os.replace(tmp_path, path)
@@ -0,0 +1,188 @@
+"""
+Synchronous facades over the async clients, for scripts and notebooks.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import typing as t
+
+from .batch import BatchCall, BatchResult, gather_all
+from .config import DEFAULT_BATCH_CONCURRENCY
+from .stats.base import StatsEndpointCategory
+from .stats_client import NHLStatsClient
+from .web.base import WebEndpointCategory
+from .web_client import NHLWebClient
+
+T = t.TypeVar("T")
+
+
+class _LoopThread:
+    """An event loop running forever in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="nhl-api-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, awaitable: t.Awaitable[T]) -> T:
+        """Runs an awaitable on the loop and blocks until it completes."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Sync clients cannot be used from async callbacks")
+        return asyncio.run_coroutine_threadsafe(_await(awaitable), self.loop).result()
+
+
+async def _await(awaitable: t.Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _call(factory: t.Callable[[], T]) -> T:
+    return factory()
+
+
+_loop_thread: t.Optional[_LoopThread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    """Returns the background loop shared by all sync clients, starting it once."""
+    global _loop_thread
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = _LoopThread()
+        return _loop_thread
+
+
+class _SyncCategory:
+    """Exposes the coroutine methods of an endpoint category as blocking calls."""
+
+    def __init__(self, category: t.Any, runner: _LoopThread):
+        self._category = category
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> t.Any:
+        attr = getattr(self._category, name)
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            def call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+                return self._runner.run(attr(*args, **kwargs))
+
+        elif inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            def call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+                return _iterate(attr(*args, **kwargs), self._runner)
+
+        else:
+            return attr
+        setattr(self, name, call)  # Cache the wrapper for later calls
+        return call
+
+    def __dir__(self) -> t.List[str]:
+        return sorted(set(super().__dir__()) | set(dir(self._category)))
+
+
+def _iterate(agen: t.AsyncIterator[T], runner: _LoopThread) -> t.Iterator[T]:
+    """Drives an async iterator (e.g., iter_skater_stats) from synchronous code."""
+    try:
+        while True:
+            try:
+                yield runner.run(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(agen, "aclose", None)
+        if aclose is not None:
+            runner.run(aclose())
+
+
+class _SyncClient:
+    """Base class wrapping an async client facade on the shared background loop."""
+
+    _categories = (WebEndpointCategory, StatsEndpointCategory)
+
+    def __init__(self, factory: t.Callable[[], t.Any]):
+        self._runner = _get_loop_thread()
+        # Created on the loop thread, where all of its I/O will happen
+        self.async_client = self._runner.run(_call(factory))
+        for name, value in vars(self.async_client).items():
+            if isinstance(value, self._categories):
+                setattr(self, name, _SyncCategory(value, self._runner))
+
+    def run(self, awaitable: t.Awaitable[T]) -> T:
+        """Runs an awaitable (e.g., from `async_client`) on the client's loop."""
+        return self._runner.run(awaitable)
+
+    def batch(
+        self,
+        calls: t.Iterable[BatchCall[t.Any]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> t.List[BatchResult[t.Any]]:
+        """
+        Runs many async endpoint calls concurrently and returns all results in
+        input order (see gather_all). Calls use the `async_client`, e.g.
+        `lambda g=g: client.async_client.game.get_boxscore(g)`.
+        """
+        return self._runner.run(gather_all(calls, concurrency=concurrency))
+
+    def close(self) -> None:
+        """Closes the underlying async client and its connections."""
+        self._runner.run(self.async_client.aclose())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class NHLWebClientSync(_SyncClient):
+    """
+    Blocking counterpart of NHLWebClient with the same endpoint categories.
+
+    Calls run on one event loop in a background thread shared by all sync
+    clients, so connections stay warm between calls instead of paying for a
+    new loop and new connections with every `asyncio.run`.
+
+    Usage:
+        >>> with NHLWebClientSync() as client:
+        ...     standings = client.teams.get_standings_now()
+        ...     landing = client.players.get_landing(8477934)
+    """
+
+    async_client: NHLWebClient
+
+    def __init__(self, **kwargs: t.Any):
+        """
+        Args:
+            **kwargs: Arguments of NHLWebClient (cache, retry, session, ...).
+        """
+        super().__init__(lambda: NHLWebClient(**kwargs))
+
+
+class NHLStatsClientSync(_SyncClient):
+    """
+    Blocking counterpart of NHLStatsClient with the same endpoint categories.
+
+    Async iterators such as `players.iter_skater_stats` become regular
+    generators.
+
+    Usage:
+        >>> with NHLStatsClientSync() as client:
+        ...     teams = client.teams.get_info()
+        ...     for row in client.players.iter_skater_stats("summary", "seasonId=20232024"):
+        ...         print(row["skaterFullName"])
+    """
+
+    async_client: NHLStatsClient
+
+    def __init__(self, **kwargs: t.Any):
+        """
+        Args:
+            **kwargs: Arguments of NHLStatsClient (language, cache, retry, ...).
+        """
+        super().__init__(lambda: NHLStatsClient(**kwargs))
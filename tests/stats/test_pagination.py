@@ -0,0 +1,64 @@
+import httpx
+import pytest
+from nhl_api import NHLStatsClient
+
+
+def _report_handler(total, requests, report_total=True):
+    """Serves `total` fake rows, honouring the start/limit query params."""
+
+    def handler(request):
+        start = int(request.url.params["start"])
+        limit = int(request.url.params["limit"])
+        requests.append((request.url.path, start, limit))
+        rows = [{"playerId": i} for i in range(start, min(start + limit, total))]
+        body = {"data": rows}
+        if report_total:
+            body["total"] = total
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_iter_skater_stats_yields_every_row_in_order():
+    requests = []
+    transport = httpx.MockTransport(_report_handler(250, requests))
+    async with NHLStatsClient(transport=transport) as client:
+        rows = [
+            row["playerId"]
+            async for row in client.players.iter_skater_stats(
+                "summary", "seasonId=20232024", sort="points", page_size=100
+            )
+        ]
+
+    assert rows == list(range(250))
+    assert sorted(start for _, start, _ in requests) == [0, 100, 200]
+    assert all(path == "/stats/rest/en/skater/summary" for path, _, _ in requests)
+
+
+@pytest.mark.asyncio
+async def test_iter_team_stats_without_total_pages_until_short_page():
+    requests = []
+    transport = httpx.MockTransport(_report_handler(45, requests, report_total=False))
+    async with NHLStatsClient(transport=transport) as client:
+        rows = [
+            row async for row in client.teams.iter_team_stats("summary", page_size=20)
+        ]
+
+    assert len(rows) == 45
+    assert [start for _, start, _ in requests] == [0, 20, 40]
+
+
+@pytest.mark.asyncio
+async def test_early_exit_stops_fetching():
+    requests = []
+    transport = httpx.MockTransport(_report_handler(10_000, requests))
+    async with NHLStatsClient(transport=transport) as client:
+        async for row in client.players.iter_goalie_stats(
+            "summary", "seasonId=20232024", page_size=10, prefetch=2
+        ):
+            if row["playerId"] == 5:
+                break
+
+    # The first page plus at most `prefetch` pages requested ahead
+    assert len(requests) <= 3
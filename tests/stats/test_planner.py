@@ -0,0 +1,141 @@
+import asyncio
+import datetime
+import json
+import random
+import re
+
+import httpx
+import pytest
+from nhl_api import NHLStatsClient
+from nhl_api.exceptions import NHLServerError
+from nhl_api.stats.planner import date_windows, merge_sorted, seasons_between
+
+SEASONS = [20212022, 20222023, 20232024]
+
+
+def _rows():
+    rng = random.Random(0)
+    return [
+        {"playerId": i, "seasonId": season, "points": rng.randint(0, 40)}
+        for season in SEASONS
+        for i in range(120)
+    ]
+
+
+def _sharded_handler(rows, cayenne_exps, in_flight):
+    """Serves rows of the season in the cayenneExp, sorted and paged as requested."""
+
+    async def handler(request):
+        params = request.url.params
+        cayenne_exps.append(params["cayenneExp"])
+        season = int(re.search(r"seasonId=(\d+)", params["cayenneExp"]).group(1))
+        selected = [row for row in rows if row["seasonId"] == season]
+        for key in reversed(json.loads(params["sort"])):
+            selected.sort(
+                key=lambda row: row[key["property"]],
+                reverse=key["direction"] == "DESC",
+            )
+        start, limit = int(params["start"]), int(params["limit"])
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        body = {"data": selected[start : start + limit], "total": len(selected)}
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_sharded_pull_merges_seasons_in_sort_order():
+    rows, cayenne_exps, in_flight = _rows(), [], {"now": 0, "max": 0}
+    transport = httpx.MockTransport(_sharded_handler(rows, cayenne_exps, in_flight))
+    async with NHLStatsClient(transport=transport) as client:
+        merged = [
+            row
+            async for row in client.players.iter_skater_stats_sharded(
+                "summary",
+                seasons=(SEASONS[0], SEASONS[-1]),
+                cayenne_exp="gameTypeId=2",
+                is_game=True,
+                sort=[("points", "DESC"), ("playerId", "ASC")],
+                page_size=25,
+                concurrency=2,
+            )
+        ]
+
+    expected = sorted(rows, key=lambda row: (-row["points"], row["playerId"]))
+    assert [(r["points"], r["playerId"]) for r in merged] == [
+        (r["points"], r["playerId"]) for r in expected
+    ]
+    assert len(merged) == len(rows)
+    assert {exp.split(" and ")[0] for exp in cayenne_exps} == {
+        f"seasonId={season}" for season in SEASONS
+    }
+    assert all(exp.endswith("and (gameTypeId=2)") for exp in cayenne_exps)
+    assert in_flight["max"] == 2  # Shards ran concurrently, within the cap
+
+
+@pytest.mark.asyncio
+async def test_sharded_pull_without_sort_keeps_shard_order():
+    rows = _rows()
+    transport = httpx.MockTransport(_sharded_handler(rows, [], {"now": 0, "max": 0}))
+    async with NHLStatsClient(transport=transport) as client:
+        merged = [
+            row["seasonId"]
+            async for row in client.teams.iter_team_stats_sharded(
+                "summary", seasons=(SEASONS[0], SEASONS[-1]), sort="seasonId"
+            )
+        ]
+    assert merged == sorted(merged) and len(merged) == len(rows)
+
+
+@pytest.mark.asyncio
+async def test_sharded_pull_requires_one_shard_dimension():
+    async with NHLStatsClient(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200))
+    ) as client:
+        with pytest.raises(ValueError):
+            async for _ in client.players.iter_goalie_stats_sharded("summary"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_sharded_pull_raises_the_failing_shard_error():
+    """A failing shard propagates its error while the other shards are in flight."""
+
+    async def handler(request):
+        if "20222023" in request.url.params["cayenneExp"]:
+            return httpx.Response(500, text="server error")
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": [], "total": 0})
+
+    async with NHLStatsClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(NHLServerError):
+            async for _ in client.players.iter_skater_stats_sharded(
+                "summary", seasons=(20202021, 20232024), sort=[("points", "DESC")]
+            ):
+                pass
+
+
+def test_shard_planning():
+    assert seasons_between(20212022, 20232024) == SEASONS
+    windows = date_windows("2024-01-01", datetime.date(2024, 3, 5), 31)
+    assert windows[0] == (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+    assert windows[-1] == (datetime.date(2024, 3, 3), datetime.date(2024, 3, 5))
+    assert len(windows) == 3
+
+
+@pytest.mark.asyncio
+async def test_merge_sorted_handles_missing_values_and_descending_keys():
+    async def stream(values):
+        for value in values:
+            yield {"v": value}
+
+    merged = [
+        row["v"]
+        async for row in merge_sorted(
+            [stream([9, 4, None]), stream([7, 5]), stream([])], [("v", "DESC")]
+        )
+    ]
+    assert merged == [9, 7, 5, 4, None]
@@ -0,0 +1,91 @@
+import datetime
+import json
+
+import httpx
+import pytest
+from nhl_api import NHLStatsClient
+from nhl_api.stats.query import (
+    Field,
+    game_date_range,
+    game_type,
+    player_ids,
+    season_range,
+    sort_param,
+)
+
+
+def test_expressions_render_cayenne_exp():
+    where = season_range(20202021, 20232024) & game_type(2) & player_ids([1, 2])
+    assert str(where) == (
+        "seasonId>=20202021 and seasonId<=20232024 and gameTypeId=2 "
+        "and playerId in (1,2)"
+    )
+    assert str(season_range(20232024)) == "seasonId=20232024"
+    assert str(game_type(2, 3)) == "gameTypeId in (2,3)"
+    assert str(Field("skaterFullName").like("%o'Re%")) == (
+        'skaterFullName likeIgnoreCase "%o\'Re%"'
+    )
+    assert str(Field("lastName") == 'Say "hi"') == 'lastName="Say \\"hi\\""'
+
+
+def test_precedence_and_raw_strings():
+    points, goals = Field("points"), Field("goals")
+    either = (points >= 50) | (goals >= 30)
+    assert str(either & game_type(2)) == "(points>=50 or goals>=30) and gameTypeId=2"
+    assert str((points >= 50) & (goals >= 30) | (goals >= 40)) == (
+        "points>=50 and goals>=30 or goals>=40"
+    )
+    assert str("teamId=10 or teamId=6" & season_range(20232024)) == (
+        "(teamId=10 or teamId=6) and seasonId=20232024"
+    )
+    assert str(~(points < 10)) == "not (points<10)"
+    with pytest.raises(ValueError):
+        player_ids([])
+
+
+def test_game_date_range_is_inclusive():
+    assert str(game_date_range("2024-01-01", datetime.date(2024, 1, 31))) == (
+        'gameDate>="2024-01-01" and gameDate<"2024-02-01"'
+    )
+    assert str(game_date_range(end="2024-02-29")) == 'gameDate<"2024-03-01"'
+    with pytest.raises(ValueError):
+        game_date_range()
+
+
+def test_sort_param():
+    assert sort_param("points") == "points"
+    assert json.loads(sort_param(["points", ("playerId", "desc")], dir="DESC")) == [
+        {"property": "points", "direction": "DESC"},
+        {"property": "playerId", "direction": "DESC"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_filters_projection_and_sort_are_pushed_to_the_server():
+    params = []
+
+    def handler(request):
+        params.append(dict(request.url.params))
+        return httpx.Response(200, json={"data": [], "total": 0})
+
+    async with NHLStatsClient(transport=httpx.MockTransport(handler)) as client:
+        await client.players.get_skater_stats(
+            "summary",
+            season_range(20232024) & player_ids([8478402, 8477934]),
+            include=["playerId", "points"],
+            sort=[("points", "DESC"), "playerId"],
+            dir="DESC",
+        )
+        await client.draft.get_draft_info(
+            Field("draftYear") == 2023, sort="pickOverall"
+        )
+
+    report, draft = params
+    assert report["cayenneExp"] == "seasonId=20232024 and playerId in (8478402,8477934)"
+    assert report["include"] == "playerId,points"
+    assert json.loads(report["sort"])[1] == {
+        "property": "playerId",
+        "direction": "DESC",
+    }
+    assert "dir" not in report  # Directions are part of the sort keys
+    assert draft == {"cayenneExp": "draftYear=2023", "sort": "pickOverall"}
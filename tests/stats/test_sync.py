@@ -0,0 +1,53 @@
+import re
+
+import httpx
+import pytest
+from nhl_api import NHLStatsClient
+from nhl_api.sync import ReportSync
+
+ROWS = [
+    {"playerId": 1, "gameId": 10, "gameDate": "2023-10-10", "goals": 1},
+    {"playerId": 2, "gameId": 10, "gameDate": "2023-10-10", "goals": 0},
+    {"playerId": 1, "gameId": 11, "gameDate": "2023-10-12", "goals": 0},
+]
+
+
+def _handler(rows, expressions):
+    """Serves `rows`, honouring a gameDate>= clause in the cayenneExp."""
+
+    def handler(request):
+        cayenne_exp = request.url.params["cayenneExp"]
+        expressions.append(cayenne_exp)
+        match = re.search(r'gameDate>="([\d-]+)"', cayenne_exp)
+        data = [r for r in rows if not match or r["gameDate"] >= match.group(1)]
+        start = int(request.url.params["start"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(
+            200, json={"data": data[start : start + limit], "total": len(data)}
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_new_games(tmp_path):
+    rows = list(ROWS)
+    expressions = []
+    transport = httpx.MockTransport(_handler(rows, expressions))
+    async with NHLStatsClient(transport=transport) as client:
+        sync = ReportSync(client, "skater", "summary", str(tmp_path))
+        first = await sync.sync(20232024)
+        assert (first.inserted, first.high_water_mark) == (3, "2023-10-12")
+
+        # Next night: a stat correction for the last game and a new game
+        rows[2] = {**rows[2], "goals": 1}
+        rows.append({"playerId": 2, "gameId": 12, "gameDate": "2023-10-14", "goals": 2})
+        second = await sync.sync(20232024)
+
+    assert 'gameDate>="2023-10-12"' in expressions[-1]
+    assert "gameDate" not in expressions[0]
+    assert (second.fetched, second.inserted, second.updated) == (2, 1, 1)
+    assert second.high_water_mark == "2023-10-14"
+    stored = sync.load(20232024)
+    assert len(stored) == 4
+    assert stored[2]["goals"] == 1
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+from nhl_api import NHLWebClient, gather_all, gather_bounded
+from nhl_api.exceptions import NHLNotFoundError
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """No more than `concurrency` calls run at the same time."""
+    running = 0
+    peak = 0
+
+    async def call(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return value
+
+    calls = (lambda v=v: call(v) for v in range(50))
+    results = await gather_all(calls, concurrency=4)
+    assert [r.value for r in results] == list(range(50))
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_ordered_and_completion_order():
+    async def call(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    def calls():
+        return [lambda: call("slow", 0.02), lambda: call("fast", 0)]
+
+    completed = [r.value async for r in gather_bounded(calls(), concurrency=2)]
+    ordered = [
+        r.value async for r in gather_bounded(calls(), concurrency=2, ordered=True)
+    ]
+    assert completed == ["fast", "slow"]
+    assert ordered == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_client_batch_collects_errors_per_item():
+    """A failing game does not abort the batch; its error is reported per item."""
+
+    def handler(request):
+        if "/2023020002/" in request.url.path:
+            return httpx.Response(404, text="Not Found")
+        return httpx.Response(200, json={"id": request.url.path.split("/")[3]})
+
+    game_ids = [2023020001, 2023020002, 2023020003]
+    async with NHLWebClient(transport=httpx.MockTransport(handler)) as client:
+        results = [
+            r
+            async for r in client.batch(
+                [lambda g=g: client.game.get_boxscore(g) for g in game_ids],
+                concurrency=2,
+                ordered=True,
+            )
+        ]
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, NHLNotFoundError)
+    assert results[2].result() == {"id": "2023020003"}
+    with pytest.raises(NHLNotFoundError):
+        results[1].result()
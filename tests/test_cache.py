@@ -0,0 +1,87 @@
+import httpx
+import pytest
+from nhl_api import NHLWebClient
+from nhl_api.cache import FOREVER, CacheRule, ResponseCache
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted once the cache is full."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3, 60)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    """Entries expire after their TTL and count as misses."""
+    now = [1000.0]
+    monkeypatch.setattr("nhl_api.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache()
+    cache.set("scores", {"games": []}, 5)
+    assert cache.get("scores") == {"games": []}
+    now[0] += 6
+    assert cache.get("scores") is None
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_default_rules():
+    """Finished games are cached forever; live scores only for a few seconds."""
+    cache = ResponseCache()
+    boxscore = "/v1/gamecenter/2023020204/boxscore"
+    assert cache.ttl_for(boxscore, {"gameState": "OFF"}) == FOREVER
+    assert cache.ttl_for(boxscore, {"gameState": "LIVE"}) < 60
+    assert cache.ttl_for("/v1/score/now", {}) <= 5
+    custom = ResponseCache(rules=[CacheRule(r"^/v1/standings/", 0)])
+    assert custom.ttl_for("/v1/standings/now", {}) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_serves_cached_response():
+    """Repeated requests are served from the cache without hitting the network."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"standings": [{"points": 116}]})
+
+    cache = ResponseCache()
+    async with NHLWebClient(
+        cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        first = await client.teams.get_standings_now()
+        second = await client.teams.get_standings_now()
+
+    assert first == second
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_client_revalidates_with_etag(monkeypatch):
+    """Expired entries are revalidated and reused on 304 Not Modified."""
+    now = [1000.0]
+    monkeypatch.setattr("nhl_api.cache.time.monotonic", lambda: now[0])
+    sent = []
+
+    def handler(request):
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"standings": []}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache()
+    async with NHLWebClient(
+        cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        first = await client.teams.get_standings_now()
+        now[0] += 120  # past the 60s TTL of /v1/standings/now
+        second = await client.teams.get_standings_now()
+        third = await client.teams.get_standings_now()  # fresh again
+
+    assert sent == [None, '"v1"']
+    assert second is first and third is first
@@ -0,0 +1,119 @@
+import httpx
+import pytest
+from nhl_api import CacheRule, Cassette, CassetteMissError, NHLWebClient, ResponseCache
+from nhl_api.exceptions import NHLNotFoundError
+
+
+def handler(request):
+    if "boxscore" in request.url.path:
+        return httpx.Response(404, text="not found")
+    return httpx.Response(
+        200, json={"path": request.url.path}, headers={"ETag": '"v1"'}
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_offline(tmp_path):
+    path = str(tmp_path / "games.cassette")
+    with Cassette(path, mode="record") as cassette:
+        async with NHLWebClient(
+            cassette=cassette, transport=httpx.MockTransport(handler)
+        ) as client:
+            landing = await client.game.get_landing(2023020204)
+            with pytest.raises(NHLNotFoundError):
+                await client.game.get_boxscore(2023020204)
+        assert len(cassette) == 2
+
+    with Cassette(path) as cassette:  # No transport: replay only
+        async with NHLWebClient(cassette=cassette) as client:
+            assert await client.game.get_landing(2023020204) == landing
+            with pytest.raises(NHLNotFoundError):
+                await client.game.get_boxscore(2023020204)
+            with pytest.raises(CassetteMissError):
+                await client.game.get_landing(2023020205)
+        assert cassette.hits == 2 and cassette.misses == 1
+        replayed = cassette.get(
+            "https://api-web.nhle.com/v1/gamecenter/2023020204/landing"
+        )
+        assert replayed.headers["etag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_append_records_only_new_urls(tmp_path):
+    path = str(tmp_path / "games.cassette")
+    calls = []
+
+    def counting(request):
+        calls.append(request.url.path)
+        return handler(request)
+
+    for game_id in (2023020204, 2023020205):
+        with Cassette(path, mode="append") as cassette:
+            async with NHLWebClient(
+                cassette=cassette, transport=httpx.MockTransport(counting)
+            ) as client:
+                await client.game.get_landing(2023020204)
+                await client.game.get_landing(game_id)
+    assert calls == [
+        "/v1/gamecenter/2023020204/landing",
+        "/v1/gamecenter/2023020205/landing",
+    ]
+    with Cassette(path) as cassette:
+        assert len(cassette) == 2
+
+
+@pytest.mark.asyncio
+async def test_revalidation_does_not_record_304(tmp_path, monkeypatch):
+    """Conditional requests of an expired cache entry record the full body."""
+    now = [1000.0]
+    monkeypatch.setattr("nhl_api.cache.time.monotonic", lambda: now[0])
+    sent = []
+
+    def revalidating(request):
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"standings": []}, headers={"ETag": '"v1"'})
+
+    path = str(tmp_path / "standings.cassette")
+    with Cassette(path, mode="record") as cassette:
+        async with NHLWebClient(
+            cache=ResponseCache(rules=[CacheRule(r".*", 0.01)]),
+            cassette=cassette,
+            transport=httpx.MockTransport(revalidating),
+        ) as client:
+            await client.teams.get_standings_now()
+            now[0] += 1  # Expired: the client revalidates with If-None-Match
+            await client.teams.get_standings_now()
+    assert sent == [None, None]
+
+    with Cassette(path) as cassette:
+        async with NHLWebClient(cassette=cassette) as client:
+            assert await client.teams.get_standings_now() == {"standings": []}
+
+
+def test_truncated_entry_is_dropped(tmp_path):
+    path = tmp_path / "games.cassette"
+    with Cassette(str(path), mode="record") as cassette:
+        cassette.put("https://a/1", httpx.Response(200, content=b"one"))
+        cassette.put("https://a/2", httpx.Response(200, content=b"two"))
+    path.write_bytes(path.read_bytes()[:-2])  # Interrupted recording
+
+    with Cassette(str(path), mode="append") as cassette:
+        assert "https://a/1" in cassette and "https://a/2" not in cassette
+        cassette.put("https://a/3", httpx.Response(200, content=b"three"))
+        assert cassette.get("https://a/3").content == b"three"
+    with Cassette(str(path)) as cassette:
+        assert [cassette.get(f"https://a/{i}").content for i in (1, 3)] == [
+            b"one",
+            b"three",
+        ]
+
+
+def test_rejects_unknown_mode_and_files(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "x.cassette"), mode="rewind")
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not a cassette")
+    with pytest.raises(ValueError):
+        Cassette(str(other))
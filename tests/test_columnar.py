@@ -0,0 +1,85 @@
+import pytest
+from nhl_api.analytics import COLUMNS, play_by_play_columns
+from nhl_api.utils import parse_clock
+
+
+def _game(game_id, plays):
+    return {"id": game_id, "plays": plays}
+
+
+PLAYS = [
+    {
+        "eventId": 101,
+        "sortOrder": 1,
+        "typeCode": 502,
+        "typeDescKey": "faceoff",
+        "periodDescriptor": {"number": 1},
+        "timeInPeriod": "00:00",
+        "details": {"xCoord": 0, "yCoord": 0, "winningPlayerId": 8477934},
+    },
+    {
+        "eventId": 102,
+        "sortOrder": 2,
+        "typeCode": 506,
+        "typeDescKey": "shot-on-goal",
+        "periodDescriptor": {"number": 2},
+        "timeInPeriod": "01:30",
+        "details": {
+            "xCoord": 70,
+            "yCoord": -12,
+            "zoneCode": "O",
+            "eventOwnerTeamId": 10,
+            "shootingPlayerId": 8477934,
+            "goalieInNetId": 8476999,
+        },
+    },
+    {
+        "eventId": 103,
+        "sortOrder": 3,
+        "typeCode": 520,
+        "typeDescKey": "period-end",
+        "periodDescriptor": {"number": 2},
+        "timeInPeriod": "20:00",
+    },
+]
+
+
+def test_parse_clock():
+    assert parse_clock("12:34") == 754
+    with pytest.raises(ValueError):
+        parse_clock("1234")
+
+
+def test_play_by_play_columns():
+    columns = play_by_play_columns(
+        [_game(2023020204, PLAYS), _game(2023020205, PLAYS[:1])]
+    )
+    assert set(columns) == set(COLUMNS)
+    assert all(len(values) == 4 for values in columns.values())
+    assert columns["game_id"] == [2023020204] * 3 + [2023020205]
+    assert columns["game_seconds"] == [0, 1290, 2400, 0]
+    assert columns["x_coord"][:3] == [0, 70, None]
+    assert columns["shooting_player_id"][1] == 8477934
+    assert columns["zone_code"][:3] == [None, "O", None]
+
+
+def test_plays_to_numpy():
+    np = pytest.importorskip("numpy")
+    from nhl_api.analytics import plays_to_numpy
+
+    arrays = plays_to_numpy(_game(2023020204, PLAYS))
+    assert arrays["period"].dtype == np.int64
+    assert np.isnan(arrays["x_coord"][2])
+    assert arrays["event_owner_team_id"].tolist() == [0, 10, 0]
+    shots = arrays["type_desc_key"] == "shot-on-goal"
+    assert arrays["x_coord"][shots].tolist() == [70.0]
+
+
+def test_plays_to_arrow():
+    pytest.importorskip("pyarrow")
+    from nhl_api.analytics import plays_to_arrow
+
+    table = plays_to_arrow(_game(2023020204, PLAYS))
+    assert table.num_rows == 3
+    assert table.column_names == list(COLUMNS)
+    assert table.column("x_coord").null_count == 1
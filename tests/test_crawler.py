@@ -0,0 +1,78 @@
+import httpx
+import pytest
+from nhl_api import NHLWebClient, SeasonCrawler
+
+SEASON = 20232024
+
+
+def _week(games, next_start_date):
+    return {
+        "playoffEndDate": "2024-06-30",
+        "nextStartDate": next_start_date,
+        "gameWeek": [{"date": "x", "games": games}],
+    }
+
+
+WEEKS = {
+    "2023-09-01": _week(
+        [
+            {"id": 2023010001, "season": SEASON, "gameType": 1},  # preseason
+            {"id": 2023020001, "season": SEASON, "gameType": 2},
+        ],
+        "2023-09-08",
+    ),
+    "2023-09-08": _week(
+        [
+            {"id": 2023020001, "season": SEASON, "gameType": 2},  # duplicate
+            {"id": 2023020002, "season": SEASON, "gameType": 2},
+        ],
+        None,
+    ),
+}
+
+
+def _transport(requests, fail=()):
+    def handler(request):
+        path = request.url.path
+        requests.append(path)
+        if path.startswith("/v1/schedule/"):
+            return httpx.Response(200, json=WEEKS[path.rsplit("/", 1)[1]])
+        if path in fail:
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"id": int(path.split("/")[3])})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_discovers_and_deduplicates():
+    requests = []
+    async with NHLWebClient(transport=_transport(requests)) as client:
+        crawler = SeasonCrawler(client, SEASON, endpoints=("boxscore",))
+        results = [result async for result in crawler]
+
+    assert crawler.game_ids == [2023020001, 2023020002]
+    assert sorted(r.game_id for r in results) == [2023020001, 2023020002]
+    assert all(r.ok for r in results)
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint(tmp_path):
+    """A second run only refetches what failed, without rediscovering games."""
+    checkpoint = str(tmp_path / "crawl.json")
+    failing = "/v1/gamecenter/2023020002/boxscore"
+
+    first = []
+    async with NHLWebClient(transport=_transport(first, fail=[failing])) as client:
+        results = [
+            r async for r in SeasonCrawler(client, SEASON, checkpoint=checkpoint)
+        ]
+    assert sum(not r.ok for r in results) == 1
+
+    second = []
+    async with NHLWebClient(transport=_transport(second)) as client:
+        results = [
+            r async for r in SeasonCrawler(client, SEASON, checkpoint=checkpoint)
+        ]
+    assert second == [failing]
+    assert [(r.game_id, r.endpoint) for r in results] == [(2023020002, "boxscore")]
@@ -0,0 +1,47 @@
+import httpx
+import pytest
+from nhl_api import NHLWebClient
+from nhl_api.decoders import available_decoders, get_decoder, stdlib_decoder
+from nhl_api.exceptions import NHLAPIError
+
+BODY = b'{"plays": [{"eventId": 1, "details": {"xCoord": -60.5}}], "name": "\\u00e9"}'
+
+
+@pytest.mark.parametrize("name", available_decoders())
+def test_available_decoders_agree_with_stdlib(name):
+    decoder = get_decoder(name)
+    assert decoder(BODY) == stdlib_decoder(BODY)
+    with pytest.raises(ValueError):
+        decoder(b"<html>Service Unavailable</html>")
+
+
+def test_get_decoder_resolution():
+    assert get_decoder("json") is stdlib_decoder
+    custom = lambda content: {"custom": True}  # noqa: E731
+    assert get_decoder(custom) is custom
+    assert get_decoder(None) is get_decoder("auto")
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_decoder():
+    seen = []
+
+    def decoder(content):
+        seen.append(content)
+        return stdlib_decoder(content)
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=BODY))
+    async with NHLWebClient(decoder=decoder, transport=transport) as client:
+        data = await client.game.get_play_by_play(2023020204)
+    assert seen == [BODY]
+    assert data["plays"][0]["eventId"] == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_body_raises_api_error():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"{"))
+    async with NHLWebClient(transport=transport) as client:
+        with pytest.raises(NHLAPIError, match="Failed to decode JSON"):
+            await client.game.get_play_by_play(2023020204)
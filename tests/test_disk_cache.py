@@ -0,0 +1,64 @@
+import datetime
+
+import httpx
+import pytest
+from nhl_api import NHLWebClient
+from nhl_api.cache import FOREVER, season_is_over
+from nhl_api.disk_cache import DiskCache
+
+
+def test_season_is_over():
+    """Seasons and draft years are final once the summer starts."""
+    today = datetime.date(2024, 3, 1)
+    assert season_is_over(20222023, today)
+    assert not season_is_over(20232024, today)
+    assert season_is_over(2023, today)
+    assert not season_is_over(2024, today)
+
+
+def test_immutability_rules():
+    """Only finished games and past seasons are stored."""
+    cache = DiskCache()
+    boxscore = "/v1/gamecenter/2023020204/boxscore"
+    assert cache.ttl_for(boxscore, {"gameState": "OFF"}) == FOREVER
+    assert cache.ttl_for(boxscore, {"gameState": "LIVE"}) <= 0
+    assert cache.ttl_for("/v1/player/8478402/game-log/20102011/2", {}) == FOREVER
+    assert cache.ttl_for("/v1/draft/picks/2015/all", {}) == FOREVER
+    assert cache.ttl_for("/v1/standings/now", {}) <= 0
+
+
+def test_persists_compressed_bodies(tmp_path):
+    """Entries survive reopening the database and are stored compressed."""
+    path = str(tmp_path / "cache.sqlite3")
+    body = b'{"gameLog": [' + b'{"goals": 1},' * 100 + b'{"goals": 0}]}'
+    cache = DiskCache(path)
+    cache.set("https://example/a", body, FOREVER)
+    cache.set("https://example/b", body, 0)  # not stored
+    cache.close()
+
+    reopened = DiskCache(path)
+    assert reopened.get("https://example/a") == body
+    assert reopened.get("https://example/b") is None
+    stats = reopened.stats()
+    assert stats["size"] == 1 and stats["bytes"] < len(body)
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_client_uses_disk_cache():
+    """Immutable responses are served from disk by later clients."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"gameState": "OFF", "id": 2023020204})
+
+    cache = DiskCache()
+    for _ in range(2):
+        async with NHLWebClient(
+            disk_cache=cache, transport=httpx.MockTransport(handler)
+        ) as client:
+            boxscore = await client.game.get_boxscore(2023020204)
+    assert boxscore["id"] == 2023020204
+    assert len(calls) == 1
+    assert cache.hits == 1
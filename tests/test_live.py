@@ -0,0 +1,102 @@
+import httpx
+import pytest
+from nhl_api import LiveGamePoller, NHLWebClient, ScoreboardEngine
+from nhl_api.config import LIVE_POLL_MAX_IDLE_FACTOR
+from nhl_api.live import PlayDiff, poll_interval
+
+FACEOFF = {"eventId": 1, "sortOrder": 10, "typeDescKey": "faceoff"}
+SHOT = {"eventId": 2, "sortOrder": 20, "typeDescKey": "shot-on-goal"}
+GOAL = {"eventId": 3, "sortOrder": 30, "typeDescKey": "goal", "details": {}}
+GOAL_WITH_ASSIST = {**GOAL, "details": {"assist1PlayerId": 8477934}}
+
+POLLS = [
+    {"gameState": "LIVE", "plays": [FACEOFF]},
+    {"gameState": "LIVE", "plays": [FACEOFF, SHOT, GOAL]},
+    {"gameState": "LIVE", "plays": [FACEOFF, SHOT, GOAL]},  # nothing new
+    {"gameState": "OFF", "plays": [FACEOFF, GOAL_WITH_ASSIST]},  # shot removed
+]
+
+
+def test_poll_interval():
+    """Intervals follow the game state and stop once the game is final."""
+    assert poll_interval("LIVE") == 5.0
+    assert poll_interval("LIVE", period=4) == 3.0
+    assert poll_interval("LIVE", in_intermission=True) == 30.0
+    assert poll_interval("FUT") == 60.0
+    assert poll_interval("FINAL") is None
+
+
+@pytest.mark.asyncio
+async def test_poller_emits_only_changes():
+    """Only new, amended and removed plays are yielded until the game ends."""
+    responses = iter(POLLS)
+
+    def handler(request):
+        return httpx.Response(200, json=next(responses))
+
+    intervals = dict.fromkeys(["FUT", "PRE", "LIVE", "CRIT", "INTERMISSION"], 0)
+    async with NHLWebClient(transport=httpx.MockTransport(handler)) as client:
+        poller = LiveGamePoller(client, 2023020204, intervals=intervals)
+        diffs = [diff async for diff in poller]
+
+    assert [[p["eventId"] for p in d.new] for d in diffs] == [[1], [2, 3], []]
+    assert diffs[2].changed == [GOAL_WITH_ASSIST]
+    assert diffs[2].removed == [2]
+    assert diffs[2].game_state == "OFF"
+    assert poller.last_sort_order == 30
+
+
+def test_idle_backoff_is_capped():
+    """Polls without changes back off up to the cap, however long they last."""
+    poller = LiveGamePoller(None, 2023020204)
+    idle = PlayDiff(2023020204, "LIVE", [], [], [], {"gameState": "LIVE"})
+    intervals = [poller.next_interval(idle) for _ in range(5000)]
+    assert intervals[0] > poll_interval("LIVE")
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == poll_interval("LIVE") * LIVE_POLL_MAX_IDLE_FACTOR
+    active = PlayDiff(2023020204, "LIVE", [FACEOFF], [], [], {"gameState": "LIVE"})
+    assert poller.next_interval(active) == poll_interval("LIVE")
+
+
+def _game(game_id, state, away, home):
+    return {
+        "id": game_id,
+        "gameState": state,
+        "period": 1,
+        "clock": {"running": True, "timeRemaining": "12:00"},
+        "awayTeam": {"score": away},
+        "homeTeam": {"score": home},
+    }
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_fetches_only_changed_games():
+    """One scores poll per tick; play-by-play is fetched for changed games only."""
+    ticks = iter(
+        [
+            {"games": [_game(1, "LIVE", 0, 0), _game(2, "LIVE", 0, 0)]},
+            {"games": [_game(1, "LIVE", 1, 0), _game(2, "LIVE", 0, 0)]},
+            {"games": [_game(1, "OFF", 1, 0), _game(2, "FINAL", 0, 0)]},
+        ]
+    )
+    fetched = []
+
+    def handler(request):
+        if request.url.path == "/v1/score/now":
+            return httpx.Response(200, json=next(ticks))
+        fetched.append(request.url.path)
+        return httpx.Response(200, json={"gameState": "LIVE", "plays": [FACEOFF]})
+
+    intervals = dict.fromkeys(["FUT", "PRE", "LIVE", "CRIT", "INTERMISSION"], 0)
+    async with NHLWebClient(transport=httpx.MockTransport(handler)) as client:
+        engine = ScoreboardEngine(client, intervals=intervals)
+        ticks_seen = [changes async for changes in engine]
+
+    assert [[c.game_id for c in changes] for changes in ticks_seen] == [
+        [1, 2],
+        [1],
+        [1, 2],
+    ]
+    assert fetched.count("/v1/gamecenter/1/play-by-play") == 3
+    assert ticks_seen[0][0].plays.new == [FACEOFF]
+    assert ticks_seen[1][0].plays.new == []
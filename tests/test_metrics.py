@@ -0,0 +1,51 @@
+import httpx
+import pytest
+from nhl_api import MetricsRegistry, NHLWebClient, ResponseCache, RetryPolicy
+from nhl_api.metrics import route_template
+
+
+def test_route_template():
+    assert route_template("/v1/gamecenter/2023020204/boxscore") == (
+        "/v1/gamecenter/{id}/boxscore"
+    )
+    assert route_template("/v1/club-schedule-season/TOR/20232024") == (
+        "/v1/club-schedule-season/{team}/{season}"
+    )
+    assert route_template("/v1/schedule/2024-01-15") == "/v1/schedule/{date}"
+    assert route_template("/stats/rest/en/skater/summary") == (
+        "/stats/rest/en/skater/summary"
+    )
+
+
+@pytest.mark.asyncio
+async def test_registry_records_requests():
+    """Latency, bytes, cache hits and retries are grouped by route template."""
+    statuses = iter([429, 200, 200])
+    events = []
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json={"gameState": "LIVE"})
+
+    registry = MetricsRegistry()
+    async with NHLWebClient(
+        cache=ResponseCache(),
+        retry=RetryPolicy(backoff_base=0, jitter=False),
+        hooks=[registry, events.append],
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        await client.game.get_boxscore(2023020204)
+        await client.game.get_boxscore(2023020204)  # memory cache hit
+        await client.game.get_boxscore(2023020205)
+
+    assert [e.source for e in events] == ["network", "memory", "network"]
+    assert events[0].attempts == 2 and events[0].retry_reasons == ["429"]
+    route = (("route", "/v1/gamecenter/{id}/boxscore"),)
+    snapshot = registry.snapshot()
+    assert snapshot["nhl_api_retries_total"] == {route + (("reason", "429"),): 1}
+    assert snapshot["nhl_api_cache_hits_total"] == {route + (("source", "memory"),): 1}
+    assert snapshot["nhl_api_request_duration_seconds"][route]["count"] == 2
+    assert snapshot["nhl_api_response_bytes_total"][route] > 0
+    text = registry.render()
+    assert "# TYPE nhl_api_request_duration_seconds histogram" in text
+    assert 'le="+Inf"' in text
@@ -0,0 +1,105 @@
+import json
+
+import httpx
+import pytest
+from nhl_api import NHLStatsClient, NHLWebClient, ResponseCache
+from nhl_api.exceptions import NHLAPIError
+
+models = pytest.importorskip("nhl_api.models")
+
+PLAY_BY_PLAY = {
+    "id": 2023020204,
+    "season": 20232024,
+    "gameState": "OFF",
+    "awayTeam": {"id": 6, "abbrev": "BOS", "score": 2},
+    "homeTeam": {"id": 10, "abbrev": "TOR", "score": 3},
+    "plays": [
+        {
+            "eventId": 151,
+            "sortOrder": 12,
+            "typeCode": 505,
+            "typeDescKey": "goal",
+            "periodDescriptor": {"number": 1, "periodType": "REG"},
+            "timeInPeriod": "04:21",
+            "details": {
+                "xCoord": -74,
+                "yCoord": 3.5,
+                "scoringPlayerId": 8477934,
+                "homeSOG": 4,
+                "unknownField": "ignored",
+            },
+        },
+        {"eventId": 152, "typeDescKey": "faceoff"},
+    ],
+    "rosterSpots": [
+        {"teamId": 10, "playerId": 8477934, "firstName": {"default": "Auston"}}
+    ],
+}
+
+
+def test_decode_play_by_play():
+    pbp = models.decode(json.dumps(PLAY_BY_PLAY).encode(), models.PlayByPlay)
+    goal = pbp.plays[0]
+    assert goal.type_desc_key == "goal"
+    assert goal.period_descriptor.number == 1
+    assert (goal.details.x_coord, goal.details.y_coord) == (-74, 3.5)
+    assert goal.details.scoring_player_id == 8477934
+    assert goal.details.home_sog == 4
+    assert pbp.plays[1].details is None
+    assert pbp.roster_spots[0].first_name.default == "Auston"
+    assert not hasattr(goal, "__dict__")  # slotted structs
+    assert models.to_builtins(goal)["details"]["homeSOG"] == 4
+
+
+def test_decode_rejects_mismatched_payload():
+    with pytest.raises(ValueError):
+        models.decode(b'{"plays": []}', models.PlayByPlay)  # missing "id"
+
+
+@pytest.mark.asyncio
+async def test_typed_endpoints_are_cached_separately():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json=PLAY_BY_PLAY)
+
+    cache = ResponseCache()
+    transport = httpx.MockTransport(handler)
+    async with NHLWebClient(cache=cache, transport=transport) as client:
+        typed = await client.game.get_play_by_play_typed(2023020204)
+        plain = await client.game.get_play_by_play(2023020204)
+        assert await client.game.get_play_by_play_typed(2023020204) is typed
+
+    assert isinstance(typed, models.PlayByPlay)
+    assert isinstance(plain, dict)
+    assert len(calls) == 2
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_shift_charts_typed():
+    body = {
+        "data": [
+            {
+                "id": 1,
+                "gameId": 2023020204,
+                "playerId": 8477934,
+                "teamId": 10,
+                "period": 1,
+                "startTime": "00:00",
+                "endTime": "00:45",
+                "duration": "00:45",
+            }
+        ],
+        "total": 1,
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    async with NHLStatsClient(transport=transport) as client:
+        charts = await client.misc.get_shift_charts_typed(2023020204)
+        assert charts.total == 1 and charts.data[0].end_time == "00:45"
+
+    bad = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": 1}))
+    async with NHLStatsClient(transport=bad) as client:
+        with pytest.raises(NHLAPIError):
+            await client.misc.get_shift_charts_typed(2023020204)
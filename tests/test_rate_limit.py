@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from nhl_api import NHLStatsClient, NHLWebClient, RateLimiter
+from nhl_api.rate_limit import TokenBucket
+
+
+def test_bucket_allows_burst_then_refuses():
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_waiters():
+    """Once the burst is spent, acquisitions are spaced by 1 / rate."""
+    bucket = TokenBucket(rate=100.0, capacity=1)
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    assert time.monotonic() - started >= 0.045
+
+
+def test_limiter_buckets_are_per_host():
+    limiter = RateLimiter({"api-web.nhle.com": (10, 1)})
+    assert limiter.bucket_for("API-WEB.NHLE.COM") is limiter.bucket_for(
+        "api-web.nhle.com"
+    )
+    assert limiter.bucket_for("api.nhle.com") is None
+    fallback = RateLimiter({}, default=(1, 1))
+    assert fallback.bucket_for("example.com").rate == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_is_shared_across_clients():
+    """Both facades draw from the one bucket configured for each host."""
+    limiter = RateLimiter({"api-web.nhle.com": (0.01, 5), "api.nhle.com": (0.01, 5)})
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    async with NHLWebClient(
+        rate_limiter=limiter, transport=transport
+    ) as web, NHLStatsClient(rate_limiter=limiter, transport=transport) as stats:
+        await web.teams.get_standings_now()
+        await web.schedule.get_schedule_now()
+        await stats.misc.get_glossary()
+
+    assert 3 <= limiter.bucket_for("api-web.nhle.com").tokens < 3.1
+    assert 4 <= limiter.bucket_for("api.nhle.com").tokens < 4.1
@@ -0,0 +1,107 @@
+import httpx
+import pytest
+from nhl_api import NHLWebClient, RetryPolicy
+from nhl_api.exceptions import NHLNotFoundError, NHLRateLimitError, NHLServerError
+from nhl_api.retry import parse_retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records backoff delays instead of actually sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("nhl_api.http_client.asyncio.sleep", fake_sleep)
+    return delays
+
+
+def _sequence_handler(responses, calls):
+    def handler(request):
+        calls.append(str(request.url))
+        return responses[min(len(calls), len(responses)) - 1]
+
+    return handler
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    jittered = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+    assert all(0 <= jittered.backoff(3) <= 4.0 for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_then_succeeds(sleeps):
+    calls = []
+    responses = [
+        httpx.Response(503),
+        httpx.Response(502),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.1, jitter=False)
+    transport = httpx.MockTransport(_sequence_handler(responses, calls))
+    async with NHLWebClient(retry=policy, transport=transport) as client:
+        assert await client.game.get_boxscore(1) == {"ok": True}
+
+    assert len(calls) == 3
+    assert sleeps == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_respects_retry_after_on_429(sleeps):
+    calls = []
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    policy = RetryPolicy(jitter=False)
+    transport = httpx.MockTransport(_sequence_handler(responses, calls))
+    async with NHLWebClient(retry=policy, transport=transport) as client:
+        assert await client.teams.get_standings_now() == {"ok": True}
+
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_gives_up_when_deadline_or_attempts_exhausted(sleeps):
+    calls = []
+    responses = [httpx.Response(429, headers={"Retry-After": "120"})]
+    transport = httpx.MockTransport(_sequence_handler(responses, calls))
+    async with NHLWebClient(
+        retry=RetryPolicy(deadline=60.0), transport=transport
+    ) as client:
+        with pytest.raises(NHLRateLimitError) as excinfo:
+            await client.teams.get_standings_now()
+    assert excinfo.value.retry_after == 120.0
+    assert len(calls) == 1 and sleeps == []
+
+    calls.clear()
+    responses[0] = httpx.Response(500)
+    async with NHLWebClient(
+        retry=RetryPolicy(max_attempts=4), transport=transport
+    ) as client:
+        with pytest.raises(NHLServerError):
+            await client.teams.get_standings_now()
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors(sleeps):
+    calls = []
+    transport = httpx.MockTransport(
+        _sequence_handler([httpx.Response(404, text="Not Found")], calls)
+    )
+    async with NHLWebClient(retry=RetryPolicy(), transport=transport) as client:
+        with pytest.raises(NHLNotFoundError):
+            await client.players.get_landing(9999999)
+    assert len(calls) == 1
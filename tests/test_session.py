@@ -0,0 +1,31 @@
+import httpx
+import pytest
+from nhl_api import NHLSession, NHLStatsClient, NHLWebClient, ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_clients_share_session():
+    """Both facades send through one pool and route by their base URL."""
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json={"data": []})
+
+    cache = ResponseCache()
+    async with NHLSession(
+        cache=cache, transport=httpx.MockTransport(handler)
+    ) as session:
+        async with NHLWebClient(session=session) as web:
+            await web.teams.get_standings_now()
+        # Closing a facade leaves the shared pool open
+        stats = NHLStatsClient(session=session)
+        await stats.teams.get_info()
+        assert web.http_client._client is stats.http_client._client
+        assert stats.http_client.cache is cache
+
+    assert urls == [
+        "https://api-web.nhle.com/v1/standings/now",
+        "https://api.nhle.com/stats/rest/en/team",
+    ]
+    assert len(cache) == 2
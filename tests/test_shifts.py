@@ -0,0 +1,105 @@
+from nhl_api.analytics import ShiftIndex
+
+SHIFT_CHARTS = {
+    "data": [
+        # first line, 00:00-00:45 of period 1
+        {
+            "playerId": 1,
+            "teamId": 10,
+            "period": 1,
+            "startTime": "00:00",
+            "endTime": "00:45",
+            "typeCode": 517,
+        },
+        {
+            "playerId": 2,
+            "teamId": 20,
+            "period": 1,
+            "startTime": "00:00",
+            "endTime": "00:45",
+            "typeCode": 517,
+        },
+        # line change at 00:45
+        {
+            "playerId": 3,
+            "teamId": 10,
+            "period": 1,
+            "startTime": "00:45",
+            "endTime": "01:30",
+            "typeCode": 517,
+        },
+        {
+            "playerId": 4,
+            "teamId": 20,
+            "period": 1,
+            "startTime": "00:45",
+            "endTime": "02:00",
+            "typeCode": 517,
+        },
+        # goalies, whole period
+        {
+            "playerId": 9,
+            "teamId": 20,
+            "period": 1,
+            "startTime": "00:00",
+            "endTime": "20:00",
+            "typeCode": 517,
+        },
+        # goal row and empty shift are ignored
+        {
+            "playerId": 3,
+            "teamId": 10,
+            "period": 1,
+            "startTime": "01:00",
+            "endTime": "01:00",
+            "typeCode": 505,
+        },
+        {
+            "playerId": 5,
+            "teamId": 10,
+            "period": 2,
+            "startTime": "00:10",
+            "endTime": "00:10",
+            "typeCode": 517,
+        },
+    ]
+}
+
+
+def test_on_ice():
+    index = ShiftIndex.from_shift_charts(SHIFT_CHARTS)
+    assert index.on_ice(-1) == frozenset()
+    assert index.on_ice_at(1, "00:30") == {1, 2, 9}
+    assert index.on_ice_at(1, "00:45") == {3, 4, 9}
+    assert index.on_ice_at(1, "00:45", inclusive_end=True) == {1, 2, 9}
+    assert index.on_ice_at(1, "01:45") == {4, 9}
+    assert index.on_ice_at(2, "00:10") == frozenset()
+    assert index.by_team({1, 2, 9}) == {10: [1], 20: [2, 9]}
+
+
+def test_join_plays():
+    index = ShiftIndex.from_shift_charts(SHIFT_CHARTS)
+    pbp = {
+        "rosterSpots": [{"playerId": 9, "positionCode": "G"}],
+        "plays": [
+            {
+                "eventId": 1,
+                "sortOrder": 1,
+                "typeDescKey": "goal",
+                "periodDescriptor": {"number": 1},
+                "timeInPeriod": "00:45",
+            },
+            {
+                "eventId": 2,
+                "sortOrder": 2,
+                "typeDescKey": "faceoff",
+                "periodDescriptor": {"number": 1},
+                "timeInPeriod": "00:45",
+            },
+        ],
+    }
+    rows = index.join_plays(pbp)
+    assert [row["gameSeconds"] for row in rows] == [45, 45]
+    assert rows[0]["onIce"] == {10: [1], 20: [2, 9]}
+    assert rows[1]["onIce"] == {10: [3], 20: [4, 9]}
+    assert index.join_plays(pbp, skaters_only=True)[1]["onIce"] == {10: [3], 20: [4]}
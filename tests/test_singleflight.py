@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+import pytest
+from nhl_api import NHLWebClient
+from nhl_api.exceptions import NHLServerError
+from nhl_api.singleflight import SingleFlight
+
+
+def _slow_handler(calls, status_code=200):
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code, json={"plays": []})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    """Concurrent callers for the same game share one upstream request."""
+    calls = []
+    async with NHLWebClient(
+        transport=httpx.MockTransport(_slow_handler(calls))
+    ) as client:
+        results = await asyncio.gather(
+            *(client.game.get_play_by_play(2023020204) for _ in range(50))
+        )
+        # Different games are never coalesced together
+        await asyncio.gather(
+            client.game.get_play_by_play(2023020205),
+            client.game.get_play_by_play(2023020206),
+        )
+
+    assert len(calls) == 3
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_key_is_released():
+    """All waiters see the upstream error; a later call starts a new request."""
+    calls = []
+    transport = httpx.MockTransport(_slow_handler(calls, status_code=503))
+    async with NHLWebClient(transport=transport) as client:
+        results = await asyncio.gather(
+            *(client.game.get_boxscore(1) for _ in range(5)), return_exceptions=True
+        )
+        assert all(isinstance(r, NHLServerError) for r in results)
+        assert len(client.http_client._inflight) == 0
+        with pytest.raises(NHLServerError):
+            await client.game.get_boxscore(1)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Cancelling one waiter leaves the shared call running for the others."""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", work))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
@@ -0,0 +1,39 @@
+import httpx
+from nhl_api import NHLStatsClientSync, NHLWebClientSync
+
+
+def test_web_client_sync_reuses_connection():
+    """Blocking calls share one client (and loop) across calls."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"standings": []})
+
+    with NHLWebClientSync(transport=httpx.MockTransport(handler)) as client:
+        assert client.teams.get_standings_now() == {"standings": []}
+        assert client.teams.get_standings_now.__doc__ is not None
+        client.schedule.get_schedule_now()
+        http_client = client.async_client.http_client._client
+        results = client.batch(
+            [lambda g=g: client.async_client.game.get_boxscore(g) for g in (1, 2)]
+        )
+        assert client.async_client.http_client._client is http_client
+
+    assert requests[:2] == ["/v1/standings/now", "/v1/schedule/now"]
+    assert [r.ok for r in results] == [True, True]
+
+
+def test_stats_client_sync_iterates_reports():
+    def handler(request):
+        start = int(request.url.params["start"])
+        rows = [{"playerId": i} for i in range(start, min(start + 10, 25))]
+        return httpx.Response(200, json={"data": rows, "total": 25})
+
+    with NHLStatsClientSync(transport=httpx.MockTransport(handler)) as client:
+        rows = list(
+            client.players.iter_skater_stats(
+                "summary", "seasonId=20232024", page_size=10
+            )
+        )
+    assert [row["playerId"] for row in rows] == list(range(25))
@@ -0,0 +1,103 @@
+import httpx
+import pytest
+from nhl_api import NHLStatsClient, NHLWebClient, ResponseCache, RetryPolicy
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+
+def make_tracer():
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test"), exporter
+
+
+@pytest.mark.asyncio
+async def test_endpoint_and_request_spans():
+    """Endpoint spans wrap request spans tagged with cache source and retries."""
+    statuses = iter([503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"gameState": "OFF"})
+
+    tracer, exporter = make_tracer()
+    async with NHLWebClient(
+        cache=ResponseCache(),
+        retry=RetryPolicy(backoff_base=0, jitter=False),
+        tracer=tracer,
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        await client.game.get_boxscore(2023020204)
+        await client.game.get_boxscore(2023020204)  # memory cache hit
+
+    spans = exporter.get_finished_spans()
+    assert [s.name for s in spans] == [
+        "GET /v1/gamecenter/{id}/boxscore",
+        "Game.get_boxscore",
+    ] * 2
+    request, endpoint = spans[0], spans[1]
+    assert request.parent.span_id == endpoint.context.span_id
+    assert endpoint.attributes["nhl_api.category"] == "Game"
+    assert endpoint.attributes["nhl_api.method"] == "get_boxscore"
+    assert request.attributes["http.route"] == "/v1/gamecenter/{id}/boxscore"
+    assert request.attributes["nhl_api.source"] == "network"
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.attributes["nhl_api.attempts"] == 2
+    assert request.attributes["nhl_api.retry_reasons"] == ("503",)
+    assert spans[2].attributes["nhl_api.source"] == "memory"
+
+
+@pytest.mark.asyncio
+async def test_failed_request_span_has_error_status():
+    def handler(request):
+        return httpx.Response(404, text="not found")
+
+    tracer, exporter = make_tracer()
+    async with NHLStatsClient(
+        tracer=tracer, transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(Exception):
+            await client.teams.get_info()
+
+    request, endpoint = exporter.get_finished_spans()
+    assert endpoint.name == "StatsTeams.get_info"
+    assert request.attributes["http.response.status_code"] == 404
+    assert not request.status.is_ok and not endpoint.status.is_ok
+
+
+@pytest.mark.asyncio
+async def test_paginated_spans_are_named_after_the_endpoint_method():
+    """Every page of a paginated pull is recorded under the public method."""
+
+    def handler(request):
+        start = int(request.url.params["start"])
+        rows = [{"playerId": i} for i in range(start, min(start + 2, 5))]
+        return httpx.Response(200, json={"data": rows, "total": 5})
+
+    tracer, exporter = make_tracer()
+    async with NHLStatsClient(
+        tracer=tracer, transport=httpx.MockTransport(handler)
+    ) as client:
+        rows = [
+            row
+            async for row in client.players.iter_skater_stats(
+                "summary", "seasonId=20232024", page_size=2
+            )
+        ]
+
+    assert len(rows) == 5
+    endpoints = [
+        s for s in exporter.get_finished_spans() if "nhl_api.method" in s.attributes
+    ]
+    assert [s.name for s in endpoints] == ["StatsPlayers.iter_skater_stats"] * 3
+
+
+@pytest.mark.asyncio
+async def test_tracing_disabled_by_default():
+    client = NHLWebClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    assert client.http_client.tracer is None
+    await client.aclose()
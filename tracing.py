@@ -0,0 +1,100 @@
+"""
+Optional OpenTelemetry tracing of endpoint calls and requests.
+
+Requires `opentelemetry-api` (`pip install nhlapi-tools[tracing]`), imported
+only when tracing is enabled. Exporters are configured by the application as
+usual (e.g., with `opentelemetry-sdk`).
+"""
+
+import contextlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from opentelemetry.trace import Span, Tracer
+
+    from .metrics import RequestEvent
+
+TRACER_NAME = "nhl_api"
+
+TracerSpec = t.Union[bool, "Tracer", None]
+
+
+def get_tracer(tracer: TracerSpec) -> t.Optional["Tracer"]:
+    """
+    Resolves a `tracer` argument: None or False disables tracing, True uses
+    the globally configured tracer provider, and a Tracer is used as is.
+    """
+    if tracer is None or tracer is False:
+        return None
+    if tracer is True:
+        from opentelemetry import trace
+
+        return trace.get_tracer(TRACER_NAME)
+    return tracer
+
+
+def endpoint_span(
+    tracer: "Tracer", category: t.Any, method: str
+) -> t.ContextManager["Span"]:
+    """Starts the span of an endpoint method (e.g., "Game.get_boxscore")."""
+    name = type(category).__name__
+    return tracer.start_as_current_span(
+        f"{name}.{method}",
+        attributes={"nhl_api.category": name, "nhl_api.method": method},
+    )
+
+
+def request_span(
+    tracer: "Tracer", event: "RequestEvent", url: str
+) -> t.ContextManager["Span"]:
+    """Starts the client span of an HttpClient.get call."""
+    from opentelemetry.trace import SpanKind
+
+    return tracer.start_as_current_span(
+        f"GET {event.route}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "http.request.method": "GET",
+            "http.route": event.route,
+            "server.address": event.host,
+            "url.full": url,
+        },
+    )
+
+
+def child_span(tracer: t.Optional["Tracer"], name: str) -> t.ContextManager[t.Any]:
+    """Starts a child span (e.g., for rate limiter waits), or does nothing."""
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.start_as_current_span(name)
+
+
+def record_request(span: "Span", event: "RequestEvent") -> None:
+    """Copies the outcome of a request (cache, status, retries) onto its span."""
+    span.set_attribute("nhl_api.source", event.source or "")
+    if event.status is not None:
+        span.set_attribute("http.response.status_code", event.status)
+    span.set_attribute("nhl_api.attempts", event.attempts)
+    if event.retry_reasons:
+        span.set_attribute("nhl_api.retry_reasons", event.retry_reasons)
+    if event.bytes:
+        span.set_attribute("http.response.body.size", event.bytes)
+    if event.decode_seconds:
+        span.set_attribute("nhl_api.decode_seconds", event.decode_seconds)
+
+
+def httpx_trace() -> t.Callable[[str, t.Dict[str, t.Any]], t.Awaitable[None]]:
+    """
+    Returns an httpx `trace` request extension adding connection events
+    (connect_tcp, start_tls, send_request_headers, receive_response_headers,
+    ...) to the current span, which separates DNS/TCP/TLS setup from the
+    time spent waiting for the server.
+    """
+    from opentelemetry.trace import get_current_span
+
+    span = get_current_span()
+
+    async def trace(name: str, info: t.Dict[str, t.Any]) -> None:
+        span.add_event(name)
+
+    return trace
@@ -32,4 +32,23 @@ def format_date(date: t.Union[str, datetime.date]) -> str:
         raise TypeError("Date must be a string or datetime.date object")
 
 
-# Add other helpers as needed, e.g., for building cayenneExp strings for the stats API later.
+def parse_clock(clock: str) -> int:
+    """
+    Converts a game clock string to seconds.
+
+    Args:
+        clock: Time in MM:SS format (e.g., "12:34" as used by timeInPeriod).
+
+    Returns:
+        The number of seconds.
+
+    Raises:
+        ValueError: If the input format is invalid.
+    """
+    minutes, sep, seconds = clock.partition(":")
+    if not sep:
+        raise ValueError("Clock string must be in MM:SS format")
+    return int(minutes) * 60 + int(seconds)
+
+
+# cayenneExp filter expressions for the stats API are built with nhl_api.stats.query.
@@ -3,6 +3,7 @@ Base class for all api-web.nhle.com endpoint categories.
 """
 
 import typing as t
+from ..tracing import endpoint_span
 
 if t.TYPE_CHECKING:
     from ..http_client import HttpClient  # Avoid circular import
@@ -15,7 +16,20 @@ class WebEndpointCategory:
         self._client = client
 
     async def _get(
-        self, path: str, params: t.Optional[t.Dict[str, t.Any]] = None
-    ) -> t.Dict[str, t.Any]:
-        """Helper method to perform a GET request via the client."""
-        return await self._client.get(path, params=params)
+        self,
+        path: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        model: t.Optional[type] = None,
+        span_name: t.Optional[str] = None,
+    ) -> t.Any:
+        """
+        Helper method to perform a GET request via the client.
+        Pass `model` to decode into a typed model instead of a dictionary.
+        With tracing enabled, the call is recorded in a span named after the
+        endpoint method given as `span_name`.
+        """
+        tracer = self._client.tracer
+        if tracer is None or span_name is None:
+            return await self._client.get(path, params=params, model=model)
+        with endpoint_span(tracer, self, span_name):
+            return await self._client.get(path, params=params, model=model)
@@ -23,7 +23,7 @@ class Draft(WebEndpointCategory):
         Returns:
             Dictionary containing current draft rankings.
         """
-        return await self._get("/v1/draft/rankings/now")
+        return await self._get("/v1/draft/rankings/now", span_name="get_rankings_now")
 
     async def get_rankings_by_prospect_category(
         self, season_year: int, prospect_category: int
@@ -41,7 +41,7 @@ class Draft(WebEndpointCategory):
             Dictionary containing draft rankings for the specified category.
         """
         path = f"/v1/draft/rankings/{season_year}/{prospect_category}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_rankings_by_prospect_category")
 
     async def get_tracker_picks_now(self) -> t.Dict[str, t.Any]:
         """
@@ -51,7 +51,9 @@ class Draft(WebEndpointCategory):
         Returns:
             Dictionary containing current draft tracker data.
         """
-        return await self._get("/v1/draft-tracker/picks/now")
+        return await self._get(
+            "/v1/draft-tracker/picks/now", span_name="get_tracker_picks_now"
+        )
 
     async def get_picks_now(self) -> t.Dict[str, t.Any]:
         """
@@ -61,7 +63,7 @@ class Draft(WebEndpointCategory):
         Returns:
             Dictionary containing recent draft pick data.
         """
-        return await self._get("/v1/draft/picks/now")
+        return await self._get("/v1/draft/picks/now", span_name="get_picks_now")
 
     async def get_picks_by_season(
         self, season_year: int, round_number: t.Union[int, str] = "all"
@@ -78,4 +80,4 @@ class Draft(WebEndpointCategory):
             Dictionary containing draft picks for the specified season/round.
         """
         path = f"/v1/draft/picks/{season_year}/{round_number}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_picks_by_season")
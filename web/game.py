@@ -7,6 +7,9 @@ import datetime
 from .base import WebEndpointCategory
 from ..utils import format_date
 
+if t.TYPE_CHECKING:
+    from ..models import Boxscore, PlayByPlay
+
 
 class Game(WebEndpointCategory):
     """Handles endpoints related to game scores, events, boxscores, etc."""
@@ -20,7 +23,7 @@ class Game(WebEndpointCategory):
         Returns:
             Dictionary containing current score data.
         """
-        return await self._get("/v1/score/now")
+        return await self._get("/v1/score/now", span_name="get_scores_now")
 
     async def get_scores_by_date(
         self, date: t.Union[str, datetime.date]
@@ -37,7 +40,7 @@ class Game(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/score/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_scores_by_date")
 
     async def get_scoreboard_now(self) -> t.Dict[str, t.Any]:
         """
@@ -47,7 +50,7 @@ class Game(WebEndpointCategory):
         Returns:
             Dictionary containing current scoreboard data.
         """
-        return await self._get("/v1/scoreboard/now")
+        return await self._get("/v1/scoreboard/now", span_name="get_scoreboard_now")
 
     # === Game Events (Gamecenter) ===
     async def get_play_by_play(self, game_id: int) -> t.Dict[str, t.Any]:
@@ -62,7 +65,28 @@ class Game(WebEndpointCategory):
             Dictionary containing the game's play-by-play data.
         """
         path = f"/v1/gamecenter/{game_id}/play-by-play"
-        return await self._get(path)
+        return await self._get(path, span_name="get_play_by_play")
+
+    async def get_play_by_play_typed(self, game_id: int) -> "PlayByPlay":
+        """
+        Retrieve play-by-play information for a specific game as a typed model.
+        Ref: https://api-web.nhle.com/v1/gamecenter/{game-id}/play-by-play
+
+        Decodes straight from the response bytes into compact msgspec structs
+        (requires `msgspec`), skipping the intermediate dictionaries.
+
+        Args:
+            game_id: The NHL Game ID.
+
+        Returns:
+            A nhl_api.models.PlayByPlay instance.
+        """
+        from ..models import PlayByPlay
+
+        path = f"/v1/gamecenter/{game_id}/play-by-play"
+        return await self._get(
+            path, model=PlayByPlay, span_name="get_play_by_play_typed"
+        )
 
     async def get_landing(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -76,7 +100,7 @@ class Game(WebEndpointCategory):
             Dictionary containing the game's landing page data (summary, rosters, etc.).
         """
         path = f"/v1/gamecenter/{game_id}/landing"
-        return await self._get(path)
+        return await self._get(path, span_name="get_landing")
 
     async def get_boxscore(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -90,7 +114,25 @@ class Game(WebEndpointCategory):
             Dictionary containing the game's boxscore data.
         """
         path = f"/v1/gamecenter/{game_id}/boxscore"
-        return await self._get(path)
+        return await self._get(path, span_name="get_boxscore")
+
+    async def get_boxscore_typed(self, game_id: int) -> "Boxscore":
+        """
+        Retrieve boxscore information for a specific game as a typed model.
+        Ref: https://api-web.nhle.com/v1/gamecenter/{game-id}/boxscore
+
+        Requires `msgspec`; see get_play_by_play_typed.
+
+        Args:
+            game_id: The NHL Game ID.
+
+        Returns:
+            A nhl_api.models.Boxscore instance.
+        """
+        from ..models import Boxscore
+
+        path = f"/v1/gamecenter/{game_id}/boxscore"
+        return await self._get(path, model=Boxscore, span_name="get_boxscore_typed")
 
     async def get_game_story(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -105,7 +147,7 @@ class Game(WebEndpointCategory):
         """
         # Note: Path uses /wsc/ prefix
         path = f"/v1/wsc/game-story/{game_id}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_game_story")
 
     # === Game Replays === (Moved from Misc to Game as they are game-specific)
     async def get_goal_replay(self, game_id: int, event_id: int) -> t.Dict[str, t.Any]:
@@ -121,7 +163,7 @@ class Game(WebEndpointCategory):
             Dictionary containing goal replay details.
         """
         path = f"/v1/ppt-replay/goal/{game_id}/{event_id}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_goal_replay")
 
     async def get_play_replay(self, game_id: int, event_id: int) -> t.Dict[str, t.Any]:
         """
@@ -136,7 +178,7 @@ class Game(WebEndpointCategory):
             Dictionary containing play replay details. Might be similar/identical to goal replay for goals.
         """
         path = f"/v1/ppt-replay/{game_id}/{event_id}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_play_replay")
 
     # === Additional Game Content === (Moved from Misc)
     async def get_game_right_rail(self, game_id: int) -> t.Dict[str, t.Any]:
@@ -151,7 +193,7 @@ class Game(WebEndpointCategory):
             Dictionary containing right rail content modules.
         """
         path = f"/v1/gamecenter/{game_id}/right-rail"
-        return await self._get(path)
+        return await self._get(path, span_name="get_game_right_rail")
 
     async def get_wsc_play_by_play(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -166,4 +208,4 @@ class Game(WebEndpointCategory):
         """
         # Note: Path uses /wsc/ prefix
         path = f"/v1/wsc/play-by-play/{game_id}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_wsc_play_by_play")
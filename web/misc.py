@@ -35,7 +35,7 @@ class Misc(WebEndpointCategory):
             params["teams"] = teams
         if season_states:
             params["seasonStates"] = season_states  # Parameter name from docs
-        return await self._get("/v1/meta", params=params)
+        return await self._get("/v1/meta", params=params, span_name="get_meta_info")
 
     async def get_meta_game_info(self, game_id: int) -> t.Dict[str, t.Any]:
         """
@@ -49,7 +49,7 @@ class Misc(WebEndpointCategory):
             Dictionary containing game-specific metadata.
         """
         path = f"/v1/meta/game/{game_id}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_meta_game_info")
 
     async def get_location(self) -> t.Dict[str, t.Any]:
         """
@@ -59,7 +59,7 @@ class Misc(WebEndpointCategory):
         Returns:
             Dictionary containing location information (e.g., country code).
         """
-        return await self._get("/v1/location")
+        return await self._get("/v1/location", span_name="get_location")
 
     # === Postal Lookup ===
     async def get_postal_code_info(self, postal_code: str) -> t.Dict[str, t.Any]:
@@ -74,6 +74,6 @@ class Misc(WebEndpointCategory):
             Dictionary containing information related to the postal code.
         """
         path = f"/v1/postal-lookup/{postal_code}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_postal_code_info")
 
     # Removed get_openapi_spec as this endpoint does not exist and always returns 404.
@@ -28,7 +28,9 @@ class OtherWeb(WebEndpointCategory):
         params = {}
         if include:
             params["include"] = include
-        return await self._get("/v1/where-to-watch", params=params)
+        return await self._get(
+            "/v1/where-to-watch", params=params, span_name="get_where_to_watch"
+        )
 
     # === Network ===
     async def get_tv_schedule_by_date(
@@ -46,7 +48,7 @@ class OtherWeb(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/network/tv-schedule/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_tv_schedule_by_date")
 
     async def get_tv_schedule_now(self) -> t.Dict[str, t.Any]:
         """
@@ -56,7 +58,9 @@ class OtherWeb(WebEndpointCategory):
         Returns:
             Dictionary containing the current TV schedule.
         """
-        return await self._get("/v1/network/tv-schedule/now")
+        return await self._get(
+            "/v1/network/tv-schedule/now", span_name="get_tv_schedule_now"
+        )
 
     # === Odds ===
     async def get_partner_game_odds_now(self, country_code: str) -> t.Dict[str, t.Any]:
@@ -71,7 +75,7 @@ class OtherWeb(WebEndpointCategory):
             Dictionary containing current partner game odds.
         """
         path = f"/v1/partner-game/{country_code.upper()}/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_partner_game_odds_now")
 
     # === Season ===
     async def get_seasons(self) -> t.List[int]:
@@ -83,7 +87,7 @@ class OtherWeb(WebEndpointCategory):
             A list of integers representing season IDs.
         """
         # Assuming the response is directly a list of integers based on description
-        response = await self._get("/v1/season")
+        response = await self._get("/v1/season", span_name="get_seasons")
         if isinstance(response, list):
             return response
         else:
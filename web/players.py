@@ -26,7 +26,7 @@ class Players(WebEndpointCategory):
             Dictionary containing the player's game log data.
         """
         path = f"/v1/player/{player_id}/game-log/{season}/{game_type}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_game_log")
 
     async def get_landing(self, player_id: int) -> t.Dict[str, t.Any]:
         """
@@ -40,7 +40,7 @@ class Players(WebEndpointCategory):
             Dictionary containing the player's landing page data.
         """
         path = f"/v1/player/{player_id}/landing"
-        return await self._get(path)
+        return await self._get(path, span_name="get_landing")
 
     async def get_game_log_now(self, player_id: int) -> t.Dict[str, t.Any]:
         """
@@ -54,7 +54,7 @@ class Players(WebEndpointCategory):
             Dictionary containing the player's current game log data.
         """
         path = f"/v1/player/{player_id}/game-log/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_game_log_now")
 
     # === Skaters ===
     async def get_skater_stats_leaders_current(
@@ -76,7 +76,11 @@ class Players(WebEndpointCategory):
             params["categories"] = categories
         if limit is not None:
             params["limit"] = limit
-        return await self._get("/v1/skater-stats-leaders/current", params=params)
+        return await self._get(
+            "/v1/skater-stats-leaders/current",
+            params=params,
+            span_name="get_skater_stats_leaders_current",
+        )
 
     async def get_skater_stats_leaders_by_season(
         self,
@@ -104,7 +108,9 @@ class Players(WebEndpointCategory):
         if limit is not None:
             params["limit"] = limit
         path = f"/v1/skater-stats-leaders/{season}/{game_type}"
-        return await self._get(path, params=params)
+        return await self._get(
+            path, params=params, span_name="get_skater_stats_leaders_by_season"
+        )
 
     # === Goalies ===
     async def get_goalie_stats_leaders_current(
@@ -126,7 +132,11 @@ class Players(WebEndpointCategory):
             params["categories"] = categories
         if limit is not None:
             params["limit"] = limit
-        return await self._get("/v1/goalie-stats-leaders/current", params=params)
+        return await self._get(
+            "/v1/goalie-stats-leaders/current",
+            params=params,
+            span_name="get_goalie_stats_leaders_current",
+        )
 
     async def get_goalie_stats_leaders_by_season(
         self,
@@ -154,7 +164,9 @@ class Players(WebEndpointCategory):
         if limit is not None:
             params["limit"] = limit
         path = f"/v1/goalie-stats-leaders/{season}/{game_type}"
-        return await self._get(path, params=params)
+        return await self._get(
+            path, params=params, span_name="get_goalie_stats_leaders_by_season"
+        )
 
     # === Player Spotlight ===
     async def get_player_spotlight(self) -> t.Dict[str, t.Any]:
@@ -165,4 +177,4 @@ class Players(WebEndpointCategory):
         Returns:
             Dictionary containing player spotlight data.
         """
-        return await self._get("/v1/player-spotlight")
+        return await self._get("/v1/player-spotlight", span_name="get_player_spotlight")
@@ -22,7 +22,7 @@ class Playoff(WebEndpointCategory):
             Dictionary containing data for the playoff series carousel.
         """
         path = f"/v1/playoff-series/carousel/{season}/"  # Note trailing slash
-        return await self._get(path)
+        return await self._get(path, span_name="get_series_carousel")
 
     # === Schedule ===
     async def get_series_schedule(
@@ -40,7 +40,7 @@ class Playoff(WebEndpointCategory):
             Dictionary containing the schedule for the specified playoff series.
         """
         path = f"/v1/schedule/playoff-series/{season}/{series_letter.lower()}/"  # Note trailing slash, ensure lowercase
-        return await self._get(path)
+        return await self._get(path, span_name="get_series_schedule")
 
     # === Bracket ===
     async def get_bracket(self, year: int) -> t.Dict[str, t.Any]:
@@ -55,7 +55,7 @@ class Playoff(WebEndpointCategory):
             Dictionary representing the playoff bracket.
         """
         path = f"/v1/playoff-bracket/{year}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_bracket")
 
     # === Metadata (Moved from Misc) ===
     async def get_series_metadata(
@@ -73,4 +73,4 @@ class Playoff(WebEndpointCategory):
             Dictionary containing metadata for the specified playoff series.
         """
         path = f"/v1/meta/playoff-series/{year}/{series_letter.lower()}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_series_metadata")
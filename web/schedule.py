@@ -26,7 +26,7 @@ class Schedule(WebEndpointCategory):
             Dictionary containing the team's current season schedule.
         """
         path = f"/v1/club-schedule-season/{team_tricode.upper()}/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_season_schedule_now")
 
     async def get_team_season_schedule(
         self, team_tricode: str, season: int
@@ -43,7 +43,7 @@ class Schedule(WebEndpointCategory):
             Dictionary containing the team's schedule for the specified season.
         """
         path = f"/v1/club-schedule-season/{team_tricode.upper()}/{season}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_season_schedule")
 
     async def get_team_month_schedule_now(
         self, team_tricode: str
@@ -59,7 +59,7 @@ class Schedule(WebEndpointCategory):
             Dictionary containing the team's schedule for the current month.
         """
         path = f"/v1/club-schedule/{team_tricode.upper()}/month/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_month_schedule_now")
 
     async def get_team_month_schedule(
         self, team_tricode: str, month: str
@@ -77,7 +77,7 @@ class Schedule(WebEndpointCategory):
         """
         # Add validation for YYYY-MM format if desired
         path = f"/v1/club-schedule/{team_tricode.upper()}/month/{month}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_month_schedule")
 
     async def get_team_week_schedule(
         self, team_tricode: str, date: t.Union[str, datetime.date]
@@ -95,7 +95,7 @@ class Schedule(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/club-schedule/{team_tricode.upper()}/week/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_week_schedule")
 
     async def get_team_week_schedule_now(self, team_tricode: str) -> t.Dict[str, t.Any]:
         """
@@ -109,7 +109,7 @@ class Schedule(WebEndpointCategory):
             Dictionary containing the team's schedule for the current week.
         """
         path = f"/v1/club-schedule/{team_tricode.upper()}/week/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_week_schedule_now")
 
     # === League Schedule Information ===
     async def get_schedule_now(self) -> t.Dict[str, t.Any]:
@@ -120,7 +120,7 @@ class Schedule(WebEndpointCategory):
         Returns:
             Dictionary containing the current league schedule.
         """
-        return await self._get("/v1/schedule/now")
+        return await self._get("/v1/schedule/now", span_name="get_schedule_now")
 
     async def get_schedule_by_date(
         self, date: t.Union[str, datetime.date]
@@ -137,7 +137,7 @@ class Schedule(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/schedule/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_schedule_by_date")
 
     # === Schedule Calendar ===
     async def get_schedule_calendar_now(self) -> t.Dict[str, t.Any]:
@@ -148,7 +148,9 @@ class Schedule(WebEndpointCategory):
         Returns:
             Dictionary representing the current schedule calendar.
         """
-        return await self._get("/v1/schedule-calendar/now")
+        return await self._get(
+            "/v1/schedule-calendar/now", span_name="get_schedule_calendar_now"
+        )
 
     async def get_schedule_calendar_by_date(
         self, date: t.Union[str, datetime.date]
@@ -165,4 +167,4 @@ class Schedule(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/schedule-calendar/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_schedule_calendar_by_date")
@@ -20,7 +20,7 @@ class Teams(WebEndpointCategory):
         Returns:
             Dictionary containing current standings data.
         """
-        return await self._get("/v1/standings/now")
+        return await self._get("/v1/standings/now", span_name="get_standings_now")
 
     async def get_standings_by_date(
         self, date: t.Union[str, datetime.date]
@@ -37,7 +37,7 @@ class Teams(WebEndpointCategory):
         """
         formatted_date = format_date(date)
         path = f"/v1/standings/{formatted_date}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_standings_by_date")
 
     async def get_standings_season_info(self) -> t.Dict[str, t.Any]:
         """
@@ -47,7 +47,9 @@ class Teams(WebEndpointCategory):
         Returns:
             Dictionary containing metadata about standings seasons.
         """
-        return await self._get("/v1/standings-season")
+        return await self._get(
+            "/v1/standings-season", span_name="get_standings_season_info"
+        )
 
     # === Stats ===
     async def get_club_stats_now(self, team_tricode: str) -> t.Dict[str, t.Any]:
@@ -62,7 +64,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing the team's current stats.
         """
         path = f"/v1/club-stats/{team_tricode.upper()}/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_club_stats_now")
 
     async def get_club_stats_season_summary(
         self, team_tricode: str
@@ -78,7 +80,7 @@ class Teams(WebEndpointCategory):
             Dictionary summarizing the seasons and game types with stats.
         """
         path = f"/v1/club-stats-season/{team_tricode.upper()}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_club_stats_season_summary")
 
     async def get_club_stats_by_season(
         self, team_tricode: str, season: int, game_type: int
@@ -96,7 +98,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing team stats for the specified season/type.
         """
         path = f"/v1/club-stats/{team_tricode.upper()}/{season}/{game_type}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_club_stats_by_season")
 
     async def get_team_scoreboard_now(self, team_tricode: str) -> t.Dict[str, t.Any]:
         """
@@ -110,7 +112,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing the team's scoreboard data.
         """
         path = f"/v1/scoreboard/{team_tricode.upper()}/now"
-        return await self._get(path)
+        return await self._get(path, span_name="get_team_scoreboard_now")
 
     # === Roster ===
     async def get_roster_now(self, team_tricode: str) -> t.Dict[str, t.Any]:
@@ -125,7 +127,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing the team's current roster.
         """
         path = f"/v1/roster/{team_tricode.upper()}/current"
-        return await self._get(path)
+        return await self._get(path, span_name="get_roster_now")
 
     async def get_roster_by_season(
         self, team_tricode: str, season: int
@@ -142,7 +144,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing the team's roster for the specified season.
         """
         path = f"/v1/roster/{team_tricode.upper()}/{season}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_roster_by_season")
 
     async def get_roster_season_summary(self, team_tricode: str) -> t.Dict[str, t.Any]:
         """
@@ -156,7 +158,7 @@ class Teams(WebEndpointCategory):
             Dictionary containing a list of seasons the team existed.
         """
         path = f"/v1/roster-season/{team_tricode.upper()}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_roster_season_summary")
 
     # === Prospects ===
     async def get_prospects(self, team_tricode: str) -> t.Dict[str, t.Any]:
@@ -171,4 +173,4 @@ class Teams(WebEndpointCategory):
             Dictionary containing the team's prospect data.
         """
         path = f"/v1/prospects/{team_tricode.upper()}"
-        return await self._get(path)
+        return await self._get(path, span_name="get_prospects")